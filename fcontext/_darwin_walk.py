@@ -0,0 +1,213 @@
+"""Bulk directory listing on macOS via getattrlistbulk(2).
+
+One syscall returns the name, type and stat fields of many entries, where
+os.scandir needs a readdir plus an lstat per file to learn the same.
+"""
+from __future__ import annotations
+
+import ctypes
+import os
+import stat
+import struct
+from typing import Any
+
+ATTR_BIT_MAP_COUNT = 5
+ATTR_CMN_NAME = 0x00000001
+ATTR_CMN_DEVID = 0x00000002
+ATTR_CMN_OBJTYPE = 0x00000008
+ATTR_CMN_CRTIME = 0x00000200
+ATTR_CMN_MODTIME = 0x00000400
+ATTR_CMN_CHGTIME = 0x00000800
+ATTR_CMN_ACCTIME = 0x00001000
+ATTR_CMN_OWNERID = 0x00008000
+ATTR_CMN_GRPID = 0x00010000
+ATTR_CMN_ACCESSMASK = 0x00020000
+ATTR_CMN_FLAGS = 0x00040000
+ATTR_CMN_FILEID = 0x02000000
+ATTR_CMN_RETURNED_ATTRS = 0x80000000
+ATTR_FILE_LINKCOUNT = 0x00000001
+ATTR_FILE_ALLOCSIZE = 0x00000004
+ATTR_FILE_IOBLOCKSIZE = 0x00000008
+ATTR_FILE_DATALENGTH = 0x00000200
+
+# fsobj_type_t values
+VREG = 1
+VDIR = 2
+VLNK = 5
+
+_BUF_SIZE = 256 * 1024
+
+# Entry layout: u32 length, attribute_set_t returned, attrreference_t name,
+# then each returned attribute in bit order, common ones before file ones.
+# Attributes are packed on 4-byte boundaries, hence the unaligned "=" formats.
+_HEAD = struct.Struct("=I5I")
+_NAMEREF = struct.Struct("=iI")
+_I32 = struct.Struct("=i")
+_U32 = struct.Struct("=I")
+_I64 = struct.Struct("=q")
+_U64 = struct.Struct("=Q")
+_TIMESPEC = struct.Struct("=qq")
+
+_COMMON_FIELDS = (
+    (ATTR_CMN_DEVID, "dev", _I32),
+    (ATTR_CMN_OBJTYPE, "kind", _U32),
+    (ATTR_CMN_CRTIME, "birthtime", _TIMESPEC),
+    (ATTR_CMN_MODTIME, "mtime", _TIMESPEC),
+    (ATTR_CMN_CHGTIME, "ctime", _TIMESPEC),
+    (ATTR_CMN_ACCTIME, "atime", _TIMESPEC),
+    (ATTR_CMN_OWNERID, "uid", _U32),
+    (ATTR_CMN_GRPID, "gid", _U32),
+    (ATTR_CMN_ACCESSMASK, "mode", _U32),
+    (ATTR_CMN_FLAGS, "flags", _U32),
+    (ATTR_CMN_FILEID, "ino", _U64),
+)
+_FILE_FIELDS = (
+    (ATTR_FILE_LINKCOUNT, "nlink", _U32),
+    (ATTR_FILE_ALLOCSIZE, "allocsize", _I64),
+    (ATTR_FILE_IOBLOCKSIZE, "blksize", _U32),
+    (ATTR_FILE_DATALENGTH, "size", _I64),
+)
+# The fields are distinct bits, so summing them ORs them together
+_COMMON_ATTRS = (ATTR_CMN_RETURNED_ATTRS | ATTR_CMN_NAME
+                 | sum(bit for bit, _, _ in _COMMON_FIELDS))
+_FILE_ATTRS = sum(bit for bit, _, _ in _FILE_FIELDS)
+_STAT_KEYS = frozenset(key for _, key, _ in _COMMON_FIELDS + _FILE_FIELDS)
+
+
+class _AttrList(ctypes.Structure):
+    _fields_ = [
+        ("bitmapcount", ctypes.c_ushort),
+        ("reserved", ctypes.c_uint16),
+        ("commonattr", ctypes.c_uint32),
+        ("volattr", ctypes.c_uint32),
+        ("dirattr", ctypes.c_uint32),
+        ("fileattr", ctypes.c_uint32),
+        ("forkattr", ctypes.c_uint32),
+    ]
+
+
+_getattrlistbulk: Any = None
+
+
+def _load() -> Any:
+    """Resolve getattrlistbulk from libc; OSError where it does not exist."""
+    global _getattrlistbulk
+    if _getattrlistbulk is None:
+        try:
+            fn = ctypes.CDLL(None, use_errno=True).getattrlistbulk
+        except AttributeError:
+            raise OSError("getattrlistbulk is not available") from None
+        fn.argtypes = [ctypes.c_int, ctypes.c_void_p, ctypes.c_void_p,
+                       ctypes.c_size_t, ctypes.c_uint64]
+        fn.restype = ctypes.c_int
+        _getattrlistbulk = fn
+    return _getattrlistbulk
+
+
+def _unpack(buf: bytes, field: int, returned: int, layout: tuple,
+            out: dict[str, Any]) -> int:
+    """Read the attributes of *layout* present in *returned*; next offset."""
+    for bit, key, fmt in layout:
+        if returned & bit:
+            value = fmt.unpack_from(buf, field)
+            out[key] = value if len(value) > 1 else value[0]
+            field += fmt.size
+    return field
+
+
+def _stat_result(f: dict[str, Any]) -> os.stat_result | None:
+    """Build the stat result os.stat would give for a regular file.
+
+    None when the filesystem left out one of the attributes.
+    """
+    if not _STAT_KEYS <= f.keys():
+        return None
+    extra: dict[str, Any] = {
+        "st_blksize": f["blksize"],
+        "st_blocks": f["allocsize"] // 512,
+        "st_flags": f["flags"],
+        "st_rdev": 0,
+    }
+    for key in ("atime", "mtime", "ctime", "birthtime"):
+        sec, nsec = f[key]
+        extra[f"st_{key}"] = sec + nsec * 1e-9  # as CPython computes it
+        extra[f"st_{key}_ns"] = sec * 1_000_000_000 + nsec
+    return os.stat_result(
+        (stat.S_IFREG | (f["mode"] & 0o7777), f["ino"], f["dev"], f["nlink"],
+         f["uid"], f["gid"], f["size"], f["atime"][0], f["mtime"][0], f["ctime"][0]),
+        extra,
+    )
+
+
+def parse_entries(buf: bytes, count: int) -> list[tuple[str, int, os.stat_result | None]]:
+    """Unpack *count* packed entries into (name, objtype, stat) tuples.
+
+    Only regular files get a stat result; other entries carry None, as do
+    files on filesystems that do not return every attribute.
+    """
+    entries = []
+    pos = 0
+    for _ in range(count):
+        length, common, _vol, _dir, fileattr, _fork = _HEAD.unpack_from(buf, pos)
+        field = pos + _HEAD.size
+        name_off, name_len = _NAMEREF.unpack_from(buf, field)
+        start = field + name_off
+        name = buf[start:start + name_len - 1].decode("utf-8", "surrogateescape")
+        f: dict[str, Any] = {}
+        field = _unpack(buf, field + _NAMEREF.size, common, _COMMON_FIELDS, f)
+        _unpack(buf, field, fileattr, _FILE_FIELDS, f)
+        kind = f["kind"]
+        entries.append((name, kind, _stat_result(f) if kind == VREG else None))
+        pos += length
+    return entries
+
+
+def list_dir(path: str) -> list[tuple[str, int, os.stat_result | None]]:
+    """Return (name, objtype, stat) for every entry in *path*."""
+    fn = _load()
+    alist = _AttrList(bitmapcount=ATTR_BIT_MAP_COUNT, commonattr=_COMMON_ATTRS,
+                      fileattr=_FILE_ATTRS)
+    buf = ctypes.create_string_buffer(_BUF_SIZE)
+    entries: list[tuple[str, int, os.stat_result | None]] = []
+    fd = os.open(path, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        while True:
+            count = fn(fd, ctypes.byref(alist), buf, _BUF_SIZE, 0)
+            if count < 0:
+                err = ctypes.get_errno()
+                raise OSError(err, os.strerror(err), path)
+            if count == 0:
+                return entries
+            entries += parse_entries(buf.raw, count)
+    finally:
+        os.close(fd)
+
+
+def scan_dir(path: str, exts: set[str],
+             skip_dirs: set[str]) -> tuple[list[tuple[str, os.stat_result]], list[str]]:
+    """getattrlistbulk counterpart of indexer._scan_dir, same result shape.
+
+    Symlinks are resolved with os.stat so they behave as under scandir, and
+    files the listing gave no stat result for are stat'ed the same way.
+    """
+    files: list[tuple[str, os.stat_result]] = []
+    subdirs: list[str] = []
+    indexable = exts.__contains__
+    for name, kind, st in list_dir(path):
+        if name.startswith("."):
+            continue
+        full = os.path.join(path, name)
+        if kind == VDIR:
+            if name not in skip_dirs:
+                subdirs.append(full)
+        elif indexable(name[name.rfind("."):].lower()):
+            if st is not None:
+                files.append((full, st))
+            elif kind in (VREG, VLNK):
+                try:
+                    st = os.stat(full)
+                except OSError:
+                    continue
+                if stat.S_ISREG(st.st_mode):
+                    files.append((full, st))
+    return files, subdirs
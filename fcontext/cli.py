@@ -1,48 +1,67 @@
 #!/usr/bin/env python3
-"""fcontext CLI — Make any workspace AI-ready.
-
-Usage:
-    fcontext init              Initialize .fcontext/ in current workspace
-    fcontext enable <agent>    Activate an AI agent (copilot/claude/cursor/codex/trae/qwen/kiro/opencode/openclaw/zed/pi/antigravity)
-    fcontext index             Scan & convert binary files to Markdown
-    fcontext status            Show index statistics
-    fcontext clean             Clear all cached files and reset index
-    fcontext reset             Reset all .fcontext/ data (requires confirmation)
-    fcontext export            Export knowledge to zip file or git remote
-    fcontext req               Requirements management (roadmap/epic/req/task/bug)
-    fcontext topic             Manage accumulated knowledge topics
-    fcontext experience        Manage experience packs (import/list/remove)
-"""
+"""fcontext CLI — Make any workspace AI-ready."""
 
 from __future__ import annotations
 
 import argparse
+import importlib
+import os
+import stat
 import sys
+from functools import lru_cache, wraps
 from pathlib import Path
 
-from . import __version__
+# Root .gitignore entries that fcontext may have added (removed on reset)
+_FCONTEXT_GITIGNORE_LINES = frozenset(
+    {".fcontext/_cache/", "__pycache__/", "*.pyc", "*.egg-info/"}
+)
+
+
+_FATAL_NO_WS = "fatal: not an fcontext workspace (run 'fcontext init' first)\n"
+
+
+def _fatal_no_ws() -> int:
+    """Report a missing workspace on stderr and return the error code."""
+    sys.stderr.write(_FATAL_NO_WS)
+    return 1
+
+
+def _require_root():
+    """Decorator: locate the workspace root before running a command.
+
+    The wrapped command is called as ``fn(args, root)``, searching from
+    ``args.dir`` (else ``.``).  A ``Path`` there comes from _resolved_dir and
+    is not resolved again.
+    """
+
+    def decorator(fn):
+        @wraps(fn)
+        def wrapper(args: argparse.Namespace) -> int:
+            where = getattr(args, "dir", ".")
+            root = _find_root(where, resolved=isinstance(where, Path))
+            if root is None:
+                return _fatal_no_ws()
+            return fn(args, root)
+
+        return wrapper
+
+    return decorator
 
 
 def cmd_init(args: argparse.Namespace) -> int:
     """Initialize .fcontext/ in the workspace."""
     from .init import init_workspace
 
-    root = Path(args.dir).resolve()
-    return init_workspace(root, force=args.force)
+    rc = init_workspace(args.dir, force=args.force)
+    _ROOT_CACHE.clear()
+    return rc
 
 
-def cmd_enable(args: argparse.Namespace) -> int:
+@_require_root()
+def cmd_enable(args: argparse.Namespace, root: Path) -> int:
     """Enable an AI agent."""
     from .init import enable_agent, list_agents
 
-    root = _find_root(".")
-    if root is None:
-        print(
-            "fatal: not an fcontext workspace (run 'fcontext init' first)",
-            file=sys.stderr,
-        )
-        return 1
-
     if args.agent == "list":
         return list_agents(root)
 
@@ -53,166 +72,171 @@ def cmd_index(args: argparse.Namespace) -> int:
     """Scan workspace and convert binary files to Markdown."""
     from .indexer import run_index, run_index_dir, run_index_file
 
-    # If a specific target (file or dir) is given
-    target = Path(args.target).resolve() if args.target else None
-    start = str(target.parent if target and target.is_file() else target or args.dir)
-
-    root = _find_root(start)
+    if not args.target:
+        root = _find_root(args.dir, resolved=isinstance(args.dir, Path))
+        if root is None:
+            return _fatal_no_ws()
+        return run_index(root, force=args.force)
+
+    # Resolve and stat the target once; the workspace is searched from it
+    target = Path(os.path.realpath(args.target))
+    try:
+        mode = os.stat(target).st_mode
+    except OSError:
+        mode = 0  # missing target — run_index_file reports it
+    root = _find_root(target.parent if stat.S_ISREG(mode) else target, resolved=True)
     if root is None:
-        print(
-            "fatal: not an fcontext workspace (run 'fcontext init' first)",
-            file=sys.stderr,
-        )
-        return 1
-
-    if target:
-        if target.is_dir():
-            return run_index_dir(root, target, force=args.force)
-        return run_index_file(root, target, force=args.force)
-    return run_index(root, force=args.force)
+        return _fatal_no_ws()
+    if stat.S_ISDIR(mode):
+        return run_index_dir(root, target, force=args.force)
+    return run_index_file(root, target, force=args.force)
 
 
-def cmd_status(args: argparse.Namespace) -> int:
+@_require_root()
+def cmd_status(args: argparse.Namespace, root: Path) -> int:
     """Show index statistics."""
     from .indexer import run_status
 
-    root = _find_root(args.dir)
-    if root is None:
-        print(
-            "fatal: not an fcontext workspace (run 'fcontext init' first)",
-            file=sys.stderr,
-        )
-        return 1
     return run_status(root)
 
 
-def cmd_clean(args: argparse.Namespace) -> int:
+@_require_root()
+def cmd_clean(args: argparse.Namespace, root: Path) -> int:
     """Clear all cached files and reset index."""
     from .indexer import run_clean
 
-    root = _find_root(args.dir)
-    if root is None:
-        print(
-            "fatal: not an fcontext workspace (run 'fcontext init' first)",
-            file=sys.stderr,
-        )
-        return 1
     return run_clean(root)
 
 
-def cmd_reset(args: argparse.Namespace) -> int:
-    """Reset all .fcontext/ data with double confirmation."""
+@_require_root()
+def cmd_reset(args: argparse.Namespace, root: Path) -> int:
+    """Reset all .fcontext/ data after confirmation (skipped with --yes)."""
     import shutil
 
-    root = _find_root(args.dir)
-    if root is None:
-        print(
-            "fatal: not an fcontext workspace (run 'fcontext init' first)",
-            file=sys.stderr,
-        )
-        return 1
-
     ctx = root / ".fcontext"
     print(f"⚠️  This will DELETE all data in {ctx}/")
     print("   Including: _cache, _topics, _requirements, workspace map")
     print()
 
-    confirm1 = input("Are you sure? (yes/no): ").strip().lower()
-    if confirm1 != "yes":
-        print("Aborted.")
-        return 1
-
-    confirm2 = input("Type 'reset' to confirm: ").strip().lower()
-    if confirm2 != "reset":
-        print("Aborted.")
-        return 1
+    if not args.yes:
+        confirm = input("Type 'reset' to permanently delete all .fcontext data: ")
+        if confirm.strip().lower() != "reset":
+            print("Aborted.")
+            return 1
 
     # Remove .fcontext/ entirely
     shutil.rmtree(ctx)
+    _ROOT_CACHE.clear()
     print(f"\n  ✓ removed {ctx}/")
 
     # Also remove agent files
     from .init import AGENT_CONFIGS, get_all_agent_paths
 
-    for agent in AGENT_CONFIGS:
-        for rel_path in get_all_agent_paths(agent):
-            agent_file = root / rel_path
-            if agent_file.exists():
-                agent_file.unlink()
+    # Aliased agents share paths — dedupe, keeping first-seen order
+    agent_paths = dict.fromkeys(
+        rel_path for agent in AGENT_CONFIGS for rel_path in get_all_agent_paths(agent)
+    )
+    # Group by directory so each is listed once; absent agents cost a
+    # single failed scandir instead of one probe per file
+    by_dir: dict[str, list[str]] = {}
+    for rel_path in agent_paths:
+        by_dir.setdefault(os.path.dirname(rel_path), []).append(rel_path)
+    for rel_dir, rel_paths in by_dir.items():
+        try:
+            with os.scandir(root / rel_dir) as it:
+                present = {entry.name for entry in it if entry.is_file()}
+        except OSError:
+            continue
+        for rel_path in rel_paths:
+            if os.path.basename(rel_path) in present:
+                os.unlink(root / rel_path)
                 print(f"  ✓ removed {rel_path}")
 
     # Remove .gitignore entries added by fcontext (if only fcontext content)
     gitignore = root / ".gitignore"
     if gitignore.exists():
-        lines = gitignore.read_text().splitlines()
-        fcontext_lines = {".fcontext/_cache/", "__pycache__/", "*.pyc", "*.egg-info/"}
-        remaining = [l for l in lines if l.strip() not in fcontext_lines]
-        if any(l.strip() for l in remaining):
-            gitignore.write_text("\n".join(remaining) + "\n")
-        else:
+        kept = []
+        changed = has_other = False
+        with gitignore.open() as f:
+            for line in f:
+                line = line.rstrip("\r\n")
+                stripped = line.strip()
+                if stripped in _FCONTEXT_GITIGNORE_LINES:
+                    changed = True
+                    continue
+                kept.append(line)
+                has_other = has_other or bool(stripped)
+        if not has_other:
             gitignore.unlink()
             print("  ✓ removed .gitignore")
+        elif changed:
+            gitignore.write_text("\n".join(kept) + "\n")
 
     print("\n  Reset complete. Run 'fcontext init' to start fresh.")
     return 0
 
 
-# ── experience subcommands ────────────────────────────────────────────────────
+# ── sub-action dispatch ───────────────────────────────────────────────────────
+#
+# Tables map action → (handler name, kwargs builder).  Handlers live in a
+# lazily imported module and are called as handler(root, **kwargs).
 
 
-def cmd_experience(args: argparse.Namespace) -> int:
-    """Dispatch experience subcommands."""
-    from .experience import (
-        import_experience,
-        list_experiences,
-        remove_experience,
-        update_experience,
-    )
+def _no_kwargs(args: argparse.Namespace) -> dict:
+    return {}
 
-    root = _find_root(args.dir if hasattr(args, "dir") else ".")
-    if root is None:
-        print(
-            "fatal: not an fcontext workspace (run 'fcontext init' first)",
-            file=sys.stderr,
-        )
-        return 1
 
-    action = args.exp_action
-
-    if action == "list":
-        return list_experiences(root)
-    elif action == "import":
-        return import_experience(
-            root,
-            source=args.source,
-            name=args.name,
-            force=args.force,
-            branch=getattr(args, "branch", None),
-        )
-    elif action == "remove":
-        return remove_experience(root, name=args.name)
-    elif action == "update":
-        return update_experience(root, name=getattr(args, "name", None))
-    else:
-        print(f"unknown experience action: {action}", file=sys.stderr)
+def _dispatch(
+    module: str,
+    table: dict,
+    kind: str,
+    action: str,
+    args: argparse.Namespace,
+    root: Path,
+) -> int:
+    """Run the handler registered for *action* in *table*."""
+    if action not in table:
+        print(f"unknown {kind} action: {action}", file=sys.stderr)
         return 1
+    name, build_kwargs = table[action]
+    handler = getattr(importlib.import_module(module, __package__), name)
+    return handler(root, **build_kwargs(args))
+
+
+# ── experience subcommands ────────────────────────────────────────────────────
+
+_EXP_DISPATCH = {
+    "list": ("list_experiences", _no_kwargs),
+    "import": (
+        "import_experience",
+        lambda a: dict(
+            source=a.source,
+            name=a.name,
+            force=a.force,
+            branch=getattr(a, "branch", None),
+        ),
+    ),
+    "remove": ("remove_experience", lambda a: dict(name=a.name)),
+    "update": ("update_experience", lambda a: dict(name=getattr(a, "name", None))),
+}
+
+
+@_require_root()
+def cmd_experience(args: argparse.Namespace, root: Path) -> int:
+    """Dispatch experience subcommands."""
+    return _dispatch(
+        ".experience", _EXP_DISPATCH, "experience", args.exp_action, args, root
+    )
 
 
 # ── export command ────────────────────────────────────────────────────────────
 
 
-def cmd_export(args: argparse.Namespace) -> int:
+@_require_root()
+def cmd_export(args: argparse.Namespace, root: Path) -> int:
     """Export knowledge to zip file or git remote."""
     from .experience import export_experience
 
-    root = _find_root(args.dir if hasattr(args, "dir") else ".")
-    if root is None:
-        print(
-            "fatal: not an fcontext workspace (run 'fcontext init' first)",
-            file=sys.stderr,
-        )
-        return 1
-
     return export_experience(
         root,
         output=args.output,
@@ -224,127 +248,324 @@ def cmd_export(args: argparse.Namespace) -> int:
 
 # ── topic subcommands ─────────────────────────────────────────────────────────
 
+_TOPIC_DISPATCH = {
+    "list": ("topic_list", _no_kwargs),
+    "show": ("topic_show", lambda a: dict(name=a.name)),
+    "clean": ("topic_clean", _no_kwargs),
+}
 
-def cmd_topic(args: argparse.Namespace) -> int:
-    """Dispatch topic subcommands."""
-    from .topics import topic_clean, topic_list, topic_show
 
-    root = _find_root(args.dir if hasattr(args, "dir") else ".")
-    if root is None:
-        print(
-            "fatal: not an fcontext workspace (run 'fcontext init' first)",
-            file=sys.stderr,
-        )
-        return 1
-
-    action = args.topic_action
-
-    if action == "list":
-        return topic_list(root)
-    elif action == "show":
-        return topic_show(root, name=args.name)
-    elif action == "clean":
-        return topic_clean(root)
-    else:
-        print(f"unknown topic action: {action}", file=sys.stderr)
-        return 1
+@_require_root()
+def cmd_topic(args: argparse.Namespace, root: Path) -> int:
+    """Dispatch topic subcommands."""
+    return _dispatch(".topics", _TOPIC_DISPATCH, "topic", args.topic_action, args, root)
 
 
 # ── req subcommands ───────────────────────────────────────────────────────────
 
-
-def cmd_req(args: argparse.Namespace) -> int:
+_REQ_DISPATCH = {
+    "add": (
+        "req_add",
+        lambda a: dict(
+            item_type=a.type,
+            title=a.title,
+            priority=a.priority,
+            parent=a.parent,
+            assignee=a.assignee,
+            tags=a.tags,
+            author=a.author,
+            source=a.source,
+            links=a.link,
+        ),
+    ),
+    "list": (
+        "req_list",
+        lambda a: dict(
+            filter_type=a.type, filter_status=a.status, filter_parent=a.parent
+        ),
+    ),
+    "show": ("req_show", lambda a: dict(item_id=a.id)),
+    "set": (
+        "req_set",
+        lambda a: dict(item_id=a.id, field=a.field, value=a.value),
+    ),
+    "board": ("req_board_and_backlog", _no_kwargs),
+    "tree": ("req_tree", _no_kwargs),
+    "comment": ("req_comment", lambda a: dict(item_id=a.id, comment_text=a.message)),
+    "link": (
+        "req_link",
+        lambda a: dict(item_id=a.id, link_type=a.type, target_id=a.target),
+    ),
+    "trace": ("req_trace", lambda a: dict(item_id=a.id)),
+    "batch": ("req_batch_file", lambda a: dict(path=a.file)),
+}
+
+
+@_require_root()
+def cmd_req(args: argparse.Namespace, root: Path) -> int:
     """Dispatch requirement subcommands."""
-    from .requirements import (
-        req_add,
-        req_backlog_md,
-        req_board,
-        req_comment,
-        req_link,
-        req_list,
-        req_set,
-        req_show,
-        req_trace,
-        req_tree,
-    )
-
-    root = _find_root(args.dir if hasattr(args, "dir") else ".")
-    if root is None:
-        print(
-            "fatal: not an fcontext workspace (run 'fcontext init' first)",
-            file=sys.stderr,
-        )
-        return 1
-
-    action = args.req_action
-
-    if action == "add":
-        return req_add(
-            root,
-            item_type=args.type,
-            title=args.title,
-            priority=args.priority,
-            parent=args.parent,
-            assignee=args.assignee,
-            tags=args.tags,
-            author=args.author,
-            source=args.source,
-            links=args.link,
-        )
-    elif action == "list":
-        return req_list(
-            root,
-            filter_type=args.type,
-            filter_status=args.status,
-            filter_parent=args.parent,
-        )
-    elif action == "show":
-        return req_show(root, item_id=args.id)
-    elif action == "set":
-        return req_set(root, item_id=args.id, field=args.field, value=args.value)
-    elif action == "board":
-        rc = req_board(root)
-        req_backlog_md(root)  # also generate _backlog.md
-        return rc
-    elif action == "tree":
-        return req_tree(root)
-    elif action == "comment":
-        return req_comment(root, item_id=args.id, comment_text=args.message)
-    elif action == "link":
-        return req_link(
-            root, item_id=args.id, link_type=args.type, target_id=args.target
-        )
-    elif action == "trace":
-        return req_trace(root, item_id=args.id)
+    return _dispatch(".requirements", _REQ_DISPATCH, "req", args.req_action, args, root)
+
+
+# Workspace roots found by _find_root, keyed by resolved start path.  Misses
+# are not stored, so a workspace created later in the process is found.
+_ROOT_CACHE: dict[str, str] = {}
+_ROOT_CACHE_SIZE = 32
+
+
+def _find_root_cached(start_abs: str) -> str | None:
+    """Memoized walk for _find_root, keyed by resolved absolute path."""
+    hit = _ROOT_CACHE.get(start_abs)
+    if hit is not None and os.path.isdir(os.path.join(hit, ".fcontext")):
+        return hit
+    current = start_abs
+    while True:
+        if os.path.isdir(os.path.join(current, ".fcontext")):
+            break
+        parent = os.path.dirname(current)
+        if parent == current:
+            _ROOT_CACHE.pop(start_abs, None)
+            return None
+        current = parent
+    if len(_ROOT_CACHE) >= _ROOT_CACHE_SIZE:
+        _ROOT_CACHE.clear()
+    _ROOT_CACHE[start_abs] = current
+    return current
+
+
+def _find_root(start: str | Path, resolved: bool = False) -> Path | None:
+    """Walk up to find a directory containing .fcontext/.
+
+    *start* is passed through os.path.realpath unless *resolved* says it
+    already was (a parsed ``dir``, see _resolved_dir).
+    """
+    start_abs = os.fspath(start) if resolved else os.path.realpath(os.fspath(start))
+    found = _find_root_cached(start_abs)
+    return Path(found) if found else None
+
+
+def _resolved_dir(value: str) -> Path:
+    """argparse type for workspace dirs: resolve once, at parse time."""
+    return Path(os.path.realpath(value))
+
+
+# ── parser builders ───────────────────────────────────────────────────────────
+
+# Mirrors of requirements.ITEM_TYPES / PRIORITY_LEVELS / LINK_TYPES, kept here
+# so building the parser doesn't import the requirements module.
+_ITEM_TYPES = ("roadmap", "epic", "requirement", "story", "task", "bug")
+_PRIORITY_LEVELS = ("P0", "P1", "P2", "P3")
+_LINK_TYPES = ("supersedes", "evolves", "relates", "blocks")
+
+# Sub-action tables: (action, help, ((names, add_argument kwargs), ...)).
+# Option names are "/"-separated, e.g. "-t/--type".
+
+_TOPIC_ACTIONS = (
+    ("list", "List all topics", ()),
+    (
+        "show",
+        "Show a topic's content",
+        (("name", {"help": "Topic name (or partial match)"}),),
+    ),
+    ("clean", "Remove empty topic files", ()),
+)
+
+_EXP_ACTIONS = (
+    ("list", "List imported experience packs", ()),
+    (
+        "import",
+        "Import experience pack from zip or git URL",
+        (
+            ("source", {"help": "Path to zip file or git URL (https/ssh)"}),
+            (
+                "--name",
+                {
+                    "default": None,
+                    "help": "Name for the experience (default: derived from source)",
+                },
+            ),
+            (
+                "--branch/-b",
+                {
+                    "default": None,
+                    "help": "Git branch or tag to clone (default: default branch)",
+                },
+            ),
+            (
+                "-f/--force",
+                {"action": "store_true", "help": "Overwrite existing experience"},
+            ),
+        ),
+    ),
+    (
+        "remove",
+        "Remove an imported experience pack",
+        (("name", {"help": "Name of the experience to remove"}),),
+    ),
+    (
+        "update",
+        "Update experience packs from their original source (git/url)",
+        (
+            (
+                "name",
+                {
+                    "nargs": "?",
+                    "default": None,
+                    "help": "Name of specific experience to update (default: all)",
+                },
+            ),
+        ),
+    ),
+)
+
+_REQ_ACTIONS = (
+    (
+        "add",
+        "Add a new item",
+        (
+            ("title", {"help": "Title of the item"}),
+            (
+                "-t/--type",
+                {
+                    "default": "requirement",
+                    "choices": _ITEM_TYPES,
+                    "help": "Item type (default: requirement)",
+                },
+            ),
+            (
+                "-p/--priority",
+                {
+                    "default": "P2",
+                    "choices": _PRIORITY_LEVELS,
+                    "help": "Priority (default: P2)",
+                },
+            ),
+            ("--parent", {"default": "", "help": "Parent item ID (e.g. EPIC-001)"}),
+            ("--assignee", {"default": "", "help": "Assignee name"}),
+            ("--tags", {"default": "", "help": "Comma-separated tags"}),
+            ("--author", {"default": "", "help": "Who proposed this requirement"}),
+            (
+                "--source",
+                {
+                    "default": "",
+                    "help": "Source file path (e.g. meeting-notes/2026-02-10.md)",
+                },
+            ),
+            (
+                "--link",
+                {
+                    "default": "",
+                    "help": "Links to other items (e.g. supersedes:REQ-001,evolves:REQ-002)",
+                },
+            ),
+        ),
+    ),
+    (
+        "list",
+        "List items",
+        (
+            (
+                "-t/--type",
+                {
+                    "default": None,
+                    "choices": _ITEM_TYPES,
+                    "help": "Filter by type",
+                },
+            ),
+            ("-s/--status", {"default": None, "help": "Filter by status"}),
+            ("--parent", {"default": None, "help": "Filter by parent ID"}),
+        ),
+    ),
+    ("show", "Show item details", (("id", {"help": "Item ID (e.g. REQ-001)"}),)),
+    (
+        "set",
+        "Update an item field",
+        (
+            ("id", {"help": "Item ID"}),
+            (
+                "field",
+                {
+                    "help": "Field to update (status/priority/title/parent/assignee/tags)"
+                },
+            ),
+            ("value", {"help": "New value"}),
+        ),
+    ),
+    ("board", "Kanban board view by status", ()),
+    ("tree", "Hierarchy tree view", ()),
+    (
+        "comment",
+        "Add a comment to an item",
+        (("id", {"help": "Item ID"}), ("message", {"help": "Comment text"})),
+    ),
+    (
+        "link",
+        "Add a typed link between items",
+        (
+            ("id", {"help": "Source item ID"}),
+            (
+                "type",
+                {
+                    "choices": _LINK_TYPES,
+                    "help": "Link type",
+                },
+            ),
+            ("target", {"help": "Target item ID"}),
+        ),
+    ),
+    (
+        "trace",
+        "Trace evolution chain of an item",
+        (("id", {"help": "Item ID to trace"}),),
+    ),
+    (
+        "batch",
+        "Run add/set/link/comment operations from a JSON file with one save",
+        (
+            (
+                "file",
+                {
+                    "help": "JSON array of operations, e.g. "
+                    '[{"action": "add", "item_type": "task", "title": "..."}]'
+                    ", or '-' for stdin"
+                },
+            ),
+        ),
+    ),
+)
+
+
+def _add_actions(sub, actions: tuple) -> None:
+    """Register sub-action parsers from an action table."""
+    for name, help_text, arguments in actions:
+        p = sub.add_parser(name, help=help_text)
+        for names, kwargs in arguments:
+            p.add_argument(*names.split("/"), **kwargs)
+
+
+@lru_cache(maxsize=None)
+def _dir_parent(positional: bool) -> argparse.ArgumentParser:
+    """Parent parser declaring the workspace dir (``dir`` or ``--dir/-d``)."""
+    parent = argparse.ArgumentParser(add_help=False)
+    if positional:
+        names, extra = ("dir",), {"nargs": "?"}
     else:
-        print(f"unknown req action: {action}", file=sys.stderr)
-        return 1
-
-
-def _find_root(start: str) -> Path | None:
-    """Walk up to find a directory containing .fcontext/."""
-    current = Path(start).resolve()
-    for parent in [current, *current.parents]:
-        if (parent / ".fcontext").is_dir():
-            return parent
-    return None
-
-
-def main(argv: list[str] | None = None) -> int:
-    parser = argparse.ArgumentParser(
-        prog="fcontext",
-        description="Make any workspace AI-ready. Like 'git init', but for AI context.",
-    )
-    parser.add_argument(
-        "--version", action="version", version=f"fcontext {__version__}"
+        names, extra = ("--dir", "-d"), {}
+    parent.add_argument(
+        *names,
+        default=".",
+        type=_resolved_dir,
+        help="Workspace root (default: .)",
+        **extra,
     )
+    return parent
 
-    sub = parser.add_subparsers(dest="command")
 
-    # --- init ---
-    p_init = sub.add_parser("init", help="Initialize .fcontext/ in workspace")
-    p_init.add_argument(
-        "dir", nargs="?", default=".", help="Workspace root (default: .)"
+def _build_init_parser(sub) -> argparse.ArgumentParser:
+    p_init = sub.add_parser(
+        "init",
+        help="Initialize .fcontext/ in workspace",
+        parents=[_dir_parent(positional=True)],
     )
     p_init.add_argument(
         "-f",
@@ -353,8 +574,10 @@ def main(argv: list[str] | None = None) -> int:
         help="Overwrite existing instruction files",
     )
     p_init.set_defaults(func=cmd_init)
+    return p_init
 
-    # --- enable ---
+
+def _build_enable_parser(sub) -> argparse.ArgumentParser:
     p_enable = sub.add_parser(
         "enable",
         help="Activate an AI agent (copilot/claude/cursor/codex/trae/qwen/kiro/opencode/openclaw/zed/pi/antigravity)",
@@ -367,70 +590,81 @@ def main(argv: list[str] | None = None) -> int:
         "-f", "--force", action="store_true", help="Overwrite existing agent config"
     )
     p_enable.set_defaults(func=cmd_enable)
+    return p_enable
+
 
-    # --- index ---
-    p_index = sub.add_parser("index", help="Scan & convert binary files to Markdown")
+def _build_index_parser(sub) -> argparse.ArgumentParser:
+    p_index = sub.add_parser(
+        "index",
+        help="Scan & convert binary files to Markdown",
+        parents=[_dir_parent(positional=False)],
+    )
     p_index.add_argument(
         "target",
         nargs="?",
         default=None,
         help="File or directory to convert (or omit to scan entire workspace)",
     )
-    p_index.add_argument("--dir", "-d", default=".", help="Workspace root (default: .)")
     p_index.add_argument(
         "-f", "--force", action="store_true", help="Re-convert even if up-to-date"
     )
     p_index.set_defaults(func=cmd_index)
+    return p_index
+
 
-    # --- status ---
-    p_status = sub.add_parser("status", help="Show index statistics")
-    p_status.add_argument(
-        "dir", nargs="?", default=".", help="Workspace root (default: .)"
+def _build_status_parser(sub) -> argparse.ArgumentParser:
+    p_status = sub.add_parser(
+        "status",
+        help="Show index statistics",
+        parents=[_dir_parent(positional=True)],
     )
     p_status.set_defaults(func=cmd_status)
+    return p_status
+
 
-    # --- clean ---
-    p_clean = sub.add_parser("clean", help="Clear all cached files and reset index")
-    p_clean.add_argument(
-        "dir", nargs="?", default=".", help="Workspace root (default: .)"
+def _build_clean_parser(sub) -> argparse.ArgumentParser:
+    p_clean = sub.add_parser(
+        "clean",
+        help="Clear all cached files and reset index",
+        parents=[_dir_parent(positional=True)],
     )
     p_clean.set_defaults(func=cmd_clean)
+    return p_clean
 
-    # --- reset ---
+
+def _build_reset_parser(sub) -> argparse.ArgumentParser:
     p_reset = sub.add_parser(
-        "reset", help="Reset all .fcontext/ data (requires confirmation)"
+        "reset",
+        help="Reset all .fcontext/ data (requires confirmation)",
+        parents=[_dir_parent(positional=True)],
     )
     p_reset.add_argument(
-        "dir", nargs="?", default=".", help="Workspace root (default: .)"
+        "-y", "--yes", action="store_true", help="Skip the confirmation prompt"
     )
     p_reset.set_defaults(func=cmd_reset)
+    return p_reset
 
-    # --- topic (knowledge management) ---
-    p_topic = sub.add_parser("topic", help="Manage accumulated knowledge topics")
-    p_topic.add_argument("--dir", "-d", default=".", help="Workspace root (default: .)")
-    topic_sub = p_topic.add_subparsers(dest="topic_action")
-    p_topic.set_defaults(func=cmd_topic)
 
-    # topic list
-    topic_sub.add_parser("list", help="List all topics")
-
-    # topic show
-    p_topic_show = topic_sub.add_parser("show", help="Show a topic's content")
-    p_topic_show.add_argument("name", help="Topic name (or partial match)")
+def _build_topic_parser(sub) -> argparse.ArgumentParser:
+    p_topic = sub.add_parser(
+        "topic",
+        help="Manage accumulated knowledge topics",
+        parents=[_dir_parent(positional=False)],
+    )
+    p_topic.set_defaults(func=cmd_topic)
+    _add_actions(p_topic.add_subparsers(dest="topic_action"), _TOPIC_ACTIONS)
+    return p_topic
 
-    # topic clean
-    topic_sub.add_parser("clean", help="Remove empty topic files")
 
-    # --- export (knowledge export) ---
+def _build_export_parser(sub) -> argparse.ArgumentParser:
     p_export = sub.add_parser(
-        "export", help="Export knowledge to zip file or git remote"
+        "export",
+        help="Export knowledge to zip file or git remote",
+        parents=[_dir_parent(positional=False)],
     )
     p_export.add_argument(
         "output", help="Output path (file/directory) or git URL (https/ssh)"
     )
-    p_export.add_argument(
-        "--dir", "-d", default=".", help="Workspace root (default: .)"
-    )
     p_export.add_argument(
         "--name", default=None, help="Pack name (default: project directory name)"
     )
@@ -439,163 +673,129 @@ def main(argv: list[str] | None = None) -> int:
     )
     p_export.add_argument("--message", "-m", default=None, help="Git commit message")
     p_export.set_defaults(func=cmd_export)
+    return p_export
+
 
-    # --- experience (experience packs) ---
-    p_exp = sub.add_parser("experience", help="Manage experience packs")
-    p_exp.add_argument("--dir", "-d", default=".", help="Workspace root (default: .)")
-    exp_sub = p_exp.add_subparsers(dest="exp_action")
+def _build_experience_parser(sub) -> argparse.ArgumentParser:
+    p_exp = sub.add_parser(
+        "experience",
+        help="Manage experience packs",
+        parents=[_dir_parent(positional=False)],
+    )
     p_exp.set_defaults(func=cmd_experience)
+    _add_actions(p_exp.add_subparsers(dest="exp_action"), _EXP_ACTIONS)
+    return p_exp
 
-    # experience list
-    exp_sub.add_parser("list", help="List imported experience packs")
 
-    # experience import
-    p_exp_import = exp_sub.add_parser(
-        "import", help="Import experience pack from zip or git URL"
-    )
-    p_exp_import.add_argument("source", help="Path to zip file or git URL (https/ssh)")
-    p_exp_import.add_argument(
-        "--name",
-        default=None,
-        help="Name for the experience (default: derived from source)",
-    )
-    p_exp_import.add_argument(
-        "--branch",
-        "-b",
-        default=None,
-        help="Git branch or tag to clone (default: default branch)",
-    )
-    p_exp_import.add_argument(
-        "-f", "--force", action="store_true", help="Overwrite existing experience"
+def _build_req_parser(sub) -> argparse.ArgumentParser:
+    p_req = sub.add_parser(
+        "req",
+        help="Requirements management",
+        parents=[_dir_parent(positional=False)],
     )
+    p_req.set_defaults(func=cmd_req)
+    _add_actions(p_req.add_subparsers(dest="req_action"), _REQ_ACTIONS)
+    return p_req
+
+
+# Command name → parser builder, in help-listing order.
+_PARSER_BUILDERS = {
+    "init": _build_init_parser,
+    "enable": _build_enable_parser,
+    "index": _build_index_parser,
+    "status": _build_status_parser,
+    "clean": _build_clean_parser,
+    "reset": _build_reset_parser,
+    "topic": _build_topic_parser,
+    "export": _build_export_parser,
+    "experience": _build_experience_parser,
+    "req": _build_req_parser,
+}
+
+
+class _VersionAction(argparse.Action):
+    """``--version`` that only reads and formats the version when invoked."""
+
+    def __init__(self, option_strings, dest=argparse.SUPPRESS, **kwargs):
+        kwargs.setdefault("help", "show program's version number and exit")
+        super().__init__(
+            option_strings, dest, nargs=0, default=argparse.SUPPRESS, **kwargs
+        )
 
-    # experience remove
-    p_exp_remove = exp_sub.add_parser(
-        "remove", help="Remove an imported experience pack"
-    )
-    p_exp_remove.add_argument("name", help="Name of the experience to remove")
+    def __call__(self, parser, namespace, values, option_string=None):
+        from . import __version__
 
-    # experience update
-    p_exp_update = exp_sub.add_parser(
-        "update", help="Update experience packs from their original source (git/url)"
-    )
-    p_exp_update.add_argument(
-        "name",
-        nargs="?",
-        default=None,
-        help="Name of specific experience to update (default: all)",
-    )
+        print(f"fcontext {__version__}")
+        parser.exit()
 
-    # --- req (requirements management) ---
-    p_req = sub.add_parser("req", help="Requirements management")
-    p_req.add_argument("--dir", "-d", default=".", help="Workspace root (default: .)")
-    req_sub = p_req.add_subparsers(dest="req_action")
-    p_req.set_defaults(func=cmd_req)
 
-    # req add
-    p_req_add = req_sub.add_parser("add", help="Add a new item")
-    p_req_add.add_argument("title", help="Title of the item")
-    p_req_add.add_argument(
-        "-t",
-        "--type",
-        default="requirement",
-        choices=("roadmap", "epic", "requirement", "story", "task", "bug"),
-        help="Item type (default: requirement)",
-    )
-    p_req_add.add_argument(
-        "-p",
-        "--priority",
-        default="P2",
-        choices=("P0", "P1", "P2", "P3"),
-        help="Priority (default: P2)",
-    )
-    p_req_add.add_argument(
-        "--parent", default="", help="Parent item ID (e.g. EPIC-001)"
-    )
-    p_req_add.add_argument("--assignee", default="", help="Assignee name")
-    p_req_add.add_argument("--tags", default="", help="Comma-separated tags")
-    p_req_add.add_argument("--author", default="", help="Who proposed this requirement")
-    p_req_add.add_argument(
-        "--source",
-        default="",
-        help="Source file path (e.g. meeting-notes/2026-02-10.md)",
-    )
-    p_req_add.add_argument(
-        "--link",
-        default="",
-        help="Links to other items (e.g. supersedes:REQ-001,evolves:REQ-002)",
-    )
+def _sniff_command(argv: list[str]) -> str | None:
+    """Return the subcommand named in argv, or None if absent/unknown.
 
-    # req list
-    p_req_list = req_sub.add_parser("list", help="List items")
-    p_req_list.add_argument(
-        "-t",
-        "--type",
-        default=None,
-        choices=("roadmap", "epic", "requirement", "story", "task", "bug"),
-        help="Filter by type",
-    )
-    p_req_list.add_argument("-s", "--status", default=None, help="Filter by status")
-    p_req_list.add_argument("--parent", default=None, help="Filter by parent ID")
-
-    # req show
-    p_req_show = req_sub.add_parser("show", help="Show item details")
-    p_req_show.add_argument("id", help="Item ID (e.g. REQ-001)")
-
-    # req set
-    p_req_set = req_sub.add_parser("set", help="Update an item field")
-    p_req_set.add_argument("id", help="Item ID")
-    p_req_set.add_argument(
-        "field", help="Field to update (status/priority/title/parent/assignee/tags)"
-    )
-    p_req_set.add_argument("value", help="New value")
+    Top-level options take no values, so the first non-flag token is the
+    subcommand.
+    """
+    for token in argv:
+        if not token.startswith("-"):
+            return token if token in _PARSER_BUILDERS else None
+    return None
 
-    # req board
-    req_sub.add_parser("board", help="Kanban board view by status")
 
-    # req tree
-    req_sub.add_parser("tree", help="Hierarchy tree view")
+_USAGE = """\
+usage: fcontext [-h] [--version] <command> [<args>]
 
-    # req comment
-    p_req_comment = req_sub.add_parser("comment", help="Add a comment to an item")
-    p_req_comment.add_argument("id", help="Item ID")
-    p_req_comment.add_argument("message", help="Comment text")
+Make any workspace AI-ready. Like 'git init', but for AI context.
 
-    # req link
-    p_req_link = req_sub.add_parser("link", help="Add a typed link between items")
-    p_req_link.add_argument("id", help="Source item ID")
-    p_req_link.add_argument(
-        "type", choices=("supersedes", "evolves", "relates", "blocks"), help="Link type"
-    )
-    p_req_link.add_argument("target", help="Target item ID")
+commands:
+  init        Initialize .fcontext/ in workspace
+  enable      Activate an AI agent (or 'enable list' to show status)
+  index       Scan & convert binary files to Markdown
+  status      Show index statistics
+  clean       Clear all cached files and reset index
+  reset       Reset all .fcontext/ data (requires confirmation)
+  topic       Manage accumulated knowledge topics
+  export      Export knowledge to zip file or git remote
+  experience  Manage experience packs
+  req         Requirements management
 
-    # req trace
-    p_req_trace = req_sub.add_parser("trace", help="Trace evolution chain of an item")
-    p_req_trace.add_argument("id", help="Item ID to trace")
+Run 'fcontext <command> -h' for command options.
+"""
 
-    args = parser.parse_args(argv)
 
-    if args.command is None:
-        parser.print_help()
-        return 0
+def main(argv: list[str] | None = None) -> int:
+    if argv is None:
+        argv = sys.argv[1:]
 
-    if args.command == "req" and (
-        not hasattr(args, "req_action") or args.req_action is None
-    ):
-        p_req.print_help()
+    # Fast paths: no argparse needed for bare usage or --version
+    if not argv:
+        print(_USAGE, end="")
         return 0
+    if argv[0] == "--version":
+        from . import __version__
 
-    if args.command == "topic" and (
-        not hasattr(args, "topic_action") or args.topic_action is None
-    ):
-        p_topic.print_help()
+        print(f"fcontext {__version__}")
         return 0
 
-    if args.command == "experience" and (
-        not hasattr(args, "exp_action") or args.exp_action is None
-    ):
-        p_exp.print_help()
-        return 0
+    parser = argparse.ArgumentParser(
+        prog="fcontext",
+        description="Make any workspace AI-ready. Like 'git init', but for AI context.",
+    )
+    parser.add_argument("--version", action=_VersionAction)
+
+    sub = parser.add_subparsers(dest="command")
+
+    # Only build the subcommand being invoked; fall back to the full
+    # grammar for top-level help and unknown commands.
+    command = _sniff_command(argv)
+    names = (command,) if command else tuple(_PARSER_BUILDERS)
+    parsers = {name: _PARSER_BUILDERS[name](sub) for name in names}
+
+    args = parser.parse_args(argv)
+
+    for action_attr in ("req_action", "topic_action", "exp_action"):
+        if hasattr(args, action_attr) and getattr(args, action_attr) is None:
+            parsers[args.command].print_help()
+            return 0
 
     return args.func(args)
 
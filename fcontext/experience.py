@@ -7,26 +7,69 @@ and _requirements/ subdirectories, plus a _README.md describing the pack.
 from __future__ import annotations
 
 import csv
+import errno
+import io
+import os
 import re
 import shutil
 import subprocess
 import sys
 import tempfile
+import threading
 import zipfile
+from collections import Counter, namedtuple
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
+from typing import Iterable, Iterator, TextIO
 from urllib.error import URLError
+from urllib.parse import urlsplit
 from urllib.request import urlopen
 
 # Only these subdirectories are included in experience packs.
 KNOWLEDGE_DIRS = ("_cache", "_topics", "_requirements")
+_KNOWLEDGE_SET = frozenset(KNOWLEDGE_DIRS)
 
 # Also included in export/import (not a knowledge dir but metadata)
 README_NAME = "_README.md"
 
+# Upper bound on threads used to stat packs in list_experiences.
+_STATS_WORKERS = 20
+
+# Export zips favour speed: knowledge is mostly markdown, where level 1
+# is several times faster than the default 6 for a slightly larger file.
+_ZIP_LEVEL = 1
+
+# Already-compressed formats are stored in export zips without deflating.
+_STORED_SUFFIXES = frozenset({
+    ".zip", ".gz", ".tgz", ".bz2", ".xz", ".7z",
+    ".png", ".jpg", ".jpeg", ".gif", ".webp",
+    ".docx", ".xlsx", ".pptx", ".mp3", ".mp4",
+})
+
+# Prefix of _README.md scanned for a pack description in list_experiences.
+_README_HEAD_BYTES = 2048
+
+# Upper bound on concurrent re-imports in update_experience.
+_UPDATE_WORKERS = 8
+
+# Serializes read-modify-write of ex.csv and .gitignore across update threads.
+_REGISTRY_LOCK = threading.Lock()
+
+# Git-import scratch clones live in .fcontext/.import-<pid>-*/; one whose
+# process is gone is a leftover of an interrupted import.
+_IMPORT_PREFIX = ".import-"
+
+# Upper bound on threads extracting zip members in _import_from_zip.
+_EXTRACT_WORKERS = 8
+
+# Chunk size for streaming archive members and downloads to disk.
+_COPY_CHUNK = 1024 * 1024
+
 # ── Experience registry (ex.csv) ──────────────────────────────────────────────
 
 EX_CSV_COLUMNS = ("name", "source_type", "source", "branch", "imported_at", "file_count")
+ExRow = namedtuple("ExRow", EX_CSV_COLUMNS)
 
 
 def _experiences_dir(root: Path) -> Path:
@@ -37,50 +80,74 @@ def _ex_csv_path(root: Path) -> Path:
     return _experiences_dir(root) / "ex.csv"
 
 
-def _load_ex(root: Path) -> list[dict[str, str]]:
-    """Load experience registry from ex.csv."""
+def _load_ex(root: Path) -> list[ExRow]:
+    """Load experience registry from ex.csv.
+
+    Columns are positional (EX_CSV_COLUMNS order); short rows are padded
+    with empty strings and blank lines are skipped.
+    """
     path = _ex_csv_path(root)
     if not path.exists():
         return []
+    width = len(EX_CSV_COLUMNS)
     with open(path, "r", encoding="utf-8", newline="") as f:
-        return list(csv.DictReader(f))
+        reader = csv.reader(f)
+        next(reader, None)  # header
+        return [ExRow(*row[:width], *[""] * (width - len(row))) for row in reader if row]
 
 
-def _save_ex(root: Path, rows: list[dict[str, str]]) -> None:
+def _save_ex(root: Path, rows: list[ExRow]) -> None:
     """Save experience registry to ex.csv."""
     path = _ex_csv_path(root)
     path.parent.mkdir(parents=True, exist_ok=True)
     with open(path, "w", encoding="utf-8", newline="") as f:
-        writer = csv.DictWriter(f, fieldnames=EX_CSV_COLUMNS)
-        writer.writeheader()
+        writer = csv.writer(f)
+        writer.writerow(EX_CSV_COLUMNS)
         writer.writerows(rows)
 
 
+class Registry:
+    """In-memory view of ex.csv for bulk updates: mutate rows, then flush() once."""
+
+    def __init__(self, root: Path) -> None:
+        self.root = root
+        self.rows: dict[str, ExRow] = {r.name: r for r in _load_ex(root)}
+
+    def upsert(self, row: ExRow) -> None:
+        # Existing rows keep their position, so concurrent updates flush in a stable order
+        self.rows[row.name] = row
+
+    def flush(self) -> None:
+        with _REGISTRY_LOCK:
+            _save_ex(self.root, list(self.rows.values()))
+
+
 def _record_import(root: Path, name: str, source_type: str, source: str,
-                   branch: str, file_count: int) -> None:
-    """Add or update a row in ex.csv for an imported experience."""
-    rows = _load_ex(root)
+                   branch: str, file_count: int,
+                   registry: Registry | None = None) -> None:
+    """Add or update a row in ex.csv for an imported experience.
+
+    With *registry*, the row is staged in memory and written on its flush().
+    """
     now = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
-    new_row = {
-        "name": name,
-        "source_type": source_type,
-        "source": source,
-        "branch": branch,
-        "imported_at": now,
-        "file_count": str(file_count),
-    }
-    # Replace existing row with same name (force-overwrite case)
-    rows = [r for r in rows if r.get("name") != name]
-    rows.append(new_row)
-    _save_ex(root, rows)
+    new_row = ExRow(name, source_type, source, branch, now, str(file_count))
+    if registry is not None:
+        registry.upsert(new_row)
+        return
+    with _REGISTRY_LOCK:
+        # Replace existing row with same name (force-overwrite case)
+        rows = [r for r in _load_ex(root) if r.name != name]
+        rows.append(new_row)
+        _save_ex(root, rows)
 
 
 def _unrecord(root: Path, name: str) -> None:
     """Remove a row from ex.csv."""
-    rows = _load_ex(root)
-    filtered = [r for r in rows if r.get("name") != name]
-    if len(filtered) != len(rows):
-        _save_ex(root, filtered)
+    with _REGISTRY_LOCK:
+        rows = _load_ex(root)
+        filtered = [r for r in rows if r.name != name]
+        if len(filtered) != len(rows):
+            _save_ex(root, filtered)
 
 
 # ── .gitignore management for git-imported experiences ────────────────────
@@ -89,63 +156,74 @@ def _gitignore_path(root: Path) -> Path:
     return root / ".fcontext" / ".gitignore"
 
 
+def _gitignore_entry(name: str) -> str:
+    return f"_experiences/{name}/"
+
+
+def _gitignore_mutate(root: Path, adds: Iterable[str] = (),
+                      removes: Iterable[str] = ()) -> None:
+    """Add and remove _experiences/<name>/ lines in .fcontext/.gitignore.
+
+    Reads the file once and rewrites it at most once, via a temp file and
+    os.replace so a crash never leaves a half-written .gitignore.
+    """
+    gi = _gitignore_path(root)
+    drop = {_gitignore_entry(n) for n in removes}
+    with _REGISTRY_LOCK:
+        lines = gi.read_text(encoding="utf-8").splitlines() if gi.exists() else []
+        kept = [ln for ln in lines if ln not in drop]
+        present = set(kept)
+        for entry in dict.fromkeys(_gitignore_entry(n) for n in adds):
+            if entry not in present:
+                kept.append(entry)
+        if kept == lines:
+            return
+        tmp = gi.with_name(gi.name + ".tmp")
+        tmp.write_text("".join(f"{ln}\n" for ln in kept), encoding="utf-8")
+        os.replace(tmp, gi)
+
+
 def _gitignore_add(root: Path, name: str) -> None:
     """Add _experiences/<name>/ to .fcontext/.gitignore for git-imported packs."""
-    gi = _gitignore_path(root)
-    entry = f"_experiences/{name}/\n"
-    if gi.exists():
-        content = gi.read_text(encoding="utf-8")
-        if entry in content:
-            return  # already present
-        if not content.endswith("\n"):
-            content += "\n"
-        content += entry
-    else:
-        content = entry
-    gi.write_text(content, encoding="utf-8")
+    _gitignore_mutate(root, adds=(name,))
 
 
 def _gitignore_remove(root: Path, name: str) -> None:
     """Remove _experiences/<name>/ from .fcontext/.gitignore."""
-    gi = _gitignore_path(root)
-    if not gi.exists():
-        return
-    entry = f"_experiences/{name}/\n"
-    content = gi.read_text(encoding="utf-8")
-    if entry in content:
-        content = content.replace(entry, "")
-        gi.write_text(content, encoding="utf-8")
+    _gitignore_mutate(root, removes=(name,))
+
+
+def _pack_dirs(exp_dir: Path) -> list[Path]:
+    """Return the pack directories under *exp_dir*, sorted ([] if it is missing).
+
+    os.scandir supplies the is_dir() answer from the directory listing, so
+    no per-entry stat is needed.
+    """
+    try:
+        with os.scandir(exp_dir) as it:
+            return sorted(Path(e.path) for e in it if e.is_dir())
+    except (FileNotFoundError, NotADirectoryError):
+        return []
 
 
 def list_experiences(root: Path) -> int:
     """List all imported experience packs."""
-    exp_dir = _experiences_dir(root)
-    if not exp_dir.is_dir():
-        print("  (no experience packs)")
-        return 0
-
-    packs = sorted(d for d in exp_dir.iterdir() if d.is_dir())
+    packs = _pack_dirs(_experiences_dir(root))
     if not packs:
         print("  (no experience packs)")
         return 0
 
     # Load registry for source info
-    registry = {r["name"]: r for r in _load_ex(root)}
+    registry = {r.name: r for r in _load_ex(root)}
 
-    for pack in packs:
+    # Stat'ing is I/O-bound, so walk packs concurrently; printing stays
+    # serial in pack order.  Capped to keep open directory handles bounded.
+    with ThreadPoolExecutor(max_workers=min(_STATS_WORKERS, len(packs))) as pool:
+        stats = list(pool.map(_pack_stats, packs))
+
+    for pack, (dirs_present, file_count, total_size) in zip(packs, stats):
         readme = pack / README_NAME
-        desc = ""
-        if readme.exists():
-            # First non-heading, non-empty line is the description
-            for line in readme.read_text(encoding="utf-8").splitlines():
-                stripped = line.strip()
-                if stripped and not stripped.startswith("#"):
-                    desc = stripped
-                    break
-
-        dirs_present = [d.name for d in pack.iterdir() if d.is_dir() and d.name in KNOWLEDGE_DIRS]
-        file_count = sum(1 for _ in pack.rglob("*") if _.is_file())
-        total_size = sum(f.stat().st_size for f in pack.rglob("*") if f.is_file())
+        desc = _readme_description(readme) if readme.exists() else ""
         size_str = _human_size(total_size)
 
         print(f"  {pack.name}")
@@ -156,17 +234,13 @@ def list_experiences(root: Path) -> int:
         # Source info from registry
         rec = registry.get(pack.name)
         if rec:
-            src_type = rec.get("source_type", "")
-            src = rec.get("source", "")
-            branch = rec.get("branch", "")
-            imported_at = rec.get("imported_at", "")
-            source_line = f"    source: {src_type}"
-            if src:
-                source_line += f"  {src}"
-            if branch:
-                source_line += f"  branch={branch}"
-            if imported_at:
-                source_line += f"  imported={imported_at}"
+            source_line = f"    source: {rec.source_type}"
+            if rec.source:
+                source_line += f"  {rec.source}"
+            if rec.branch:
+                source_line += f"  branch={rec.branch}"
+            if rec.imported_at:
+                source_line += f"  imported={rec.imported_at}"
             print(source_line)
 
         print()
@@ -174,6 +248,60 @@ def list_experiences(root: Path) -> int:
     return 0
 
 
+def _readme_description(readme: Path) -> str:
+    """Return the first non-heading, non-empty line of a pack's _README.md.
+
+    Only the first few KB are read; the whole file is read only if that
+    prefix holds no description.
+    """
+    with open(readme, "rb") as f:
+        head = f.read(_README_HEAD_BYTES)
+    lines = head.decode("utf-8", "replace").splitlines()
+    truncated = len(head) == _README_HEAD_BYTES
+    if truncated:
+        lines.pop()  # may be cut mid-line (or mid-character)
+    desc = _first_text_line(lines)
+    if not desc and truncated:
+        desc = _first_text_line(readme.read_text(encoding="utf-8").splitlines())
+    return desc
+
+
+def _first_text_line(lines: Iterable[str]) -> str:
+    for line in lines:
+        stripped = line.strip()
+        if stripped and not stripped.startswith("#"):
+            return stripped
+    return ""
+
+
+def _pack_stats(pack: Path) -> tuple[list[str], int, int]:
+    """Walk a pack once, returning (knowledge dirs present, file count, total bytes)."""
+    top = str(pack)
+    dirs_present: list[str] = []
+    file_count = 0
+    total_size = 0
+    stack = [top]
+    while stack:
+        current = stack.pop()
+        try:
+            it = os.scandir(current)
+        except OSError:
+            continue  # unreadable or deleted meanwhile: skip, as rglob did
+        with it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                    if current is top and entry.name in _KNOWLEDGE_SET:
+                        dirs_present.append(entry.name)
+                elif entry.is_file():
+                    try:
+                        total_size += entry.stat().st_size
+                    except OSError:
+                        continue
+                    file_count += 1
+    return dirs_present, file_count, total_size
+
+
 def remove_experience(root: Path, name: str) -> int:
     """Remove an imported experience pack."""
     target = _experiences_dir(root) / name
@@ -198,10 +326,11 @@ def update_experience(root: Path, name: str | None = None) -> int:
     If *name* is given, only that single experience is updated.
     Returns 0 if all updates succeeded, 1 if any failed.
     """
-    rows = _load_ex(root)
+    registry = Registry(root)
+    rows = list(registry.rows.values())
 
     if name:
-        rows = [r for r in rows if r["name"] == name]
+        rows = [r for r in rows if r.name == name]
         if not rows:
             print(f"error: experience '{name}' not found in registry", file=sys.stderr)
             return 1
@@ -210,37 +339,79 @@ def update_experience(root: Path, name: str | None = None) -> int:
         print("no experience packs to update")
         return 0
 
-    updatable = [r for r in rows if r.get("source_type") in ("git", "local-git", "url")]
-    skipped = [r for r in rows if r.get("source_type") not in ("git", "local-git", "url")]
+    updatable = [r for r in rows if r.source_type in ("git", "local-git", "url")]
+    skipped = [r for r in rows if r.source_type not in ("git", "local-git", "url")]
 
     for r in skipped:
-        print(f"  skip '{r['name']}' (source_type={r.get('source_type', '?')}, cannot auto-update)")
+        print(f"  skip '{r.name}' (source_type={r.source_type or '?'}, cannot auto-update)")
 
     if not updatable:
         print("no updatable experience packs (only git/url sources can be updated)")
         return 0
 
-    failed = 0
-    for r in updatable:
-        src_type = r["source_type"]
-        source = r["source"]
-        exp_name = r["name"]
-        branch = r.get("branch") or None
-
-        print(f"  updating '{exp_name}' ({src_type}) ...")
-        if src_type in ("git", "local-git"):
-            rc = import_experience_git(root, source, name=exp_name,
-                                       force=True, branch=branch)
-        else:  # url
-            rc = _import_from_url(root, source, name=exp_name, force=True)
+    # Each update is a clone or download, so fetch them concurrently; their
+    # output is collected and printed below in pack order
+    with ThreadPoolExecutor(max_workers=min(_UPDATE_WORKERS, len(updatable))) as pool:
+        results = list(pool.map(lambda r: _update_one(root, r, registry), updatable))
+    registry.flush()
 
+    failed = 0
+    for r, (rc, out, err) in zip(updatable, results):
+        sys.stdout.write(out)
+        sys.stderr.write(err)
         if rc != 0:
-            print(f"  ✗ failed to update '{exp_name}'", file=sys.stderr)
+            print(f"  ✗ failed to update '{r.name}'", file=sys.stderr)
             failed += 1
 
     return 1 if failed else 0
 
 
+def _update_one(root: Path, r: ExRow, registry: Registry) -> tuple[int, str, str]:
+    """Re-import a single registry row from its original source.
+
+    Returns the exit code and the stdout and stderr text the re-import
+    produced, for the caller to print in pack order.
+    """
+    out, err = io.StringIO(), io.StringIO()
+    print(f"  updating '{r.name}' ({r.source_type}) ...", file=out)
+    if r.source_type in ("git", "local-git"):
+        rc = import_experience_git(root, r.source, name=r.name, force=True,
+                                   branch=r.branch or None, registry=registry,
+                                   out=out, err=err)
+    else:  # url
+        rc = _import_from_url(root, r.source, name=r.name, force=True, registry=registry,
+                              out=out, err=err)
+    return rc, out.getvalue(), err.getvalue()
+
+
+def _git(cmd: list[str], cwd: Path | None = None, env: dict[str, str] | None = None,
+         stderr: int = subprocess.PIPE) -> subprocess.CompletedProcess:
+    """Run a git command, discarding stdout and keeping stderr as raw bytes."""
+    return subprocess.run(cmd, cwd=cwd, env=env, stdout=subprocess.DEVNULL, stderr=stderr)
+
+
+def _git_err(result: subprocess.CompletedProcess) -> str:
+    """Decode a failed git command's stderr for an error message."""
+    return result.stderr.decode("utf-8", "replace").strip()
+
+
+# Paths checked out by a sparse clone: .fcontext/ or the same layout at the repo root.
+_SPARSE_PATTERNS = ("/.fcontext/", *(f"/{kd}/" for kd in KNOWLEDGE_DIRS), f"/{README_NAME}")
+
+# git/server errors meaning a partial or sparse clone is unsupported, as
+# opposed to a bad URL, auth or network failure that a plain clone would hit too
+_UNSUPPORTED_CLONE_RE = re.compile(
+    r"unknown option|is not a git command"
+    r"|(?:filter|sparse)\w* (?:is )?not (?:recognized|supported)"
+    r"|does not support (?:filter|sparse)",
+    re.IGNORECASE,
+)
+
+_SSH_GIT_RE = re.compile(r'^[\w.-]+@[\w.-]+:')
+_URL_GIT_RE = re.compile(r'^(?:https?|ssh|git)://')
+_HTTP_RE = re.compile(r'^https?://')
+
+
 def _is_git_url(source: str) -> bool:
     """Detect if source looks like a git URL.
 
@@ -251,18 +422,32 @@ def _is_git_url(source: str) -> bool:
       ssh://git@host/repo.git
     """
     # ssh-style: git@host:org/repo
-    if re.match(r'^[\w.-]+@[\w.-]+:', source):
+    if _SSH_GIT_RE.match(source):
         return True
     # URL-style: https://, ssh://, git://
-    if re.match(r'^(https?|ssh|git)://', source):
+    if _URL_GIT_RE.match(source):
         return True
     return False
 
 
+# Resolved paths already found to hold a .git (negative answers are not kept,
+# so a directory that is git-init'ed later is picked up)
+_LOCAL_GIT_REPOS: set[str] = set()
+
+
 def _is_local_git_repo(source: str) -> bool:
-    """Return True if *source* is a path to a local directory containing .git."""
-    p = Path(source)
-    return p.is_dir() and (p / ".git").exists()
+    """Return True if *source* is a path to a local directory containing .git.
+
+    Hits are cached by resolved path: an import asks twice (dispatch, then
+    source_type).  A single stat suffices since <file>/.git fails with ENOTDIR.
+    """
+    real = os.path.realpath(source)
+    if real in _LOCAL_GIT_REPOS:
+        return True
+    if not os.path.exists(os.path.join(real, ".git")):
+        return False
+    _LOCAL_GIT_REPOS.add(real)
+    return True
 
 
 def _is_download_url(source: str) -> bool:
@@ -271,11 +456,10 @@ def _is_download_url(source: str) -> bool:
     Matches URLs ending with .zip (case-insensitive), possibly with query params.
     These should be downloaded rather than git-cloned.
     """
-    if not re.match(r'^https?://', source):
+    if not _HTTP_RE.match(source):
         return False
-    # Strip query string / fragment for extension check
-    path_part = source.split('?')[0].split('#')[0]
-    return path_part.lower().endswith('.zip')
+    # Only the path component counts, not the query string / fragment
+    return urlsplit(source).path.lower().endswith('.zip')
 
 
 def import_experience(root: Path, source: str, name: str | None = None,
@@ -296,43 +480,44 @@ def import_experience(root: Path, source: str, name: str | None = None,
 
 
 def _import_from_url(root: Path, url: str, name: str | None = None,
-                     force: bool = False) -> int:
-    """Download a zip from an HTTP(S) URL and import it."""
+                     force: bool = False, registry: Registry | None = None,
+                     out: TextIO | None = None, err: TextIO | None = None) -> int:
+    """Download a zip from an HTTP(S) URL and import it.
+
+    Progress goes to *out* and errors to *err* (stdout/stderr when None).
+    """
     # Derive name from URL filename if not provided
     if not name:
-        path_part = url.split('?')[0].split('#')[0]
-        name = Path(path_part).stem  # e.g. "knowledge.zip" → "knowledge"
+        name = Path(urlsplit(url).path).stem  # e.g. "knowledge.zip" → "knowledge"
 
-    print(f"  downloading {url} ...")
+    print(f"  downloading {url} ...", file=out)
     try:
         with tempfile.TemporaryDirectory() as tmp:
             tmp_zip = Path(tmp) / "download.zip"
-            with urlopen(url, timeout=60) as resp:
-                tmp_zip.write_bytes(resp.read())
+            with urlopen(url, timeout=60) as resp, open(tmp_zip, "wb") as f:
+                shutil.copyfileobj(resp, f, _COPY_CHUNK)
 
             if not zipfile.is_zipfile(tmp_zip):
-                print("error: downloaded file is not a valid zip", file=sys.stderr)
+                print("error: downloaded file is not a valid zip", file=err or sys.stderr)
                 return 1
 
-            rc = _import_from_zip(root, str(tmp_zip), name=name, force=force)
-            if rc == 0:
-                # Re-record with correct source_type and URL
-                _record_import(root, name, source_type="url", source=url,
-                               branch="", file_count=int(
-                                   next((r["file_count"] for r in _load_ex(root)
-                                         if r["name"] == name), "0")))
-            return rc
+            return _import_from_zip(root, str(tmp_zip), name=name, force=force,
+                                    registry=registry, source_type="url", record_source=url,
+                                    out=out, err=err)
     except (URLError, OSError) as exc:
-        print(f"error: download failed: {exc}", file=sys.stderr)
+        print(f"error: download failed: {exc}", file=err or sys.stderr)
         return 1
 
 
 def import_experience_git(root: Path, url: str, name: str | None = None,
-                          force: bool = False, branch: str | None = None) -> int:
+                          force: bool = False, branch: str | None = None,
+                          registry: Registry | None = None,
+                          out: TextIO | None = None, err: TextIO | None = None) -> int:
     """Import an experience pack from a git repository.
 
     Clones the repo (shallow), locates .fcontext/ knowledge dirs,
-    and copies them into _experiences/<name>/.
+    and copies them into _experiences/<name>/.  Progress goes to *out* and
+    errors to *err* (stdout/stderr when None).
     """
     # Derive name from URL if not provided
     if not name:
@@ -344,22 +529,19 @@ def import_experience_git(root: Path, url: str, name: str | None = None,
     target = _experiences_dir(root) / name
     if target.exists() and not force:
         print(f"error: experience '{name}' already exists (use -f to overwrite)",
-              file=sys.stderr)
+              file=err or sys.stderr)
         return 1
 
-    # Clone to temp directory
-    with tempfile.TemporaryDirectory() as tmp:
+    # Clone into .fcontext/ so the knowledge dirs can be renamed into place
+    # rather than copied (same filesystem as _experiences/)
+    _prepare_import_area(root)
+    with tempfile.TemporaryDirectory(prefix=f"{_IMPORT_PREFIX}{os.getpid()}-",
+                                     dir=_experiences_dir(root).parent) as tmp:
         clone_dir = Path(tmp) / "repo"
-        cmd = ["git", "clone", "--depth", "1"]
-        if branch:
-            cmd += ["--branch", branch]
-        cmd += [url, str(clone_dir)]
-
-        print(f"  cloning {url} ...")
-        result = subprocess.run(cmd, capture_output=True, text=True)
+        print(f"  cloning {url} ...", file=out)
+        result = _clone_knowledge(url, clone_dir, branch)
         if result.returncode != 0:
-            err = result.stderr.strip()
-            print(f"error: git clone failed: {err}", file=sys.stderr)
+            print(f"error: git clone failed: {_git_err(result)}", file=err or sys.stderr)
             return 1
 
         # Locate knowledge source in cloned repo:
@@ -377,21 +559,19 @@ def import_experience_git(root: Path, url: str, name: str | None = None,
         if not has_knowledge:
             print(f"error: repo contains no knowledge directories "
                   f"({', '.join(KNOWLEDGE_DIRS)})",
-                  file=sys.stderr)
+                  file=err or sys.stderr)
             return 1
 
         # Prepare target
-        if target.exists():
-            shutil.rmtree(target)
-        target.mkdir(parents=True, exist_ok=True)
+        _reset_dir(target)
 
-        # Copy knowledge dirs and _README.md
+        # Move knowledge dirs and copy _README.md
         extracted = 0
         for kd in KNOWLEDGE_DIRS:
             src = knowledge_src / kd
             if src.is_dir():
-                shutil.copytree(src, target / kd)
-                extracted += sum(1 for _ in (target / kd).rglob("*") if _.is_file())
+                extracted += sum(1 for _ in _iter_files(src))
+                _move_tree(src, target / kd)
 
         readme_src = knowledge_src / README_NAME
         if readme_src.exists():
@@ -401,30 +581,114 @@ def import_experience_git(root: Path, url: str, name: str | None = None,
     # Determine source type
     source_type = "local-git" if _is_local_git_repo(url) else "git"
     _record_import(root, name, source_type=source_type, source=url,
-                   branch=branch or "", file_count=extracted)
+                   branch=branch or "", file_count=extracted, registry=registry)
 
     # Remote git imports can be re-cloned — ignore in git
     if source_type == "git":
         _gitignore_add(root, name)
 
-    print(f"  ✓ imported experience '{name}' from git ({extracted} files)")
+    print(f"  ✓ imported experience '{name}' from git ({extracted} files)", file=out)
     return 0
 
 
+def _prepare_import_area(root: Path) -> None:
+    """Gitignore .fcontext/.import-*/ and drop clones a killed import left behind.
+
+    A clone is only removed once the process named in its directory has
+    exited, so a slow import in another process is never pulled out from
+    under it.
+    """
+    from .init import ensure_gitignore
+
+    ctx = _experiences_dir(root).parent
+    with _REGISTRY_LOCK:
+        ensure_gitignore(root)
+        with os.scandir(ctx) as it:
+            stale = [e.path for e in it
+                     if e.name.startswith(_IMPORT_PREFIX) and e.is_dir(follow_symlinks=False)
+                     and _import_owner_gone(e.name)]
+    for path in stale:
+        shutil.rmtree(path, ignore_errors=True)
+
+
+def _import_owner_gone(dirname: str) -> bool:
+    """Whether the process that created scratch clone *dirname* has exited."""
+    pid = dirname[len(_IMPORT_PREFIX):].partition("-")[0]
+    if not pid.isdigit():
+        return False  # not one of ours; leave it alone
+    if sys.platform == "win32":
+        return False  # os.kill(pid, 0) would terminate the process there
+    try:
+        os.kill(int(pid), 0)
+    except ProcessLookupError:
+        return True
+    except OSError:
+        pass  # e.g. EPERM: alive, under another user
+    return False
+
+
+def _move_tree(src: Path, dst: Path) -> None:
+    """Move a directory tree, falling back to a copy across filesystems."""
+    try:
+        os.rename(src, dst)
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+        shutil.copytree(src, dst)
+
+
+def _reset_dir(path: Path) -> None:
+    """Recreate *path* as an empty directory, without a separate exists() check."""
+    try:
+        shutil.rmtree(path)
+    except FileNotFoundError:
+        pass
+    path.mkdir(parents=True)
+
+
+def _clone_knowledge(url: str, clone_dir: Path,
+                     branch: str | None = None) -> subprocess.CompletedProcess:
+    """Shallow-clone *url*, checking out only the knowledge paths.
+
+    Tries a blobless sparse clone first, so only .fcontext/ (or root-level
+    knowledge dirs) is downloaded.  If git or the server reports that it
+    does not support that, falls back to a plain shallow clone; any other
+    failure is returned as is.
+    """
+    cmd = ["git", "clone", "--depth", "1"]
+    if branch:
+        cmd += ["--branch", branch]
+    result = _git(cmd + ["--filter=blob:none", "--sparse", "--single-branch", "--no-tags",
+                         url, str(clone_dir)])
+    if result.returncode == 0:
+        result = _git(["git", "-C", str(clone_dir), "sparse-checkout", "set", "--no-cone",
+                       *_SPARSE_PATTERNS])
+        if result.returncode == 0:
+            return result
+    if not _UNSUPPORTED_CLONE_RE.search(_git_err(result)):
+        return result
+    shutil.rmtree(clone_dir, ignore_errors=True)
+    return _git(cmd + [url, str(clone_dir)])
+
+
 def _import_from_zip(root: Path, source: str, name: str | None = None,
-                     force: bool = False) -> int:
+                     force: bool = False, registry: Registry | None = None,
+                     source_type: str = "zip", record_source: str | None = None,
+                     out: TextIO | None = None, err: TextIO | None = None) -> int:
     """Import an experience pack from a zip file.
 
     The zip should contain _cache/, _topics/, _requirements/ at its root
-    (or inside a single top-level folder).
+    (or inside a single top-level folder).  *source_type* and *record_source*
+    override what is recorded in ex.csv (e.g. for a downloaded zip).
+    Progress goes to *out* and errors to *err* (stdout/stderr when None).
     """
     source_path = Path(source).resolve()
     if not source_path.exists():
-        print(f"error: file not found: {source}", file=sys.stderr)
+        print(f"error: file not found: {source}", file=err or sys.stderr)
         return 1
 
     if not zipfile.is_zipfile(source_path):
-        print(f"error: not a valid zip file: {source}", file=sys.stderr)
+        print(f"error: not a valid zip file: {source}", file=err or sys.stderr)
         return 1
 
     # Derive name from zip filename if not provided
@@ -433,28 +697,30 @@ def _import_from_zip(root: Path, source: str, name: str | None = None,
 
     target = _experiences_dir(root) / name
     if target.exists() and not force:
-        print(f"error: experience '{name}' already exists (use -f to overwrite)", file=sys.stderr)
+        print(f"error: experience '{name}' already exists (use -f to overwrite)", file=err or sys.stderr)
         return 1
 
-    if target.exists():
-        shutil.rmtree(target)
-
-    target.mkdir(parents=True, exist_ok=True)
+    _reset_dir(target)
 
     with zipfile.ZipFile(source_path, "r") as zf:
         # Detect if zip has a single top-level directory wrapper
-        top_dirs = {n.split("/")[0] for n in zf.namelist() if "/" in n}
+        names = zf.namelist()
+        top_dirs = set()
+        for n in names:
+            head, sep, _ = n.partition("/")
+            if sep:
+                top_dirs.add(head)
         prefix = ""
         if len(top_dirs) == 1:
             candidate = top_dirs.pop()
             # Check if knowledge dirs are inside this wrapper
-            has_knowledge_inside = any(
-                n.startswith(f"{candidate}/{kd}/") for n in zf.namelist() for kd in KNOWLEDGE_DIRS
-            )
-            if has_knowledge_inside:
+            wanted = tuple(f"{candidate}/{kd}/" for kd in KNOWLEDGE_DIRS)
+            if any(n.startswith(wanted) for n in names):
                 prefix = candidate + "/"
 
-        extracted = 0
+        # dest -> member; a repeated name keeps its last entry, as sequential
+        # extraction would
+        members: dict[Path, zipfile.ZipInfo] = {}
         for member in zf.infolist():
             if member.is_dir():
                 continue
@@ -464,28 +730,62 @@ def _import_from_zip(root: Path, source: str, name: str | None = None,
                 rel = rel[len(prefix):]
 
             # Only extract files under knowledge directories or _README.md
-            top = rel.split("/")[0] if "/" in rel else rel
-            if top not in KNOWLEDGE_DIRS and rel != README_NAME:
+            top = rel.partition("/")[0]
+            if top not in _KNOWLEDGE_SET and rel != README_NAME:
                 continue
+            members[target / rel] = member
 
-            dest = target / rel
-            dest.parent.mkdir(parents=True, exist_ok=True)
-            with zf.open(member) as src, open(dest, "wb") as dst:
-                dst.write(src.read())
-            extracted += 1
-
+    extracted = len(members)
     if extracted == 0:
         shutil.rmtree(target)
-        print(f"error: zip contains no knowledge directories ({', '.join(KNOWLEDGE_DIRS)})", file=sys.stderr)
+        print(f"error: zip contains no knowledge directories ({', '.join(KNOWLEDGE_DIRS)})", file=err or sys.stderr)
         return 1
 
-    _record_import(root, name, source_type="zip", source=source,
-                   branch="", file_count=extracted)
+    # Create directories up front so workers never race on mkdir
+    for parent in {dest.parent for dest in members}:
+        parent.mkdir(parents=True, exist_ok=True)
+    # ZipFile handles are not thread-safe, so each worker opens its own
+    jobs = list(members.items())
+    workers = min(_EXTRACT_WORKERS, os.cpu_count() or 1, extracted)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        list(pool.map(lambda batch: _extract_members(source_path, batch),
+                      (jobs[i::workers] for i in range(workers))))
 
-    print(f"  ✓ imported experience '{name}' ({extracted} files)")
+    _record_import(root, name, source_type=source_type, source=record_source or source,
+                   branch="", file_count=extracted, registry=registry)
+
+    print(f"  ✓ imported experience '{name}' ({extracted} files)", file=out)
     return 0
 
 
+def _extract_members(source_path: Path, batch: list[tuple[Path, zipfile.ZipInfo]]) -> None:
+    """Stream each (dest, member) pair out of the zip through a private handle."""
+    with zipfile.ZipFile(source_path, "r") as zf:
+        for dest, member in batch:
+            with zf.open(member) as src, open(dest, "wb") as dst:
+                shutil.copyfileobj(src, dst, _COPY_CHUNK)
+
+
+def _iter_files(base: Path) -> Iterator[os.DirEntry]:
+    """Yield a DirEntry for every regular file under *base* (recursive).
+
+    Uses os.scandir so file/dir checks come from the directory listing
+    instead of a stat per path.  Unreadable directories are skipped.
+    """
+    stack = [str(base)]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.is_file():
+                    yield entry
+
+
 def _collect_knowledge(root: Path) -> list[tuple[Path, str]]:
     """Collect all exportable files from knowledge directories.
 
@@ -497,38 +797,35 @@ def _collect_knowledge(root: Path) -> list[tuple[Path, str]]:
     """
     ctx = root / ".fcontext"
     files: list[tuple[Path, str]] = []
+    # Every collected path lives under ctx, so slice off the prefix and
+    # normalise separators for zip/git
+    cut = len(str(ctx)) + 1
+
+    def rel(path: str) -> str:
+        return path[cut:].replace(os.sep, "/")
 
     # 1. Workspace's own knowledge dirs
     for kd in KNOWLEDGE_DIRS:
         kd_path = ctx / kd
         if not kd_path.is_dir():
             continue
-        for f in kd_path.rglob("*"):
-            if f.is_file():
-                rel = str(f.relative_to(ctx))
-                files.append((f, rel))
+        for entry in _iter_files(kd_path):
+            files.append((Path(entry.path), rel(entry.path)))
 
     # 2. Local-source experiences (zip, local-git) — cannot be re-fetched
-    registry = {r["name"]: r for r in _load_ex(root)}
-    exp_dir = _experiences_dir(root)
-    if exp_dir.is_dir():
-        for pack in sorted(exp_dir.iterdir()):
-            if not pack.is_dir():
-                continue
-            rec = registry.get(pack.name, {})
-            src_type = rec.get("source_type", "")
-            # Only include local sources that can't be re-obtained remotely
-            if src_type not in ("zip", "local-git"):
-                continue
-            for f in pack.rglob("*"):
-                if f.is_file():
-                    rel = str(f.relative_to(ctx))
-                    files.append((f, rel))
+    registry = {r.name: r for r in _load_ex(root)}
+    for pack in _pack_dirs(_experiences_dir(root)):
+        rec = registry.get(pack.name)
+        # Only include local sources that can't be re-obtained remotely
+        if rec is None or rec.source_type not in ("zip", "local-git"):
+            continue
+        for entry in _iter_files(pack):
+            files.append((Path(entry.path), rel(entry.path)))
 
-        # Include ex.csv itself so the registry survives round-trip
-        csv_path = _ex_csv_path(root)
-        if csv_path.exists():
-            files.append((csv_path, str(csv_path.relative_to(ctx))))
+    # Include ex.csv itself so the registry survives round-trip
+    csv_path = _ex_csv_path(root)
+    if csv_path.exists():
+        files.append((csv_path, rel(str(csv_path))))
 
     return files
 
@@ -568,10 +865,13 @@ def _export_to_zip(root: Path, output: str, name: str | None = None) -> int:
 
     readme_content = _generate_readme(root, files)
 
-    with zipfile.ZipFile(output_path, "w", zipfile.ZIP_DEFLATED) as zf:
+    with zipfile.ZipFile(output_path, "w", zipfile.ZIP_DEFLATED,
+                         compresslevel=_ZIP_LEVEL) as zf:
         zf.writestr(README_NAME, readme_content)
         for abs_path, rel_path in files:
-            zf.write(abs_path, rel_path)
+            # Deflating already-compressed formats costs CPU for no gain
+            stored = abs_path.suffix.lower() in _STORED_SUFFIXES
+            zf.write(abs_path, rel_path, compress_type=zipfile.ZIP_STORED if stored else None)
 
     print(f"  ✓ exported {len(files)} files → {output_path}")
     return 0
@@ -585,8 +885,6 @@ def _export_to_git(root: Path, url: str, name: str | None = None,
     .fcontext/ knowledge content, commits the changes, and pushes.
     If the remote is empty or doesn't exist, initialises a new repo.
     """
-    import os
-
     files = _collect_knowledge(root)
     if not files:
         print("error: nothing to export (no files in _cache/, _topics/, _requirements/)", file=sys.stderr)
@@ -609,7 +907,7 @@ def _export_to_git(root: Path, url: str, name: str | None = None,
 
         # Try cloning existing remote to preserve history
         clone_cmd = ["git", "clone", "--branch", branch, url, str(repo_dir)]
-        clone_result = subprocess.run(clone_cmd, capture_output=True, text=True, env=env)
+        clone_result = _git(clone_cmd, env=env, stderr=subprocess.DEVNULL)
 
         if clone_result.returncode == 0:
             # Successfully cloned — remove old .fcontext/ content to sync
@@ -619,18 +917,14 @@ def _export_to_git(root: Path, url: str, name: str | None = None,
         else:
             # Remote is empty or branch doesn't exist — init fresh
             repo_dir.mkdir(parents=True)
-            init_result = subprocess.run(
-                ["git", "init", "-b", branch], cwd=repo_dir,
-                capture_output=True, text=True, env=env)
+            init_result = _git(["git", "init", "-b", branch], cwd=repo_dir, env=env)
             if init_result.returncode != 0:
-                print(f"error: git init failed: {init_result.stderr.strip()}",
+                print(f"error: git init failed: {_git_err(init_result)}",
                       file=sys.stderr)
                 return 1
-            add_remote = subprocess.run(
-                ["git", "remote", "add", "origin", url], cwd=repo_dir,
-                capture_output=True, text=True, env=env)
+            add_remote = _git(["git", "remote", "add", "origin", url], cwd=repo_dir, env=env)
             if add_remote.returncode != 0:
-                print(f"error: git remote add failed: {add_remote.stderr.strip()}",
+                print(f"error: git remote add failed: {_git_err(add_remote)}",
                       file=sys.stderr)
                 return 1
 
@@ -641,7 +935,7 @@ def _export_to_git(root: Path, url: str, name: str | None = None,
         for abs_path, rel_path in files:
             dest = ctx_dir / rel_path
             dest.parent.mkdir(parents=True, exist_ok=True)
-            shutil.copy2(abs_path, dest)
+            shutil.copyfile(abs_path, dest)
 
         # Generate _README.md
         readme_content = _generate_readme(root, files)
@@ -650,37 +944,32 @@ def _export_to_git(root: Path, url: str, name: str | None = None,
         # Use project _README.md as top-level README
         project_readme = root / ".fcontext" / README_NAME
         if project_readme.exists():
-            shutil.copy2(project_readme, repo_dir / "README.md")
+            shutil.copyfile(project_readme, repo_dir / "README.md")
         else:
             (repo_dir / "README.md").write_text(readme_content, encoding="utf-8")
 
         # Stage, commit, push
-        subprocess.run(["git", "add", "."], cwd=repo_dir,
-                       capture_output=True, text=True, env=env)
+        _git(["git", "add", "."], cwd=repo_dir, env=env, stderr=subprocess.DEVNULL)
 
         # Check if there are actual changes to commit
-        diff_result = subprocess.run(
-            ["git", "diff", "--cached", "--quiet"], cwd=repo_dir,
-            capture_output=True, text=True, env=env)
+        diff_result = _git(["git", "diff", "--cached", "--quiet"], cwd=repo_dir,
+                           env=env, stderr=subprocess.DEVNULL)
         if diff_result.returncode == 0:
             # No changes — nothing new to push
             print(f"  ✓ no changes to export (remote is up-to-date)")
             return 0
 
-        commit_result = subprocess.run(
-            ["git", "commit", "-m", commit_msg], cwd=repo_dir,
-            capture_output=True, text=True, env=env)
+        commit_result = _git(["git", "commit", "-m", commit_msg], cwd=repo_dir, env=env)
         if commit_result.returncode != 0:
-            print(f"error: git commit failed: {commit_result.stderr.strip()}",
+            print(f"error: git commit failed: {_git_err(commit_result)}",
                   file=sys.stderr)
             return 1
 
         print(f"  pushing to {url} (branch={branch}) ...")
         push_cmd = ["git", "push", "-u", "origin", branch]
-        push_result = subprocess.run(push_cmd, cwd=repo_dir,
-                                     capture_output=True, text=True, env=env)
+        push_result = _git(push_cmd, cwd=repo_dir, env=env)
         if push_result.returncode != 0:
-            print(f"error: git push failed: {push_result.stderr.strip()}",
+            print(f"error: git push failed: {_git_err(push_result)}",
                   file=sys.stderr)
             return 1
 
@@ -695,10 +984,7 @@ def _generate_readme(root: Path, files: list[tuple[Path, str]]) -> str:
     now = datetime.now(timezone.utc).strftime("%Y-%m-%d")
 
     # Count files per knowledge dir
-    counts: dict[str, int] = {}
-    for _, rel in files:
-        top = rel.split("/")[0]
-        counts[top] = counts.get(top, 0) + 1
+    counts = Counter(rel.partition("/")[0] for _, rel in files)
 
     # Collect topic names
     topics: list[str] = []
@@ -706,30 +992,24 @@ def _generate_readme(root: Path, files: list[tuple[Path, str]]) -> str:
     if topics_dir.is_dir():
         topics = sorted(f.stem for f in topics_dir.iterdir() if f.is_file() and f.suffix == ".md")
 
-    lines = [
+    parts = [
         f"# {pack_name}",
-        f"",
+        "",
         f"Knowledge exported from project **{pack_name}** on {now}.",
-        f"",
-        f"## Contents",
-        f"",
+        "",
+        "## Contents",
+        "",
     ]
-    for kd in KNOWLEDGE_DIRS:
-        if kd in counts:
-            lines.append(f"- `{kd}/` — {counts[kd]} files")
-    lines.append("")
+    parts.extend(f"- `{kd}/` — {counts[kd]} files" for kd in KNOWLEDGE_DIRS if kd in counts)
+    parts.append("")
 
     if topics:
-        lines.append("## Topics")
-        lines.append("")
-        for t in topics:
-            lines.append(f"- {t}")
-        lines.append("")
-
-    lines.append("---")
-    lines.append("*This file is auto-generated by `fcontext export`. Read-only.*")
-    lines.append("")
-    return "\n".join(lines)
+        parts += ["## Topics", ""]
+        parts.extend(f"- {t}" for t in topics)
+        parts.append("")
+
+    parts += ["---", "*This file is auto-generated by `fcontext export`. Read-only.*", ""]
+    return "\n".join(parts)
 
 
 def _human_size(nbytes: int) -> str:
@@ -2,15 +2,25 @@
 from __future__ import annotations
 
 import hashlib
+import io
 import json
+import mmap
 import os
 import platform
+import shutil
 import subprocess
 import sys
 import tempfile
 import time
+from collections import namedtuple
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
 from pathlib import Path
-from typing import Any
+from typing import Any, TextIO
+
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json is used without it
+    orjson = None
 
 
 # Binary formats that need conversion via markitdown
@@ -38,13 +48,13 @@ TEXT_EXTS = {
 INDEXABLE_EXTS = CONVERTIBLE_EXTS | TEXT_EXTS | IMAGE_EXTS
 
 
-def _is_text_ext(path: Path) -> bool:
-    return path.suffix.lower() in TEXT_EXTS
+def _is_text_ext(path: str) -> bool:
+    return os.path.splitext(path)[1].lower() in TEXT_EXTS
 
 
-def _is_image_ext(path: Path) -> bool:
+def _is_image_ext(path: str) -> bool:
     """Check if a file has an image extension that needs OCR."""
-    return path.suffix.lower() in IMAGE_EXTS
+    return os.path.splitext(path)[1].lower() in IMAGE_EXTS
 
 
 def _indexable_exts() -> set[str]:
@@ -78,10 +88,11 @@ for result in results {
 '''
 
 
-def _ocr_image_file(source: Path, cache_path: Path, rel_path: str) -> bool:
+def _ocr_image_file(source: str, cache_path: str, rel_path: str,
+                    err: TextIO | None = None) -> bool:
     """OCR an image file via macOS Vision Framework. Returns True on success."""
     if platform.system() != "Darwin":
-        print(f"  ✗ {rel_path}: OCR requires macOS", file=sys.stderr)
+        print(f"  ✗ {rel_path}: OCR requires macOS", file=err or sys.stderr)
         return False
 
     swift_path = None
@@ -98,32 +109,50 @@ def _ocr_image_file(source: Path, cache_path: Path, rel_path: str) -> bool:
         )
 
         if result.returncode == 2:
-            print(f"  ✗ {rel_path}: failed to load image", file=sys.stderr)
+            print(f"  ✗ {rel_path}: failed to load image", file=err or sys.stderr)
             return False
         if result.returncode != 0:
             print(
                 f"  ✗ {rel_path}: OCR error (exit={result.returncode})",
-                file=sys.stderr,
+                file=err or sys.stderr,
             )
             if result.stderr:
-                print(f"    stderr: {result.stderr.strip()}", file=sys.stderr)
+                print(f"    stderr: {result.stderr.strip()}", file=err or sys.stderr)
             return False
 
         text = result.stdout.strip()
-        header = f"<!-- source: {rel_path} -->\n\n"
-        cache_path.write_text(header + text + "\n", encoding="utf-8")
+        with open(cache_path, "w", encoding="utf-8") as out:
+            out.write(f"<!-- source: {rel_path} -->\n\n{text}\n")
         return True
     except subprocess.TimeoutExpired:
-        print(f"  ✗ {rel_path}: OCR timed out", file=sys.stderr)
+        print(f"  ✗ {rel_path}: OCR timed out", file=err or sys.stderr)
         return False
     except Exception as e:
-        print(f"  ✗ {rel_path}: OCR error — {e}", file=sys.stderr)
+        print(f"  ✗ {rel_path}: OCR error — {e}", file=err or sys.stderr)
         return False
     finally:
         if swift_path is not None and os.path.exists(swift_path):
             os.unlink(swift_path)
 
 
+# Walk in parallel only when the top level has at least this many subdirs;
+# below that, thread overhead outweighs the overlapped readdir latency.
+_PARALLEL_SCAN_MIN_DIRS = 4
+_SCAN_WORKERS = 16
+
+# Directories modified this recently are re-listed on the next run rather
+# than trusted by mtime (coarse filesystem timestamps)
+_DIRSTATE_RACY_NS = 2_000_000_000
+
+# Buffer and chunk size for streaming cache writes
+_WRITE_BUFFER = 1 << 20
+
+# Progress lines buffered before a write to stdout
+_PROGRESS_LINES = 256
+
+# Compact _index.jsonl into _index.json once it grows past this size
+_JOURNAL_COMPACT_BYTES = 64 * 1024
+
 # Directories to skip
 SKIP_DIRS = {
     ".git", ".hg", ".svn", ".venv", "venv", "__pycache__",
@@ -144,76 +173,527 @@ def _index_path(root: Path) -> Path:
     return _ctx_dir(root) / "_index.json"
 
 
+def _journal_path(root: Path) -> Path:
+    return _ctx_dir(root) / "_index.jsonl"
+
+
+def _dirstate_path(root: Path) -> Path:
+    return _ctx_dir(root) / "_dirstate.json"
+
+
+def _load_dirstate(root: Path) -> dict[str, Any]:
+    """Per-directory [mtime_ns, file names, subdirs] from the last full index."""
+    try:
+        return _json_loads(_dirstate_path(root).read_bytes())
+    except (OSError, ValueError):
+        return {}
+
+
+def _json_dumps(data: Any, indent: bool = False) -> bytes:
+    """Serialize to UTF-8 JSON bytes, via orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(data, ensure_ascii=False, indent=2 if indent else None).encode("utf-8")
+
+
+def _json_loads(raw: bytes) -> Any:
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+
 def _load_index(root: Path) -> dict[str, Any]:
+    """Load the _index.json snapshot, then replay the _index.jsonl journal.
+
+    Later journal lines supersede earlier ones; a torn trailing line (from an
+    interrupted append) is ignored.
+    """
     idx = _index_path(root)
-    if idx.exists():
-        return json.loads(idx.read_text(encoding="utf-8"))
-    return {}
+    data = _json_loads(idx.read_bytes()) if idx.exists() else {}
+    journal = _journal_path(root)
+    if journal.exists():
+        with journal.open("rb") as f:
+            for line in f:
+                try:
+                    entry = _json_loads(line)
+                except ValueError:
+                    continue
+                data[entry.pop("rel")] = entry
+    return data
+
+
+def _indexed_mtime_ns(entry: dict[str, Any]) -> int:
+    """Source mtime an index entry was made from, in integer nanoseconds.
+
+    Entries written before ``mtime_ns`` was recorded carry float seconds.
+    """
+    ns = entry.get("mtime_ns")
+    if ns is None:
+        return int(entry.get("mtime", 0) * 1_000_000_000)
+    return ns
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    """Write *data* to a sibling .tmp file, fsync it, then rename over *path*.
+
+    A crash mid-write leaves the previous file intact instead of a torn one.
+    """
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+def _ensure_gitignore(root: Path) -> None:
+    """Make sure a newly created artifact is listed in .fcontext/.gitignore."""
+    from .init import ensure_gitignore
+
+    ensure_gitignore(root)
 
 
 def _save_index(root: Path, data: dict[str, Any]) -> None:
-    idx = _index_path(root)
-    idx.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
+    """Write the full snapshot; the journal is folded in, so drop it."""
+    _write_atomic(_index_path(root), _json_dumps(data, indent=True))
+    _journal_path(root).unlink(missing_ok=True)
+
+
+def _append_index(root: Path, index: dict[str, Any], rel: str) -> None:
+    """Record index[rel] as one journal line instead of rewriting the snapshot.
+
+    Once the journal outgrows _JOURNAL_COMPACT_BYTES, *index* (the full,
+    current index) is written as the new snapshot.
+    """
+    with _journal_path(root).open("ab") as f:
+        created = f.tell() == 0
+        f.write(_json_dumps({"rel": rel, **index[rel]}) + b"\n")
+        size = f.tell()
+    if created:
+        _ensure_gitignore(root)
+    if size > _JOURNAL_COMPACT_BYTES:
+        _save_index(root, index)
+
+
+# Maps every Latin-1 character that is not alphanumeric, "-" or "_" to "_"
+_SANITIZE = str.maketrans(
+    {chr(i): "_" for i in range(256) if not (chr(i).isalnum() or chr(i) in "-_")}
+)
 
 
 def _cache_filename(rel_path: str) -> str:
     """Deterministic cache filename from source relative path."""
-    h = hashlib.md5(rel_path.encode()).hexdigest()[:10]
-    stem = Path(rel_path).stem[:40]  # truncate long names
-    # sanitize stem for filesystem
-    safe = "".join(c if c.isalnum() or c in "-_" else "_" for c in stem)
+    h = hashlib.blake2b(rel_path.encode(), digest_size=5).hexdigest()
+    name = rel_path[max(rel_path.rfind("/"), rel_path.rfind(os.sep)) + 1:]
+    dot = name.rfind(".")
+    stem = (name[:dot] if dot > 0 else name)[:40]  # truncate long names
+    # sanitize stem for filesystem; the table only covers Latin-1
+    safe = stem.translate(_SANITIZE)
+    if not safe.isascii():
+        safe = "".join(c if c.isalnum() or c in "-_" else "_" for c in safe)
     return f"{safe}_{h}.md"
 
 
-def _scan_convertible(root: Path) -> list[Path]:
-    """Walk workspace and find all indexable files (binary + text)."""
-    results = []
-    exts = _indexable_exts()
-    for dirpath, dirnames, filenames in os.walk(root):
-        dirnames[:] = [d for d in dirnames if d not in SKIP_DIRS and not d.startswith(".")]
-        for fname in filenames:
-            if fname.startswith("."):
+def _cache_path(root: Path, index: dict[str, Any], rel: str) -> str:
+    """Cache file for *rel*: the indexed one if present, else a fresh name."""
+    entry = index.get(rel)
+    if entry is not None:
+        return os.path.join(root, entry["md"])
+    return os.path.join(_cache_dir(root), _cache_filename(rel))
+
+
+def _scan_dir(path: str, exts: set[str]) -> tuple[list[tuple[str, os.stat_result]], list[str]]:
+    """List one directory: (indexable (path, stat) pairs, subdirectories to descend).
+
+    DirEntry answers is_dir()/is_file() from the directory listing, and its
+    stat() is cached, so each indexable file costs at most one stat call.
+    An unreadable directory yields nothing, as os.walk did.  On macOS the
+    listing comes from getattrlistbulk when the filesystem supports it.
+    """
+    if sys.platform == "darwin":
+        from . import _darwin_walk
+        try:
+            return _darwin_walk.scan_dir(path, exts, SKIP_DIRS)
+        except OSError:
+            pass
+    files: list[tuple[str, os.stat_result]] = []
+    subdirs: list[str] = []
+    indexable = exts.__contains__
+    try:
+        it = os.scandir(path)
+    except OSError:
+        return files, subdirs
+    with it:
+        for entry in it:
+            name = entry.name
+            if name.startswith("."):
+                continue
+            if entry.is_dir(follow_symlinks=False):
+                if name not in SKIP_DIRS:
+                    subdirs.append(entry.path)
+            # Without a dot, rfind gives -1 and the slice is the last char,
+            # which never matches a ".ext" entry.
+            elif indexable(name[name.rfind("."):].lower()) and entry.is_file():
+                files.append((entry.path, entry.stat()))
+    return files, subdirs
+
+
+def _scan_dir_cached(path: str, exts: set[str], prev: dict[str, Any],
+                     state: dict[str, Any], cutoff: int
+                     ) -> tuple[list[tuple[str, os.stat_result]], list[str]]:
+    """_scan_dir that reuses *prev*'s listing while the directory's mtime holds.
+
+    Adding, removing or renaming an entry bumps the directory mtime, so an
+    unchanged mtime means the cached names are still right; only the files
+    themselves are stat'ed, to catch in-place edits.  Directories modified
+    after *cutoff* are not recorded, since a later change within the same
+    timestamp tick would go unnoticed.
+    """
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except OSError:
+        return [], []
+    cached = prev.get(path)
+    if cached is not None and cached[0] == mtime:
+        _, names, subdirs = cached
+        files = []
+        for name in names:
+            full = os.path.join(path, name)
+            try:
+                files.append((full, os.stat(full)))
+            except OSError:
                 continue
-            if Path(fname).suffix.lower() in exts:
-                results.append(Path(dirpath) / fname)
+    else:
+        files, subdirs = _scan_dir(path, exts)
+        names = [os.path.basename(f) for f, _ in files]
+    if mtime < cutoff:
+        state[path] = [mtime, names, subdirs[:]]
+    return files, subdirs
+
+
+def _scan_convertible(top: Path, dirstate: dict[str, Any] | None = None
+                      ) -> list[tuple[str, os.stat_result]]:
+    """Walk *top* and return (path, stat) for all indexable files, sorted by path.
+
+    Wide trees are listed by a thread pool (scandir releases the GIL, so
+    readdir latency overlaps); narrow ones are walked serially.  When a
+    *dirstate* dict is given, directories whose mtime it already records are
+    not re-listed, and it is replaced with the state of this walk.
+    """
+    exts = _indexable_exts()
+    scan: Any = _scan_dir
+    if dirstate is not None:
+        prev = dict(dirstate)
+        dirstate.clear()
+        cutoff = time.time_ns() - _DIRSTATE_RACY_NS
+
+        def scan(path: str, exts: set[str]) -> tuple[list[tuple[str, os.stat_result]], list[str]]:
+            return _scan_dir_cached(path, exts, prev, dirstate, cutoff)
+
+    results, subdirs = scan(str(top), exts)
+
+    if len(subdirs) < _PARALLEL_SCAN_MIN_DIRS:
+        while subdirs:
+            files, more = scan(subdirs.pop(), exts)
+            results += files
+            subdirs += more
+    else:
+        with ThreadPoolExecutor(max_workers=_SCAN_WORKERS) as pool:
+            pending = {pool.submit(scan, d, exts) for d in subdirs}
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for fut in done:
+                    files, more = fut.result()
+                    results += files
+                    pending.update(pool.submit(scan, d, exts) for d in more)
+
+    results.sort(key=lambda item: item[0])
     return results
 
 
-def _convert_file(source: Path, cache_path: Path, rel_path: str) -> bool:
+_converter: Any = None
+
+
+def _get_converter() -> Any:
+    """Return the process-wide MarkItDown instance, creating it on first use.
+
+    Pool workers each build their own on their first conversion.
+    """
+    global _converter
+    if _converter is None:
+        from markitdown import MarkItDown
+        _converter = MarkItDown()
+    return _converter
+
+
+def _convert_file(source: str, cache_path: str, rel_path: str,
+                  err: TextIO | None = None) -> bool:
     """Convert a single file to Markdown. Returns True on success."""
     try:
-        from markitdown import MarkItDown
-        converter = MarkItDown()
-        result = converter.convert(str(source))
+        result = _get_converter().convert(os.fspath(source))
         text = getattr(result, "text_content", None) or getattr(result, "text", None) or str(result)
 
-        header = f"<!-- source: {rel_path} -->\n\n"
-        cache_path.write_text(header + text, encoding="utf-8")
+        with open(cache_path, "w", encoding="utf-8", buffering=_WRITE_BUFFER) as out:
+            out.write(f"<!-- source: {rel_path} -->\n\n")
+            out.write(text)
         return True
     except Exception as e:
-        print(f"  ✗ {rel_path}: {e}", file=sys.stderr)
+        print(f"  ✗ {rel_path}: {e}", file=err or sys.stderr)
         return False
 
 
-def _copy_text_file(source: Path, cache_path: Path, rel_path: str) -> bool:
+def _copy_text_file(source: str, cache_path: str, rel_path: str,
+                    err: TextIO | None = None) -> bool:
     """Copy a text/markdown file directly to cache. Returns True on success."""
     try:
-        content = source.read_text(encoding="utf-8", errors="replace")
-        header = f"<!-- source: {rel_path} -->\n\n"
-        cache_path.write_text(header + content, encoding="utf-8")
+        with open(source, encoding="utf-8", errors="replace") as src, \
+                open(cache_path, "w", encoding="utf-8", buffering=_WRITE_BUFFER) as dst:
+            dst.write(f"<!-- source: {rel_path} -->\n\n")
+            shutil.copyfileobj(src, dst, _WRITE_BUFFER)
         return True
     except Exception as e:
-        print(f"  ✗ {rel_path}: {e}", file=sys.stderr)
+        print(f"  ✗ {rel_path}: {e}", file=err or sys.stderr)
         return False
 
 
-def _index_one(source: Path, cache_path: Path, rel_path: str) -> bool:
-    """Index a single file: copy text files, OCR images, convert binaries."""
+def _index_one(source: str, cache_path: str, rel_path: str,
+               err: TextIO | None = None) -> bool:
+    """Index a single file: copy text files, OCR images, convert binaries.
+
+    Error lines go to *err*, or stderr when it is None.
+    """
     if _is_text_ext(source):
-        return _copy_text_file(source, cache_path, rel_path)
+        return _copy_text_file(source, cache_path, rel_path, err)
     if _is_image_ext(source):
-        return _ocr_image_file(source, cache_path, rel_path)
-    return _convert_file(source, cache_path, rel_path)
+        return _ocr_image_file(source, cache_path, rel_path, err)
+    return _convert_file(source, cache_path, rel_path, err)
+
+
+def _convert_worker(task: tuple[str, str, str]) -> tuple[bool, str]:
+    """Process-pool entry point: convert one binary file.
+
+    Returns (ok, error output); errors are captured so the parent can print
+    them in order instead of workers writing to stderr concurrently.
+    """
+    source, cache_path, rel_path = task
+    err = io.StringIO()
+    ok = _convert_file(source, cache_path, rel_path, err)
+    return ok, err.getvalue()
+
+
+def _cached_mds(root: Path) -> set[str]:
+    """Return the root-relative paths of every file currently in the cache.
+
+    One scandir of _cache replaces a stat per indexed file when checking
+    whether an index entry's markdown still exists.
+    """
+    cache = _cache_dir(root)
+    prefix = str(cache.relative_to(root)) + os.sep
+    try:
+        with os.scandir(cache) as it:
+            return {prefix + entry.name for entry in it}
+    except OSError:
+        return set()
+
+
+_Job = namedtuple("_Job", "source cache_path rel st digest")
+
+
+def _content_hash(path: str, size: int) -> str:
+    """blake2b-128 hex digest of a file's bytes, read through mmap."""
+    h = hashlib.blake2b(digest_size=16)
+    if size:
+        with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+            h.update(m)
+    return h.hexdigest()
+
+
+def _copy_converted(src: str, cache_path: str, rel_path: str,
+                    err: TextIO | None = None) -> bool:
+    """Reuse another file's converted markdown under *rel_path*'s source header."""
+    try:
+        with open(src, encoding="utf-8") as f, \
+                open(cache_path, "w", encoding="utf-8", buffering=_WRITE_BUFFER) as out:
+            f.readline()  # "<!-- source: ... -->"
+            f.readline()  # blank line after it
+            out.write(f"<!-- source: {rel_path} -->\n\n")
+            shutil.copyfileobj(f, out, _WRITE_BUFFER)
+        return True
+    except Exception as e:
+        print(f"  ✗ {rel_path}: {e}", file=err or sys.stderr)
+        return False
+
+
+def _prefetch(path: str) -> None:
+    """Ask the kernel to start reading *path* into the page cache.
+
+    A hint only: a no-op where posix_fadvise is unavailable or fails.
+    """
+    if not hasattr(os, "posix_fadvise"):
+        return
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def _prefetch_ahead(jobs: list[_Job], i: int, window: int) -> None:
+    """While job *i* runs, prefetch the source *window* positions later."""
+    if i + window < len(jobs):
+        _prefetch(jobs[i + window].source)
+
+
+class _Progress:
+    """Buffer per-file progress lines and write them to stdout in batches.
+
+    Flushes every _PROGRESS_LINES lines or once a second, whichever first.
+    Error output goes through report(), which flushes the pending lines
+    first so an error follows its "→" line.
+    """
+
+    def __init__(self) -> None:
+        self.lines: list[str] = []
+        self.last = time.monotonic()
+
+    def add(self, line: str) -> None:
+        self.lines.append(line)
+        if len(self.lines) >= _PROGRESS_LINES or time.monotonic() - self.last >= 1.0:
+            self.flush()
+
+    def report(self, err: str) -> None:
+        if err:
+            self.flush()
+            sys.stderr.write(err)
+
+    def flush(self) -> None:
+        if self.lines:
+            sys.stdout.write("\n".join(self.lines) + "\n")
+            sys.stdout.flush()
+            self.lines.clear()
+        self.last = time.monotonic()
+
+
+def _index_files(root: Path, files: list[tuple[str, os.stat_result]], index: dict[str, Any],
+                 force: bool) -> tuple[int, int, int]:
+    """Index stale *files* into the cache, updating *index* in place.
+
+    Text copies and OCR run inline; markitdown conversions are CPU-bound and
+    fan out to a process pool when there is more than one.  Files that need
+    conversion are hashed first: one whose content is unchanged is only
+    re-stamped, and one whose content matches another file reuses that
+    file's markdown instead of being converted again.
+    Returns (converted, skipped, failed).
+    """
+    present = _cached_mds(root)
+    cut = len(os.path.join(str(root), ""))  # walked paths all start with root
+    stale: list[tuple[str, str, os.stat_result]]
+    if force:
+        stale = [(path, path[cut:], st) for path, st in files]
+    else:
+        # Skip if already indexed and not stale
+        lookup = index.get
+        stale = []
+        for path, st in files:
+            rel = path[cut:]
+            entry = lookup(rel)
+            if entry is None or entry["md"] not in present or _indexed_mtime_ns(entry) < st.st_mtime_ns:
+                stale.append((path, rel, st))
+    skipped = len(files) - len(stale)
+
+    # Converted markdown by (size, hash); entries redone in this run are
+    # left out since their cache files are about to be rewritten.
+    redo = {rel for _, rel, _ in stale}
+    by_hash = {
+        (entry["size"], entry["hash"]): os.path.join(root, entry["md"])
+        for rel, entry in index.items()
+        if "hash" in entry and entry["md"] in present and rel not in redo
+    }
+
+    inline: list[_Job] = []
+    binary: list[_Job] = []
+    copies: list[tuple[_Job, str, _Job | None]] = []
+    first: dict[tuple[int, str], _Job] = {}
+    for path, rel, st in stale:
+        if _is_text_ext(path):
+            inline.append(_Job(path, _cache_path(root, index, rel), rel, st, None))
+            continue
+        digest = _content_hash(path, st.st_size)
+        entry = index.get(rel)
+        if not force and entry is not None and entry.get("hash") == digest and entry["md"] in present:
+            entry.pop("mtime", None)
+            entry["mtime_ns"] = st.st_mtime_ns  # touched, not modified
+            skipped += 1
+            continue
+        job = _Job(path, _cache_path(root, index, rel), rel, st, digest)
+        key = (st.st_size, digest)
+        if key in by_hash:
+            copies.append((job, by_hash[key], None))
+        elif key in first:
+            copies.append((job, first[key].cache_path, first[key]))
+        else:
+            first[key] = job
+            (inline if _is_image_ext(path) else binary).append(job)
+
+    progress = _Progress()
+    results: list[tuple[_Job, bool]] = []
+    for i, job in enumerate(inline):
+        _prefetch_ahead(inline, i, 1)
+        progress.add(f"  → {job.rel}")
+        if _is_image_ext(job.source):  # OCR: show the line before the wait
+            progress.flush()
+        err = io.StringIO()
+        results.append((job, _index_one(job.source, job.cache_path, job.rel, err)))
+        progress.report(err.getvalue())
+
+    workers = min(os.cpu_count() or 1, len(binary))
+    # Keep the next sources' reads in flight while the current ones convert
+    window = 2 * workers if workers > 1 else 1
+    if workers > 1:
+        for job in binary[workers:window]:
+            _prefetch(job.source)
+        tasks = [(job.source, job.cache_path, job.rel) for job in binary]
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for i, (job, (ok, err_text)) in enumerate(zip(binary, pool.map(_convert_worker, tasks))):
+                _prefetch_ahead(binary, i, window)
+                progress.add(f"  → {job.rel}")
+                progress.report(err_text)
+                results.append((job, ok))
+    else:
+        for i, job in enumerate(binary):
+            _prefetch_ahead(binary, i, window)
+            progress.add(f"  → {job.rel}")
+            progress.flush()
+            results.append((job, _convert_file(job.source, job.cache_path, job.rel)))
+
+    done = {job.rel for job, ok in results if ok}
+    for job, src, primary in copies:
+        progress.add(f"  → {job.rel}")
+        err = io.StringIO()
+        ok = (primary is None or primary.rel in done) and _copy_converted(src, job.cache_path, job.rel, err)
+        progress.report(err.getvalue())
+        results.append((job, ok))
+    progress.flush()
+
+    converted = failed = 0
+    for job, ok in results:
+        if ok:
+            entry = {
+                "md": job.cache_path[cut:],
+                "mtime_ns": job.st.st_mtime_ns,
+                "size": job.st.st_size,
+                "indexed_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+            }
+            if job.digest is not None:
+                entry["hash"] = job.digest
+            index[job.rel] = entry
+            converted += 1
+        else:
+            failed += 1
+    return converted, skipped, failed
 
 
 def run_index_file(root: Path, target: Path, force: bool = False) -> int:
@@ -232,30 +712,31 @@ def run_index_file(root: Path, target: Path, force: bool = False) -> int:
         return 1
 
     index = _load_index(root)
-    mtime = target.stat().st_mtime
+    st = target.stat()
+    mtime_ns = st.st_mtime_ns
 
     # Skip if up-to-date
     if not force and rel in index:
         cached_md = root / index[rel]["md"]
-        if cached_md.exists() and index[rel].get("mtime", 0) >= mtime:
+        if cached_md.exists() and _indexed_mtime_ns(index[rel]) >= mtime_ns:
             print(f"  ✓ {rel} (up-to-date)")
             md_path = root / index[rel]["md"]
             print(f"  → {md_path}")
             return 0
 
-    cache_name = _cache_filename(rel)
-    cache_path = cache / cache_name
+    cache_path = _cache_path(root, index, rel)
+    md = cache_path[len(os.path.join(str(root), "")):]
 
     print(f"  → {rel}")
-    if _index_one(target, cache_path, rel):
+    if _index_one(str(target), cache_path, rel):
         index[rel] = {
-            "md": str(cache_path.relative_to(root)),
-            "mtime": mtime,
-            "size": target.stat().st_size,
+            "md": md,
+            "mtime_ns": mtime_ns,
+            "size": st.st_size,
             "indexed_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
         }
-        _save_index(root, index)
-        print(f"  ✓ cached: {cache_path.relative_to(root)}")
+        _append_index(root, index, rel)
+        print(f"  ✓ cached: {md}")
         return 0
     else:
         return 1
@@ -279,48 +760,12 @@ def run_index_dir(root: Path, target_dir: Path, force: bool = False) -> int:
     index = _load_index(root)
 
     # Scan only within target_dir
-    files = []
-    exts = _indexable_exts()
-    for dirpath, dirnames, filenames in os.walk(target_dir):
-        dirnames[:] = [d for d in dirnames if d not in SKIP_DIRS and not d.startswith(".")]
-        for fname in filenames:
-            if fname.startswith("."):
-                continue
-            if Path(fname).suffix.lower() in exts:
-                files.append(Path(dirpath) / fname)
-
-    converted = 0
-    skipped = 0
-    failed = 0
+    files = _scan_convertible(target_dir)
 
     print(f"Scanning {rel_dir}/ ...")
     print(f"Found {len(files)} indexable files\n")
 
-    for fpath in files:
-        rel = str(fpath.relative_to(root))
-        mtime = fpath.stat().st_mtime
-
-        if not force and rel in index:
-            cached_md = root / index[rel]["md"]
-            if cached_md.exists() and index[rel].get("mtime", 0) >= mtime:
-                skipped += 1
-                continue
-
-        cache_name = _cache_filename(rel)
-        cache_path = cache / cache_name
-
-        print(f"  \u2192 {rel}")
-        if _index_one(fpath, cache_path, rel):
-            index[rel] = {
-                "md": str(cache_path.relative_to(root)),
-                "mtime": mtime,
-                "size": fpath.stat().st_size,
-                "indexed_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
-            }
-            converted += 1
-        else:
-            failed += 1
-
+    converted, skipped, failed = _index_files(root, files, index, force)
     _save_index(root, index)
 
     print(f"\nDone: {converted} indexed, {skipped} up-to-date, {failed} failed")
@@ -334,42 +779,18 @@ def run_index(root: Path, force: bool = False) -> int:
     cache.mkdir(parents=True, exist_ok=True)
 
     index = _load_index(root)
-    files = _scan_convertible(root)
-
-    converted = 0
-    skipped = 0
-    failed = 0
+    dirstate = _load_dirstate(root)
+    files = _scan_convertible(root, dirstate)
 
     print(f"Scanning {root} ...")
     print(f"Found {len(files)} indexable files\n")
 
-    for fpath in files:
-        rel = str(fpath.relative_to(root))
-        mtime = fpath.stat().st_mtime
-
-        # Skip if already indexed and not stale
-        if not force and rel in index:
-            cached_md = root / index[rel]["md"]
-            if cached_md.exists() and index[rel].get("mtime", 0) >= mtime:
-                skipped += 1
-                continue
-
-        cache_name = _cache_filename(rel)
-        cache_path = cache / cache_name
-
-        print(f"  → {rel}")
-        if _index_one(fpath, cache_path, rel):
-            index[rel] = {
-                "md": str(cache_path.relative_to(root)),
-                "mtime": mtime,
-                "size": fpath.stat().st_size,
-                "indexed_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
-            }
-            converted += 1
-        else:
-            failed += 1
-
+    converted, skipped, failed = _index_files(root, files, index, force)
     _save_index(root, index)
+    created = not _dirstate_path(root).exists()
+    _write_atomic(_dirstate_path(root), _json_dumps(dirstate))
+    if created:
+        _ensure_gitignore(root)
 
     print(f"\nDone: {converted} indexed, {skipped} up-to-date, {failed} failed")
     print(f"Index: {_index_path(root)}")
@@ -380,29 +801,29 @@ def run_status(root: Path) -> int:
     """Show index statistics."""
     index = _load_index(root)
     files = _scan_convertible(root)
-    rel_set = {str(f.relative_to(root)) for f in files}
-
-    indexed = set(index.keys())
-    pending = rel_set - indexed
-    orphaned = indexed - rel_set
-
-    stale = 0
-    for rel in indexed & rel_set:
-        fpath = root / rel
-        if fpath.exists() and fpath.stat().st_mtime > index[rel].get("mtime", 0):
+    cut = len(os.path.join(str(root), ""))
+
+    # One pass over the walk: each file is pending, stale or up to date
+    pending = stale = 0
+    for path, st in files:
+        entry = index.get(path[cut:])
+        if entry is None:
+            pending += 1
+        elif st.st_mtime_ns > _indexed_mtime_ns(entry):
             stale += 1
+    orphaned = len(index) - (len(files) - pending)
 
     print(f"Workspace:  {root}")
-    print(f"Convertible: {len(rel_set)} files")
-    print(f"Indexed:     {len(indexed)} files")
-    print(f"Pending:     {len(pending)} files")
+    print(f"Convertible: {len(files)} files")
+    print(f"Indexed:     {len(index)} files")
+    print(f"Pending:     {pending} files")
     print(f"Stale:       {stale} files")
-    print(f"Orphaned:    {len(orphaned)} entries")
+    print(f"Orphaned:    {orphaned} entries")
 
     if pending:
-        print(f"\nRun 'fcontext index' to index {len(pending) + stale} files")
+        print(f"\nRun 'fcontext index' to index {pending + stale} files")
     if orphaned:
-        print(f"Run 'fcontext clean' to remove {len(orphaned)} orphaned entries")
+        print(f"Run 'fcontext clean' to remove {orphaned} orphaned entries")
 
     return 0
 
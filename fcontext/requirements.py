@@ -18,13 +18,16 @@ Hierarchy
 from __future__ import annotations
 
 import csv
+import inspect
 import io
+import json
 import os
 import sys
 import time
-from collections import defaultdict
+from collections import Counter, defaultdict
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator
 
 # ── Constants ─────────────────────────────────────────────────────────────────
 
@@ -41,6 +44,12 @@ TYPE_PREFIX = {
 
 STATUS_FLOW = ("draft", "planning", "active", "done", "archived", "cancelled")
 
+# Status indicators shown by list, trace and tree
+STATUS_ICON = {
+    "draft": "○", "planning": "◐", "active": "●",
+    "done": "✓", "archived": "▪", "cancelled": "✗",
+}
+
 PRIORITY_LEVELS = ("P0", "P1", "P2", "P3")  # P0=urgent … P3=low
 
 # Typed relationship links between items (beyond parent-child hierarchy)
@@ -77,24 +86,144 @@ def _docs_dir(root: Path) -> Path:
 
 # ── CSV I/O ───────────────────────────────────────────────────────────────────
 
+# Parsed items per CSV path, tagged with the (mtime_ns, size) they were read at
+_ITEMS_CACHE: dict[str, tuple[int, int, list[dict[str, str]]]] = {}
+
+# Open _items_txn blocks per CSV path, and those whose items were modified
+_ACTIVE_TXNS: dict[str, list[dict[str, str]]] = {}
+_TXN_DIRTY: set[str] = set()
+
+# Markdown appends held back while an _items_txn is open, by doc path
+_PENDING_APPENDS: dict[Path, list[str]] = {}
+_pending_size = 0
+_APPEND_FLUSH_AT = 64 * 1024
+
+# Buffer size for items.csv and markdown doc I/O
+_IO_BUFFER = 1 << 20
+
+
 def _load_items(root: Path) -> list[dict[str, str]]:
-    """Load all items from CSV."""
-    csv_file = _csv_path(root)
-    if not csv_file.exists():
+    """Load all items from CSV.
+
+    Parsed rows are reused while the file's mtime and size are unchanged.
+    Each call returns its own copy of them, so a change reaches the cache
+    only through a successful _save_items; inside an _items_txn the block's
+    shared list is returned instead.
+    """
+    csv_file = str(_csv_path(root))
+    txn_items = _ACTIVE_TXNS.get(csv_file)
+    if txn_items is not None:
+        return txn_items
+    try:
+        st = os.stat(csv_file)
+    except FileNotFoundError:
         return []
-    with open(csv_file, "r", encoding="utf-8", newline="") as f:
-        reader = csv.DictReader(f)
-        return list(reader)
+    cached = _ITEMS_CACHE.get(csv_file)
+    if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        items = cached[2]
+    else:
+        items = []
+        with open(csv_file, "r", encoding="utf-8", newline="", buffering=_IO_BUFFER) as f:
+            reader = csv.reader(f)
+            header = next(reader, [])
+            width = len(header)
+            for row in reader:
+                if not row:
+                    continue
+                if len(row) < width:
+                    row += [""] * (width - len(row))
+                item = dict(zip(header, row))
+                # Canonical upper-case IDs, so lookups need no per-row .upper()
+                item["id"] = item["id"].upper()
+                if item.get("parent"):
+                    item["parent"] = item["parent"].upper()
+                items.append(item)
+        _ITEMS_CACHE[csv_file] = (st.st_mtime_ns, st.st_size, items)
+    return [dict(item) for item in items]
 
 
 def _save_items(root: Path, items: list[dict[str, str]]) -> None:
-    """Save all items to CSV."""
+    """Save all items to CSV (deferred to the end of an open _items_txn)."""
     csv_file = _csv_path(root)
+    if str(csv_file) in _ACTIVE_TXNS:
+        _TXN_DIRTY.add(str(csv_file))
+        return
     csv_file.parent.mkdir(parents=True, exist_ok=True)
-    with open(csv_file, "w", encoding="utf-8", newline="") as f:
-        writer = csv.DictWriter(f, fieldnames=CSV_COLUMNS)
-        writer.writeheader()
-        writer.writerows(items)
+    # Write a sibling file and swap it in, so a crash never leaves a
+    # truncated items.csv; fsync only when FCONTEXT_FSYNC=1 asks for it.
+    tmp = csv_file.with_suffix(".csv.tmp")
+    with open(tmp, "w", encoding="utf-8", newline="", buffering=_IO_BUFFER) as f:
+        writer = csv.writer(f)
+        writer.writerow(CSV_COLUMNS)
+        writer.writerows([item.get(col, "") for col in CSV_COLUMNS] for item in items)
+        f.flush()
+        if os.environ.get("FCONTEXT_FSYNC") == "1":
+            os.fsync(f.fileno())
+    os.replace(tmp, csv_file)
+    st = os.stat(csv_file)
+    # Cache a copy: the caller may keep changing *items* without saving
+    _ITEMS_CACHE[str(csv_file)] = (st.st_mtime_ns, st.st_size, [dict(item) for item in items])
+
+
+@contextmanager
+def _items_txn(root: Path) -> Iterator[list[dict[str, str]]]:
+    """Load items once and write them back once, however many commands run.
+
+    Inside the block _load_items returns the same list and _save_items only
+    marks it modified; the CSV is written, and held-back doc appends are
+    flushed, when the block exits normally. Nested blocks join the outer one.
+    """
+    key = str(_csv_path(root))
+    if key in _ACTIVE_TXNS:
+        yield _ACTIVE_TXNS[key]
+        return
+    items = _load_items(root)
+    _ACTIVE_TXNS[key] = items
+    try:
+        yield items
+    except BaseException:
+        # The shared list holds the abandoned changes: forget it
+        _ITEMS_CACHE.pop(key, None)
+        if not _ACTIVE_TXNS.keys() - {key}:
+            _discard_appends()
+        raise
+    finally:
+        del _ACTIVE_TXNS[key]
+        dirty = key in _TXN_DIRTY
+        _TXN_DIRTY.discard(key)
+    if dirty:
+        _save_items(root, items)
+    if not _ACTIVE_TXNS:
+        _flush_appends()
+
+
+def _append_doc(doc_path: Path, text: str) -> None:
+    """Append *text* to a markdown doc, held back while an _items_txn is open."""
+    global _pending_size
+    if not _ACTIVE_TXNS:
+        with open(doc_path, "a", encoding="utf-8", buffering=_IO_BUFFER) as f:
+            f.write(text)
+        return
+    _PENDING_APPENDS.setdefault(doc_path, []).append(text)
+    _pending_size += len(text)
+    if _pending_size > _APPEND_FLUSH_AT:
+        _flush_appends()
+
+
+def _flush_appends() -> None:
+    """Write out held-back doc appends, one write per doc."""
+    pending = list(_PENDING_APPENDS.items())
+    _discard_appends()
+    for doc_path, parts in pending:
+        with open(doc_path, "a", encoding="utf-8", buffering=_IO_BUFFER) as f:
+            f.write("".join(parts))
+
+
+def _discard_appends() -> None:
+    """Drop held-back doc appends."""
+    global _pending_size
+    _PENDING_APPENDS.clear()
+    _pending_size = 0
 
 
 def _next_id(items: list[dict[str, str]], item_type: str) -> str:
@@ -112,14 +241,23 @@ def _next_id(items: list[dict[str, str]], item_type: str) -> str:
 
 
 def _find_item(items: list[dict[str, str]], item_id: str) -> dict[str, str] | None:
-    """Find an item by ID (case-insensitive)."""
+    """Find an item by ID (case-insensitive; item IDs are stored upper-case)."""
     item_id_upper = item_id.upper()
     for item in items:
-        if item["id"].upper() == item_id_upper:
+        if item["id"] == item_id_upper:
             return item
     return None
 
 
+def _build_index(items: list[dict[str, str]]) -> dict[str, dict[str, str]]:
+    """Map ID → item, for repeated lookups within one command.
+
+    Built back to front so a duplicated ID resolves to its first row, as
+    _find_item does.
+    """
+    return {item["id"]: item for item in reversed(items)}
+
+
 def _now() -> str:
     return time.strftime("%Y-%m-%d", time.localtime())
 
@@ -129,10 +267,9 @@ def _now() -> str:
 _DEFAULT_SECTION = "## 描述\n\n"
 
 
-def _doc_template(item_id: str, title: str, item_type: str) -> str:
-    """Generate a Markdown doc template for a new item."""
-    sections = {
-        "roadmap": """\
+# Body of a new item doc, by item type
+_SECTIONS = {
+    "roadmap": """\
 ## 愿景
 
 <!-- 描述这个Roadmap的长期目标和愿景 -->
@@ -145,7 +282,7 @@ def _doc_template(item_id: str, title: str, item_type: str) -> str:
 
 <!-- 如何衡量这个Roadmap的成功 -->
 """,
-        "epic": """\
+    "epic": """\
 ## 背景
 
 <!-- 为什么需要这个Epic -->
@@ -167,7 +304,7 @@ graph TD
     C --> D[完成]
 ```
 """,
-        "requirement": """\
+    "requirement": """\
 ## 描述
 
 <!-- 详细描述这个需求 -->
@@ -194,7 +331,7 @@ sequenceDiagram
 
 <!-- 依赖、风险、相关文档 -->
 """,
-        "story": """\
+    "story": """\
 ## 用户故事
 
 <!-- 作为<角色>，我想要<功能>，以便<价值> -->
@@ -208,7 +345,7 @@ sequenceDiagram
 ## 备注
 
 """,
-        "task": """\
+    "task": """\
 ## 描述
 
 <!-- 具体要做什么 -->
@@ -222,7 +359,7 @@ sequenceDiagram
 ## 备注
 
 """,
-        "bug": """\
+    "bug": """\
 ## 现象
 
 <!-- 出了什么问题 -->
@@ -246,14 +383,17 @@ sequenceDiagram
 - OS:
 - Version:
 """,
-    }
+}
 
+
+def _doc_template(item_id: str, title: str, item_type: str) -> str:
+    """Generate a Markdown doc template for a new item."""
     return f"""\
 # {item_id}: {title}
 
 > Type: {item_type} | Created: {_now()}
 
-{sections.get(item_type, _DEFAULT_SECTION)}
+{_SECTIONS.get(item_type, _DEFAULT_SECTION)}
 """
 
 
@@ -288,11 +428,12 @@ def req_add(root: Path, item_type: str, title: str,
         return 1
 
     items = _load_items(root)
+    by_id = _build_index(items)
 
     # Validate parent
     if parent:
         parent = parent.upper()
-        parent_item = _find_item(items, parent)
+        parent_item = by_id.get(parent)
         if parent_item is None:
             print(f"error: parent '{parent}' not found", file=sys.stderr)
             return 1
@@ -313,7 +454,7 @@ def req_add(root: Path, item_type: str, title: str,
             if ltype not in LINK_TYPES:
                 print(f"error: unknown link type '{ltype}'. Must be one of: {', '.join(LINK_TYPES)}", file=sys.stderr)
                 return 1
-            if _find_item(items, lid.strip()) is None:
+            if lid.strip().upper() not in by_id:
                 print(f"error: link target '{lid.strip()}' not found", file=sys.stderr)
                 return 1
 
@@ -362,40 +503,35 @@ def req_list(root: Path, filter_type: str | None = None,
              filter_status: str | None = None,
              filter_parent: str | None = None) -> int:
     """List items with optional filters."""
-    items = _load_items(root)
+    fp = filter_parent.upper() if filter_parent else None
 
-    if filter_type:
-        items = [i for i in items if i["type"] == filter_type]
-    if filter_status:
-        items = [i for i in items if i["status"] == filter_status]
-    if filter_parent:
-        fp = filter_parent.upper()
-        items = [i for i in items if i["parent"].upper() == fp]
+    # One pass: apply the filters and track column widths
+    items = []
+    w_id = w_type = w_status = 0
+    for i in _load_items(root):
+        if filter_type and i["type"] != filter_type:
+            continue
+        if filter_status and i["status"] != filter_status:
+            continue
+        if fp and i["parent"] != fp:
+            continue
+        items.append(i)
+        w_id = max(w_id, len(i["id"]))
+        w_type = max(w_type, len(i["type"]))
+        w_status = max(w_status, len(i["status"]))
+    w_pri = 2
 
     if not items:
         print("  (no items found)")
         return 0
 
-    # Column widths
-    w_id = max(len(i["id"]) for i in items)
-    w_type = max(len(i["type"]) for i in items)
-    w_status = max(len(i["status"]) for i in items)
-    w_pri = 2
-    w_title = max(len(i["title"][:50]) for i in items)
-
     # Header
     hdr = f"  {'ID':<{w_id}}  {'TYPE':<{w_type}}  {'PRI':<{w_pri}}  {'STATUS':<{w_status}}  {'TITLE'}"
     print(hdr)
     print("  " + "─" * (len(hdr) - 2))
 
-    # Status color indicators
-    status_icon = {
-        "draft": "○", "planning": "◐", "active": "●",
-        "done": "✓", "archived": "▪", "cancelled": "✗",
-    }
-
     for item in items:
-        icon = status_icon.get(item["status"], " ")
+        icon = STATUS_ICON.get(item["status"], " ")
         title = item["title"][:50]
         parent_hint = f"  ↑{item['parent']}" if item["parent"] else ""
         print(f"  {item['id']:<{w_id}}  {item['type']:<{w_type}}  {item['priority']:<{w_pri}}  "
@@ -408,7 +544,8 @@ def req_list(root: Path, filter_type: str | None = None,
 def req_show(root: Path, item_id: str) -> int:
     """Show detailed info for a single item."""
     items = _load_items(root)
-    item = _find_item(items, item_id)
+    by_id = _build_index(items)
+    item = by_id.get(item_id.upper())
     if item is None:
         print(f"error: '{item_id}' not found", file=sys.stderr)
         return 1
@@ -439,19 +576,20 @@ def req_show(root: Path, item_id: str) -> int:
             link_entry = link_entry.strip()
             if ":" in link_entry:
                 ltype, lid = link_entry.split(":", 1)
-                target = _find_item(items, lid.strip())
+                target = by_id.get(lid.strip().upper())
                 label = f"{target['title']}" if target else "(not found)"
                 print(f"  ║   {ltype} → {lid.strip()} {label}")
 
-    # Reverse links (items that link TO this one)
+    # Reverse links (items that link TO this one) and children, in one pass
+    this_id = item["id"]
     reverse_links = []
+    children = []
     for other in items:
-        for link_entry in other.get("links", "").split(","):
-            link_entry = link_entry.strip()
-            if ":" in link_entry:
-                ltype, lid = link_entry.split(":", 1)
-                if lid.strip().upper() == item["id"].upper():
-                    reverse_links.append((ltype, other["id"], other["title"]))
+        for ltype, lid in _parse_links(other.get("links", "")):
+            if lid == this_id:
+                reverse_links.append((ltype, other["id"], other["title"]))
+        if other["parent"] == this_id:
+            children.append(other)
     if reverse_links:
         if not item.get("links"):
             print(f"  ║")
@@ -460,7 +598,6 @@ def req_show(root: Path, item_id: str) -> int:
             print(f"  ║   {oid} {ltype} → this  {otitle}")
 
     # Children
-    children = [i for i in items if i["parent"].upper() == item["id"].upper()]
     if children:
         print(f"  ║")
         print(f"  ║ Children ({len(children)}):")
@@ -502,13 +639,15 @@ def req_set(root: Path, item_id: str, field: str, value: str) -> int:
         return 1
 
     items = _load_items(root)
-    item = _find_item(items, item_id)
+    by_id = _build_index(items)
+    item = by_id.get(item_id.upper())
     if item is None:
         print(f"error: '{item_id}' not found", file=sys.stderr)
         return 1
 
     if field == "parent" and value:
-        new_parent = _find_item(items, value)
+        value = value.upper()
+        new_parent = by_id.get(value)
         if new_parent is None:
             print(f"error: parent '{value}' not found", file=sys.stderr)
             return 1
@@ -556,8 +695,7 @@ def _append_changelog(root: Path, item_id: str, field: str,
         return
     now = time.strftime("%Y-%m-%d %H:%M", time.localtime())
     entry = f"\n\n---\n\n**Change** ({now}): {field} `{old_value}` → `{new_value}`\n"
-    with open(doc_path, "a", encoding="utf-8") as f:
-        f.write(entry)
+    _append_doc(doc_path, entry)
 
 
 def req_link(root: Path, item_id: str, link_type: str, target_id: str) -> int:
@@ -568,12 +706,13 @@ def req_link(root: Path, item_id: str, link_type: str, target_id: str) -> int:
         return 1
 
     items = _load_items(root)
-    item = _find_item(items, item_id)
+    by_id = _build_index(items)
+    item = by_id.get(item_id.upper())
     if item is None:
         print(f"error: '{item_id}' not found", file=sys.stderr)
         return 1
 
-    target = _find_item(items, target_id)
+    target = by_id.get(target_id.upper())
     if target is None:
         print(f"error: target '{target_id}' not found", file=sys.stderr)
         return 1
@@ -603,13 +742,12 @@ def req_link(root: Path, item_id: str, link_type: str, target_id: str) -> int:
 def req_trace(root: Path, item_id: str) -> int:
     """Trace the evolution chain of a requirement."""
     items = _load_items(root)
-    item = _find_item(items, item_id)
+    by_id = _build_index(items)
+    item = by_id.get(item_id.upper())
     if item is None:
         print(f"error: '{item_id}' not found", file=sys.stderr)
         return 1
 
-    by_id = {i["id"].upper(): i for i in items}
-
     # Build full graph: forward and reverse links
     # Forward: item has links field pointing to targets
     # Reverse: other items' links point to this item
@@ -617,13 +755,13 @@ def req_trace(root: Path, item_id: str) -> int:
     reverse: dict[str, list[tuple[str, str]]] = defaultdict(list)  # id -> [(type, source_id)]
 
     for i in items:
-        iid = i["id"].upper()
+        iid = i["id"]
         for ltype, lid in _parse_links(i.get("links", "")):
             graph[iid].append((ltype, lid))
             reverse[lid].append((ltype, iid))
 
     # Walk backward to find the origin
-    origin = item["id"].upper()
+    origin = item["id"]
     visited = {origin}
     while True:
         preds = reverse.get(origin, [])
@@ -644,21 +782,13 @@ def req_trace(root: Path, item_id: str) -> int:
     chain.append((None, current))
 
     while True:
-        succs = graph.get(current, [])
+        # Current's own links first, then items whose links point at current
+        succs = graph.get(current, []) + reverse.get(current, [])
         found_next = None
-        for ltype, tgt in succs:
-            if ltype in ("supersedes", "evolves") and tgt not in visited_fwd:
-                found_next = (ltype, tgt)
+        for ltype, nid in succs:
+            if ltype in ("supersedes", "evolves") and nid not in visited_fwd:
+                found_next = (ltype, nid)
                 break
-        # Also check reverse: someone supersedes/evolves current
-        if found_next is None:
-            for other_id, links in graph.items():
-                for ltype, tgt in links:
-                    if tgt == current and ltype in ("supersedes", "evolves") and other_id not in visited_fwd:
-                        found_next = (ltype, other_id)
-                        break
-                if found_next:
-                    break
         if found_next is None:
             break
         ltype, nid = found_next
@@ -666,12 +796,6 @@ def req_trace(root: Path, item_id: str) -> int:
         chain.append((ltype, nid))
         current = nid
 
-    # Status indicators
-    status_icon = {
-        "draft": "○", "planning": "◐", "active": "●",
-        "done": "✓", "archived": "▪", "cancelled": "✗",
-    }
-
     # Print chain
     print(f"\n  Evolution Trace for {item['id']}")
     print(f"  {'=' * 40}")
@@ -679,8 +803,8 @@ def req_trace(root: Path, item_id: str) -> int:
         node = by_id.get(iid)
         if node is None:
             continue
-        icon = status_icon.get(node["status"], " ")
-        marker = "  ▸ " if iid == item["id"].upper() else "    "
+        icon = STATUS_ICON.get(node["status"], " ")
+        marker = "  ▸ " if iid == item["id"] else "    "
         prefix = ""
         if ltype:
             prefix = f"  └─ {ltype} ──▶ "
@@ -707,7 +831,11 @@ def req_trace(root: Path, item_id: str) -> int:
 
 def req_board(root: Path) -> int:
     """Show a Kanban-style board grouped by status."""
-    items = _load_items(root)
+    return _render_board(_load_items(root))
+
+
+def _render_board(items: list[dict[str, str]]) -> int:
+    """Print the Kanban board for already-loaded items."""
     if not items:
         print("  (no items)")
         return 0
@@ -745,29 +873,23 @@ def req_tree(root: Path) -> int:
         return 0
 
     # Build lookup
-    by_id = {item["id"].upper(): item for item in items}
+    by_id = _build_index(items)
     children_of: dict[str, list[dict]] = defaultdict(list)
     roots = []
 
     for item in items:
-        parent = item["parent"].upper() if item["parent"] else ""
+        parent = item["parent"]
         if parent and parent in by_id:
             children_of[parent].append(item)
         else:
             roots.append(item)
 
-    # Status indicators
-    status_icon = {
-        "draft": "○", "planning": "◐", "active": "●",
-        "done": "✓", "archived": "▪", "cancelled": "✗",
-    }
-
     def _print_tree(item: dict, prefix: str, is_last: bool):
         connector = "└── " if is_last else "├── "
-        icon = status_icon.get(item["status"], " ")
+        icon = STATUS_ICON.get(item["status"], " ")
         print(f"  {prefix}{connector}{icon} {item['id']} [{item['priority']}] {item['title'][:45]}")
 
-        kids = children_of.get(item["id"].upper(), [])
+        kids = children_of.get(item["id"], [])
         child_prefix = prefix + ("    " if is_last else "│   ")
         for i, child in enumerate(kids):
             _print_tree(child, child_prefix, i == len(kids) - 1)
@@ -797,8 +919,7 @@ def req_comment(root: Path, item_id: str, comment_text: str) -> int:
     now = time.strftime("%Y-%m-%d %H:%M", time.localtime())
     comment_block = f"\n\n---\n\n**Comment** ({now}):\n\n{comment_text}\n"
 
-    with open(doc_path, "a", encoding="utf-8") as f:
-        f.write(comment_block)
+    _append_doc(doc_path, comment_block)
 
     # Update timestamp
     item["updated"] = _now()
@@ -811,7 +932,24 @@ def req_comment(root: Path, item_id: str, comment_text: str) -> int:
 
 def req_backlog_md(root: Path) -> int:
     """Generate a _backlog.md summary view (auto-generated, for AI reading)."""
+    return _render_backlog_md(root, _load_items(root))
+
+
+def req_board_and_backlog(root: Path) -> int:
+    """Show the board and regenerate _backlog.md from a single CSV load."""
     items = _load_items(root)
+    rc = _render_board(items)
+    _render_backlog_md(root, items)
+    return rc
+
+
+# CSV columns of the _backlog.md "All Items" table, in display order
+_BACKLOG_COLUMNS = ("id", "type", "priority", "status", "title", "parent",
+                    "author", "source", "links")
+
+
+def _render_backlog_md(root: Path, items: list[dict[str, str]]) -> int:
+    """Write _backlog.md for already-loaded items."""
     lines = [
         "# Requirements Backlog",
         "",
@@ -820,19 +958,12 @@ def req_backlog_md(root: Path) -> int:
         "",
     ]
 
-    # Group by type
-    by_type: dict[str, list[dict]] = defaultdict(list)
-    for item in items:
-        by_type[item["type"]].append(item)
-
     # Status summary table
     lines.append("## Summary")
     lines.append("")
     lines.append("| Status | Count |")
     lines.append("|--------|-------|")
-    status_counts = defaultdict(int)
-    for item in items:
-        status_counts[item["status"]] += 1
+    status_counts = Counter(item["status"] for item in items)
     for status in STATUS_FLOW:
         if status in status_counts:
             lines.append(f"| {status} | {status_counts[status]} |")
@@ -844,14 +975,83 @@ def req_backlog_md(root: Path) -> int:
     lines.append("")
     lines.append("| ID | Type | Priority | Status | Title | Parent | Author | Source | Links |")
     lines.append("|----|------|----------|--------|-------|--------|--------|--------|-------|")
-    for item in items:
-        lines.append(f"| {item['id']} | {item['type']} | {item['priority']} | "
-                      f"{item['status']} | {item['title']} | {item['parent']} | "
-                      f"{item.get('author', '')} | {item.get('source', '')} | "
-                      f"{item.get('links', '')} |")
+    lines.extend("| " + " | ".join([item.get(col, "") for col in _BACKLOG_COLUMNS]) + " |"
+                 for item in items)
     lines.append("")
 
     backlog_path = _req_dir(root) / "_backlog.md"
     backlog_path.write_text("\n".join(lines), encoding="utf-8")
     print(f"  ✓ generated {backlog_path.relative_to(root)}")
     return 0
+
+
+# ── Batch ─────────────────────────────────────────────────────────────────────
+
+# Mutating commands a batch may run, by action name
+_BATCH_ACTIONS = {
+    "add": req_add,
+    "set": req_set,
+    "link": req_link,
+    "comment": req_comment,
+}
+
+
+def req_batch(root: Path, ops: list[dict[str, Any]]) -> int:
+    """Run several add/set/link/comment operations with one CSV load and save.
+
+    Each op is ``{"action": NAME, **kwargs}`` where kwargs are the keyword
+    arguments of the matching req_* function, all strings. All ops are
+    checked before any runs; execution stops at the first op that reports an
+    error, keeping earlier changes.
+    """
+    calls = []
+    for n, op in enumerate(ops, 1):
+        if not isinstance(op, dict):
+            print(f"error: operation {n} is not an object", file=sys.stderr)
+            return 1
+        kwargs = dict(op)
+        action = kwargs.pop("action", None)
+        handler = _BATCH_ACTIONS.get(action)
+        if handler is None:
+            print(f"error: operation {n}: unknown action '{action}'. "
+                  f"Must be one of: {', '.join(_BATCH_ACTIONS)}", file=sys.stderr)
+            return 1
+        try:
+            inspect.signature(handler).bind(root, **kwargs)
+        except TypeError as e:
+            print(f"error: operation {n} ({action}): {e}", file=sys.stderr)
+            return 1
+        bad = [k for k, v in kwargs.items() if not isinstance(v, str)]
+        if bad:
+            print(f"error: operation {n} ({action}): '{bad[0]}' must be a string",
+                  file=sys.stderr)
+            return 1
+        calls.append((handler, kwargs))
+
+    applied = 0
+    rc = 0
+    with _items_txn(root):
+        for handler, kwargs in calls:
+            rc = handler(root, **kwargs)
+            if rc:
+                break
+            applied += 1
+    print(f"  batch: {applied}/{len(calls)} operations applied")
+    return rc
+
+
+def req_batch_file(root: Path, path: str) -> int:
+    """Run req_batch on a JSON array of operations read from *path* ('-' = stdin)."""
+    try:
+        if path == "-":
+            ops = json.load(sys.stdin)
+        else:
+            with open(path, "r", encoding="utf-8") as f:
+                ops = json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"error: cannot read batch file '{path}': {e}", file=sys.stderr)
+        return 1
+    if not isinstance(ops, list):
+        print("error: batch file must contain a JSON array of operations", file=sys.stderr)
+        return 1
+    return req_batch(root, ops)
@@ -5,10 +5,11 @@ import os
 import sys
 from pathlib import Path
 from unittest import mock
-from unittest.mock import patch
+from unittest.mock import call, patch
 
 from fcontext.cli import (
     _find_root,
+    _sniff_command,
     cmd_experience,
     cmd_req,
     cmd_reset,
@@ -24,6 +25,32 @@ class TestMain:
         os.chdir(workspace)
         rc = main([])
         assert rc == 0
+        assert capsys.readouterr().out.startswith("usage: fcontext")
+
+    def test_version_abbreviation(self, capsys):
+        try:
+            main(["--vers"])
+        except SystemExit as e:
+            assert e.code == 0
+        assert capsys.readouterr().out.startswith("fcontext ")
+
+    def test_runs_with_docstrings_stripped(self):
+        import subprocess
+
+        result = subprocess.run(
+            [sys.executable, "-OO", "-m", "fcontext.cli"],
+            cwd=Path(__file__).resolve().parents[1],
+            capture_output=True,
+            text=True,
+        )
+        assert result.returncode == 0
+        assert "commands:" in result.stdout
+
+    def test_usage_lists_every_command(self):
+        from fcontext.cli import _PARSER_BUILDERS, _USAGE
+
+        for name in _PARSER_BUILDERS:
+            assert f"\n  {name} " in _USAGE
 
     def test_version(self, workspace: Path, capsys):
         try:
@@ -31,6 +58,12 @@ class TestMain:
         except SystemExit as e:
             assert e.code == 0
 
+    def test_version_output(self, capsys):
+        from fcontext import __version__
+
+        assert main(["--version"]) == 0
+        assert capsys.readouterr().out == f"fcontext {__version__}\n"
+
     def test_req_no_action(self, workspace: Path, capsys):
         os.chdir(workspace)
         rc = main(["req"])
@@ -47,6 +80,47 @@ class TestMain:
         assert rc == 0
 
 
+    def test_argv_defaults_to_sys_argv(self, workspace: Path):
+        os.chdir(workspace)
+        with patch.object(sys, "argv", ["fcontext", "status"]):
+            rc = main()
+        assert rc == 0
+
+    def test_unknown_command_errors(self, capsys):
+        try:
+            main(["bogus"])
+        except SystemExit as e:
+            assert e.code == 2
+        assert "invalid choice" in capsys.readouterr().err
+
+
+class TestSniffCommand:
+    """Test _sniff_command subcommand detection."""
+
+    def test_first_positional(self):
+        assert _sniff_command(["req", "list"]) == "req"
+
+    def test_skips_leading_flags(self):
+        assert _sniff_command(["-h", "index"]) == "index"
+
+    def test_unknown_command(self):
+        assert _sniff_command(["bogus"]) is None
+
+    def test_no_command(self):
+        assert _sniff_command(["--version"]) is None
+
+
+class TestChoices:
+    """argparse choices stay in sync with the requirements module."""
+
+    def test_choices_match_requirements(self):
+        from fcontext import cli, requirements
+
+        assert cli._ITEM_TYPES == requirements.ITEM_TYPES
+        assert cli._PRIORITY_LEVELS == requirements.PRIORITY_LEVELS
+        assert cli._LINK_TYPES == requirements.LINK_TYPES
+
+
 class TestCmdInit:
     """Test cmd_init via main()."""
 
@@ -121,6 +195,31 @@ class TestCmdIndex:
         rc = main(["index", str(docs)])
         assert rc == 0
 
+    def test_index_missing_file(self, workspace: Path, capsys):
+        os.chdir(workspace)
+        rc = main(["index", str(workspace / "missing.pdf")])
+        assert rc == 1
+        assert "not found" in capsys.readouterr().err
+
+    def test_index_target_outside_workspace(self, tmp_path: Path, capsys):
+        md = tmp_path / "notes.md"
+        md.write_text("# Notes")
+        rc = main(["index", str(md)])
+        assert rc == 1
+        assert "fatal" in capsys.readouterr().err
+
+    def test_index_target_resolved_once(self, workspace: Path):
+        md = workspace / "notes.md"
+        md.write_text("# Notes")
+        with patch("fcontext.cli.os.path.realpath", wraps=os.path.realpath) as realpath, \
+                patch("fcontext.cli.os.stat", wraps=os.stat) as st, \
+                patch("fcontext.indexer.run_index_file", return_value=0) as run:
+            assert main(["index", str(md)]) == 0
+        # "." is the --dir default, resolved at parse time
+        assert realpath.call_args_list == [call("."), call(str(md))]
+        assert st.call_args_list.count(call(md)) == 1
+        run.assert_called_once_with(workspace, md, force=False)
+
     def test_index_force(self, workspace: Path, capsys):
         os.chdir(workspace)
         rc = main(["index", "--force"])
@@ -167,6 +266,11 @@ class TestCmdReset:
             rc = main(["reset", str(workspace)])
         assert rc == 1
 
+    def test_reset_yes_flag(self, workspace: Path):
+        rc = main(["reset", str(workspace), "--yes"])
+        assert rc == 0
+        assert not (workspace / ".fcontext").exists()
+
 
 class TestCmdExport:
     """Test cmd_export via main()."""
@@ -298,6 +402,26 @@ class TestCmdReq:
         rc = main(["req", "trace", "REQ-001"])
         assert rc == 0
 
+    def test_req_batch_file(self, workspace: Path):
+        os.chdir(workspace)
+        ops = workspace / "ops.json"
+        ops.write_text('[{"action": "add", "item_type": "task", "title": "T"}]')
+        assert main(["req", "batch", str(ops)]) == 0
+
+    def test_req_batch_stdin(self, workspace: Path, monkeypatch):
+        import io
+
+        os.chdir(workspace)
+        monkeypatch.setattr(
+            sys,
+            "stdin",
+            io.StringIO('[{"action": "add", "item_type": "bug", "title": "B"}]'),
+        )
+        assert main(["req", "batch", "-"]) == 0
+        assert (
+            workspace / ".fcontext" / "_requirements" / "docs" / "BUG-001.md"
+        ).exists()
+
     def test_req_list_with_filters(self, workspace: Path):
         os.chdir(workspace)
         main(["req", "add", "R1", "-t", "task"])
@@ -341,10 +465,59 @@ class TestFindRoot:
         root = _find_root(str(sub))
         assert root == workspace
 
+    def test_accepts_resolved_path(self, workspace: Path):
+        assert _find_root(workspace.resolve()) == workspace.resolve()
+
+    def test_parsed_dir_resolved_once(self, workspace: Path):
+        with patch("fcontext.cli.os.path.realpath", wraps=os.path.realpath) as realpath:
+            assert main(["status", str(workspace)]) == 0
+        realpath.assert_called_once_with(str(workspace))
+
+    def test_resolves_relative_path(self, workspace: Path, monkeypatch):
+        (workspace / "sub").mkdir()
+        monkeypatch.chdir(workspace / "sub")
+        assert _find_root(Path(".")) == workspace.resolve()
+
     def test_returns_none(self, tmp_path: Path):
         root = _find_root(str(tmp_path))
         assert root is None
 
+    def test_init_invalidates_cache(self, tmp_path: Path):
+        assert _find_root(str(tmp_path)) is None
+        main(["init", str(tmp_path)])
+        assert _find_root(str(tmp_path)) == tmp_path
+
+    def test_reset_invalidates_cache(self, workspace: Path):
+        assert _find_root(str(workspace)) == workspace
+        args = argparse.Namespace(dir=str(workspace), yes=False)
+        with patch("builtins.input", side_effect=["reset"]):
+            cmd_reset(args)
+        assert _find_root(str(workspace)) is None
+
+    def test_miss_not_cached(self, tmp_path: Path, capsys):
+        from fcontext.init import init_workspace
+
+        assert main(["status", str(tmp_path)]) == 1
+        init_workspace(tmp_path)
+        assert _find_root(str(tmp_path)) == tmp_path
+        assert main(["status", str(tmp_path)]) == 0
+
+    def test_stale_hit_rechecked(self, workspace: Path):
+        import shutil
+
+        assert _find_root(str(workspace)) == workspace
+        shutil.rmtree(workspace / ".fcontext")
+        assert _find_root(str(workspace)) is None
+
+    def test_cache_is_bounded(self, workspace: Path):
+        from fcontext import cli
+
+        for n in range(cli._ROOT_CACHE_SIZE + 1):
+            sub = workspace / f"d{n}"
+            sub.mkdir()
+            assert _find_root(str(sub)) == workspace
+        assert len(cli._ROOT_CACHE) <= cli._ROOT_CACHE_SIZE
+
 
 # ── cmd_* else-branch coverage (unreachable via argparse, tested directly) ────
 
@@ -390,7 +563,7 @@ class TestCmdResetGitignore:
     """Cover gitignore cleanup in cmd_reset (L130-137)."""
 
     def _do_reset(self, root: Path, inputs: list[str]) -> int:
-        args = argparse.Namespace(dir=str(root))
+        args = argparse.Namespace(dir=str(root), yes=False)
         with patch("builtins.input", side_effect=inputs):
             return cmd_reset(args)
 
@@ -398,7 +571,7 @@ class TestCmdResetGitignore:
         """L135-137: gitignore with only fcontext entries → remove file."""
         gitignore = workspace / ".gitignore"
         gitignore.write_text(".fcontext/_cache/\n__pycache__/\n*.pyc\n*.egg-info/\n")
-        rc = self._do_reset(workspace, ["yes", "reset"])
+        rc = self._do_reset(workspace, ["reset"])
         assert rc == 0
         assert not gitignore.exists()
 
@@ -408,13 +581,21 @@ class TestCmdResetGitignore:
         gitignore.write_text(
             ".fcontext/_cache/\n__pycache__/\n*.pyc\n*.egg-info/\nmy-custom-entry/\n"
         )
-        rc = self._do_reset(workspace, ["yes", "reset"])
+        rc = self._do_reset(workspace, ["reset"])
         assert rc == 0
         assert gitignore.exists()
         content = gitignore.read_text()
         assert "my-custom-entry/" in content
         assert ".fcontext/_cache/" not in content
 
+    def test_reset_leaves_unrelated_gitignore_untouched(self, workspace: Path):
+        """gitignore without fcontext entries → not rewritten."""
+        gitignore = workspace / ".gitignore"
+        gitignore.write_text("node_modules/\r\ndist/")
+        rc = self._do_reset(workspace, ["reset"])
+        assert rc == 0
+        assert gitignore.read_bytes() == b"node_modules/\r\ndist/"
+
 
 class TestVersionFallback:
     """Cover __init__.py ImportError fallback (L4-5)."""
@@ -0,0 +1,189 @@
+"""Tests for the macOS getattrlistbulk directory lister."""
+import ctypes
+import errno
+import os
+import stat
+import struct
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from fcontext import _darwin_walk as dw
+from fcontext.indexer import SKIP_DIRS, _scan_convertible
+
+
+def _entry(name: str, kind: int, mtime_ns: int = 0, size=None, drop: int = 0) -> bytes:
+    """Pack one entry the way getattrlistbulk lays it out.
+
+    File attributes are only present when *size* is given; common attributes
+    whose bit is in *drop* are left out, as a filesystem lacking them would.
+    """
+    raw_name = name.encode() + b"\0"
+    raw_name += b"\0" * (-len(raw_name) % 4)
+    sec, nsec = divmod(mtime_ns, 1_000_000_000)
+    common = [
+        (dw.ATTR_CMN_DEVID, struct.pack("=i", -5)),
+        (dw.ATTR_CMN_OBJTYPE, struct.pack("=I", kind)),
+        (dw.ATTR_CMN_CRTIME, struct.pack("=qq", 100, 1)),
+        (dw.ATTR_CMN_MODTIME, struct.pack("=qq", sec, nsec)),
+        (dw.ATTR_CMN_CHGTIME, struct.pack("=qq", 300, 3)),
+        (dw.ATTR_CMN_ACCTIME, struct.pack("=qq", 400, 4)),
+        (dw.ATTR_CMN_OWNERID, struct.pack("=I", 501)),
+        (dw.ATTR_CMN_GRPID, struct.pack("=I", 20)),
+        (dw.ATTR_CMN_ACCESSMASK, struct.pack("=I", 0o100644)),
+        (dw.ATTR_CMN_FLAGS, struct.pack("=I", 0)),
+        (dw.ATTR_CMN_FILEID, struct.pack("=Q", 2**40 + 7)),
+    ]
+    common = [(bit, raw) for bit, raw in common if not bit & drop]
+    files = [] if size is None else [
+        (dw.ATTR_FILE_LINKCOUNT, struct.pack("=I", 2)),
+        (dw.ATTR_FILE_ALLOCSIZE, struct.pack("=q", 8192)),
+        (dw.ATTR_FILE_IOBLOCKSIZE, struct.pack("=I", 4096)),
+        (dw.ATTR_FILE_DATALENGTH, struct.pack("=q", size)),
+    ]
+    returned = dw.ATTR_CMN_RETURNED_ATTRS | dw.ATTR_CMN_NAME
+    for bit, _ in common:
+        returned |= bit
+    fileattr = 0
+    for bit, _ in files:
+        fileattr |= bit
+    tail = b"".join(raw for _, raw in common + files)
+    name_off = 8 + len(tail)
+    body = struct.pack("=iI", name_off, len(name.encode()) + 1) + tail + raw_name
+    head = struct.pack("=I5I", 24 + len(body), returned, 0, 0, fileattr, 0)
+    return head + body
+
+
+@pytest.fixture
+def no_libc_cache(monkeypatch):
+    monkeypatch.setattr(dw, "_getattrlistbulk", None)
+
+
+class TestParseEntries:
+
+    def test_parses_files_and_dirs(self):
+        buf = _entry("report.pdf", dw.VREG, 1_700_000_000_500_000_001, 1234) \
+            + _entry("sub", dw.VDIR, 1_600_000_000_000_000_000)
+        (name, kind, st), sub = dw.parse_entries(buf, 2)
+        assert (name, kind) == ("report.pdf", dw.VREG)
+        assert sub == ("sub", dw.VDIR, None)
+        assert st.st_mtime_ns == 1_700_000_000_500_000_001
+        assert st.st_mtime == 1_700_000_000 + 500_000_001 * 1e-9
+        assert st.st_ctime_ns == 300_000_000_003
+        assert st.st_atime_ns == 400_000_000_004
+        assert st.st_mode == stat.S_IFREG | 0o644
+        assert (st.st_ino, st.st_dev, st.st_nlink) == (2**40 + 7, -5, 2)
+        assert (st.st_uid, st.st_gid, st.st_size) == (501, 20, 1234)
+        assert (st.st_blocks, st.st_blksize) == (16, 4096)
+
+    def test_missing_attribute_gives_no_stat(self):
+        buf = _entry("a.md", dw.VREG, 1, 3, drop=dw.ATTR_CMN_FILEID)
+        assert dw.parse_entries(buf, 1) == [("a.md", dw.VREG, None)]
+
+    def test_parses_non_ascii_names(self):
+        buf = _entry("笔记.md", dw.VREG, 1, 3)
+        assert dw.parse_entries(buf, 1)[0][0] == "笔记.md"
+
+
+class TestListDir:
+
+    def test_reads_batches_until_exhausted(self, tmp_path: Path):
+        batches = [(_entry("a.md", dw.VREG, 1, 1), 1), (_entry("b.md", dw.VREG, 2, 2), 1), (b"", 0)]
+
+        def fake(fd, alist, buf, size, options):
+            data, count = batches.pop(0)
+            ctypes.memmove(buf, data, len(data))
+            return count
+
+        with patch.object(dw, "_load", return_value=fake):
+            names = [e[0] for e in dw.list_dir(str(tmp_path))]
+        assert names == ["a.md", "b.md"]
+
+    def test_error_raises_oserror(self, tmp_path: Path):
+        with patch.object(dw, "_load", return_value=lambda *a: -1), \
+             patch("fcontext._darwin_walk.ctypes.get_errno", return_value=errno.ENOTSUP):
+            with pytest.raises(OSError) as exc:
+                dw.list_dir(str(tmp_path))
+        assert exc.value.errno == errno.ENOTSUP
+
+    def test_load_without_syscall_raises(self, no_libc_cache):
+        libc = MagicMock(spec=[])
+        with patch("fcontext._darwin_walk.ctypes.CDLL", return_value=libc):
+            with pytest.raises(OSError):
+                dw._load()
+
+    def test_load_resolves_once(self, no_libc_cache):
+        libc = MagicMock()
+        with patch("fcontext._darwin_walk.ctypes.CDLL", return_value=libc) as cdll:
+            assert dw._load() is libc.getattrlistbulk
+            assert dw._load() is libc.getattrlistbulk
+        cdll.assert_called_once()
+        assert libc.getattrlistbulk.restype is ctypes.c_int
+
+
+class TestScanDir:
+
+    def test_filters_like_scandir(self, tmp_path: Path):
+        (tmp_path / "real.txt").write_text("hi")
+        (tmp_path / "plain.md").write_text("abc")
+        (tmp_path / "folder.md").mkdir()
+        listed = dw.parse_entries(_entry("a.md", dw.VREG, 5_250_000_000, 7), 1)[0]
+        entries = [
+            (".hidden.md", dw.VREG, None),
+            ("sub", dw.VDIR, None),
+            ("node_modules", dw.VDIR, None),
+            listed,
+            ("data.csv", dw.VREG, None),
+            ("plain.md", dw.VREG, None),
+            ("link.txt", dw.VLNK, None),
+            ("broken.md", dw.VLNK, None),
+            ("dirlink.md", dw.VLNK, None),
+        ]
+        os.symlink(tmp_path / "real.txt", tmp_path / "link.txt")
+        os.symlink(tmp_path / "missing", tmp_path / "broken.md")
+        os.symlink(tmp_path / "folder.md", tmp_path / "dirlink.md")
+        with patch.object(dw, "list_dir", return_value=entries):
+            files, subdirs = dw.scan_dir(str(tmp_path), {".md", ".txt"}, SKIP_DIRS)
+        assert subdirs == [str(tmp_path / "sub")]
+        assert [os.path.basename(f) for f, _ in files] == ["a.md", "plain.md", "link.txt"]
+        assert files[0][1] is listed[2]
+        assert files[1][1].st_size == 3
+        assert files[2][1].st_size == 2
+
+
+@pytest.mark.skipif(sys.platform != "darwin", reason="getattrlistbulk is macOS-only")
+class TestRealSyscall:
+    """Run the real syscall so the packed layout is checked against the kernel."""
+
+    def test_matches_os_stat(self, tmp_path: Path):
+        (tmp_path / "a.md").write_text("hello")
+        (tmp_path / "sub").mkdir()
+        listed = {name: (kind, st) for name, kind, st in dw.list_dir(str(tmp_path))}
+        assert listed["sub"] == (dw.VDIR, None)
+        kind, st = listed["a.md"]
+        assert kind == dw.VREG
+        ref = os.stat(tmp_path / "a.md")
+        for field in ("st_mode", "st_ino", "st_dev", "st_nlink", "st_uid", "st_gid",
+                      "st_size", "st_blocks", "st_blksize", "st_flags",
+                      "st_mtime", "st_mtime_ns", "st_ctime_ns", "st_atime_ns"):
+            assert getattr(st, field) == getattr(ref, field), field
+
+
+class TestIndexerDispatch:
+
+    def test_darwin_uses_bulk_listing(self, tmp_path: Path):
+        fake = ([(str(tmp_path / "x.md"), os.stat(tmp_path))], [])
+        with patch("fcontext.indexer.sys.platform", "darwin"), \
+             patch.object(dw, "scan_dir", return_value=fake) as bulk:
+            files = _scan_convertible(tmp_path)
+        bulk.assert_called_once()
+        assert [f for f, _ in files] == [str(tmp_path / "x.md")]
+
+    def test_darwin_falls_back_to_scandir(self, tmp_path: Path):
+        (tmp_path / "x.md").write_text("x")
+        with patch("fcontext.indexer.sys.platform", "darwin"), \
+             patch.object(dw, "scan_dir", side_effect=OSError(errno.ENOTSUP, "unsupported")):
+            files = _scan_convertible(tmp_path)
+        assert [os.path.basename(f) for f, _ in files] == ["x.md"]
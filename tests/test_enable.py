@@ -166,9 +166,44 @@ class TestEnable:
         for name in ("fcontext", "fcontext-index", "fcontext-req", "fcontext-topic"):
             assert (pi_skills / name / "SKILL.md").exists()
 
-    def test_enable_unknown_agent(self, workspace: Path):
+    def test_enable_output(self, workspace: Path, capsys):
+        enable_agent(workspace, "opencode")
+        lines = capsys.readouterr().out.splitlines()
+        assert lines[:3] == [
+            "  (opencode uses same config as claude)",
+            "  ✓ enabled opencode",
+            "    → .claude/rules/fcontext.md",
+        ]
+        assert "    → .claude/skills/fcontext/SKILL.md" in lines
+
+    def test_enable_rerun_writes_nothing(self, workspace: Path, capsys):
+        enable_agent(workspace, "claude")
+        skill = workspace / ".claude" / "skills" / "fcontext" / "SKILL.md"
+        skill.write_text("custom")
+        capsys.readouterr()
+        assert enable_agent(workspace, "claude") == 0
+        assert skill.read_text() == "custom"
+        assert "SKILL.md" not in capsys.readouterr().out
+
+    def test_write_if_new(self, tmp_path: Path):
+        from fcontext.init import _write_if_new
+
+        target = tmp_path / "a" / "b.txt"
+        assert _write_if_new(target, b"one") is True
+        assert _write_if_new(target, b"two") is False
+        assert target.read_bytes() == b"one"
+        assert _write_if_new(target, b"three", force=True) is True
+        assert target.read_bytes() == b"three"
+
+    def test_enable_agent_name_case_insensitive(self, workspace: Path):
+        assert enable_agent(workspace, "Claude") == 0
+        assert (workspace / ".claude" / "rules" / "fcontext.md").exists()
+
+    def test_enable_unknown_agent(self, workspace: Path, capsys):
         rc = enable_agent(workspace, "unknown_agent")
         assert rc == 1
+        err = capsys.readouterr().err
+        assert "Available: antigravity, claude, codex, copilot," in err
 
     def test_enable_no_overwrite_without_force(self, workspace: Path):
         enable_agent(workspace, "copilot")
@@ -184,6 +219,15 @@ class TestEnable:
         enable_agent(workspace, "copilot", force=True)
         assert "_workspace.map" in ctx_skill.read_text()
 
+    def test_enable_writes_prerendered_bytes(self, workspace: Path):
+        from fcontext._init_templates import AGENT_RULES_BYTES, SKILL_FILES
+
+        enable_agent(workspace, "claude")
+        skill = workspace / ".claude" / "skills" / "fcontext-req" / "SKILL.md"
+        assert skill.read_bytes() == dict(SKILL_FILES)["fcontext-req"]
+        rules = workspace / ".claude" / "rules" / "fcontext.md"
+        assert rules.read_bytes() == AGENT_RULES_BYTES
+
     def test_enable_rules_no_overwrite_without_force(self, workspace: Path):
         enable_agent(workspace, "claude")
         rules = workspace / ".claude" / "rules" / "fcontext.md"
@@ -209,6 +253,19 @@ class TestEnable:
         assert "copilot" in out
         assert "enabled" in out
 
+    def test_list_agents_partial_skills(self, workspace: Path, capsys):
+        enable_agent(workspace, "cursor")
+        skills = workspace / ".cursor" / "skills"
+        (skills / "fcontext-req" / "SKILL.md").unlink()
+        (skills / "notes").mkdir()
+        (skills / "stray.md").write_text("x")
+        list_agents(workspace)
+        out = capsys.readouterr().out
+        line = next(l for l in out.splitlines() if l.strip().startswith("cursor"))
+        assert line.split("enabled")[1].strip() == (
+            "fcontext, fcontext-index, fcontext-topic"
+        )
+
     def test_list_agents_shows_alias(self, workspace: Path, capsys):
         list_agents(workspace)
         out = capsys.readouterr().out
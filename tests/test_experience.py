@@ -1,6 +1,8 @@
 """Tests for fcontext experience — list, import, export, remove."""
+import errno
 import os
 import subprocess
+import sys
 import zipfile
 from pathlib import Path
 from unittest.mock import patch, MagicMock
@@ -36,6 +38,79 @@ class TestExperienceList:
         assert "_topics" in out
         assert "BA knowledge for IPMI project" in out
 
+    def test_list_skips_unreadable_entries(self, workspace: Path, capsys):
+        from fcontext.experience import _pack_stats
+        exp = workspace / ".fcontext" / "_experiences" / "racy"
+        (exp / "_topics").mkdir(parents=True)
+        (exp / "_cache").mkdir()
+        (exp / "_cache" / "kept.md").write_text("abc")
+        (exp / "_cache" / "gone.md").write_text("x")
+        real_scandir = os.scandir
+
+        class _Entry:
+            def __init__(self, entry):
+                self._entry = entry
+                self.name, self.path = entry.name, entry.path
+
+            def is_dir(self, **kwargs):
+                return self._entry.is_dir(**kwargs)
+
+            def is_file(self):
+                return self._entry.is_file()
+
+            def stat(self):
+                if self.name == "gone.md":
+                    raise FileNotFoundError(self.path)
+                return self._entry.stat()
+
+        class _Listing:
+            def __init__(self, path):
+                self._it = real_scandir(path)
+
+            def __enter__(self):
+                return self
+
+            def __iter__(self):
+                return (_Entry(e) for e in self._it)
+
+            def __exit__(self, *exc):
+                self._it.close()
+
+        def fake_scandir(path):
+            if os.path.basename(path) == "_topics":
+                raise PermissionError(path)
+            return _Listing(path)
+
+        with patch("fcontext.experience.os.scandir", side_effect=fake_scandir):
+            dirs, count, size = _pack_stats(exp)
+        assert sorted(dirs) == ["_cache", "_topics"]
+        assert (count, size) == (1, 3)
+
+    def test_list_readme_description_past_prefix(self, workspace: Path, capsys):
+        exp = workspace / ".fcontext" / "_experiences" / "long_pack"
+        (exp / "_cache").mkdir(parents=True)
+        headings = "".join(f"# heading {i}\n" for i in range(300))
+        (exp / "_README.md").write_text(headings + "Described after the headings.\n")
+        list_experiences(workspace)
+        assert "    Described after the headings." in capsys.readouterr().out
+
+    def test_list_readme_line_cut_at_prefix_is_not_truncated(self, workspace: Path, capsys):
+        from fcontext.experience import _README_HEAD_BYTES
+        exp = workspace / ".fcontext" / "_experiences" / "cut_pack"
+        (exp / "_cache").mkdir(parents=True)
+        heading = "#" * (_README_HEAD_BYTES - 10) + "\n"
+        (exp / "_README.md").write_text(heading + "A description crossing the boundary.\n")
+        list_experiences(workspace)
+        assert "    A description crossing the boundary.\n" in capsys.readouterr().out
+
+    def test_list_readme_headings_only(self, workspace: Path, capsys):
+        exp = workspace / ".fcontext" / "_experiences" / "titled"
+        (exp / "_cache").mkdir(parents=True)
+        (exp / "_README.md").write_text("# titled\n\n## Contents\n")
+        list_experiences(workspace)
+        out = capsys.readouterr().out
+        assert out.splitlines()[1].startswith("    dirs:")
+
     def test_list_without_readme(self, workspace: Path, capsys):
         # Experience without _README.md still shows
         exp = workspace / ".fcontext" / "_experiences" / "bare_pack" / "_cache"
@@ -45,6 +120,32 @@ class TestExperienceList:
         out = capsys.readouterr().out
         assert "bare_pack" in out
 
+    def test_list_counts_nested_files_and_size(self, workspace: Path, capsys):
+        exp = workspace / ".fcontext" / "_experiences" / "sized"
+        (exp / "_cache" / "sub").mkdir(parents=True)
+        (exp / "_cache" / "sub" / "a.md").write_text("x" * 100)
+        (exp / "_topics").mkdir()
+        (exp / "_topics" / "b.md").write_text("y" * 50)
+        (exp / "other").mkdir()
+        list_experiences(workspace)
+        out = capsys.readouterr().out
+        assert "files: 2" in out
+        assert "size: 150 B" in out
+        assert "other" not in out.split("dirs:")[1].split("files:")[0]
+
+    def test_list_many_packs_in_order(self, workspace: Path, capsys):
+        exp_dir = workspace / ".fcontext" / "_experiences"
+        names = [f"pack{i:02d}" for i in range(25)]
+        for i, name in enumerate(reversed(names)):
+            (exp_dir / name / "_cache").mkdir(parents=True)
+            (exp_dir / name / "_cache" / "doc.md").write_text("x" * (i + 1))
+        list_experiences(workspace)
+        out = capsys.readouterr().out
+        positions = [out.index(f"  {name}\n") for name in names]
+        assert positions == sorted(positions)
+        # pack24 was written first with a 1-byte file
+        assert out.split("  pack24\n")[1].splitlines()[0].endswith("size: 1 B")
+
 
 class TestExperienceImport:
     """STORY-005: fcontext experience import"""
@@ -72,6 +173,27 @@ class TestExperienceImport:
         assert (exp / "_README.md").exists()
         assert "Test experience pack" in (exp / "_README.md").read_text()
 
+    def test_import_zip_many_members(self, workspace: Path, tmp_path: Path):
+        zp = tmp_path / "many.zip"
+        with zipfile.ZipFile(zp, "w", zipfile.ZIP_DEFLATED) as zf:
+            for i in range(50):
+                zf.writestr(f"_cache/d{i % 5}/f{i}.md", f"file {i}")
+        assert import_experience(workspace, str(zp)) == 0
+        exp = workspace / ".fcontext" / "_experiences" / "many"
+        for i in range(50):
+            assert (exp / "_cache" / f"d{i % 5}" / f"f{i}.md").read_text() == f"file {i}"
+        assert _load_ex(workspace)[0].file_count == "50"
+
+    def test_import_zip_duplicate_member_keeps_last(self, workspace: Path, tmp_path: Path):
+        zp = tmp_path / "dups.zip"
+        with zipfile.ZipFile(zp, "w") as zf:
+            zf.writestr("_topics/a.md", "first")
+            with pytest.warns(UserWarning):
+                zf.writestr("_topics/a.md", "second")
+        assert import_experience(workspace, str(zp)) == 0
+        exp = workspace / ".fcontext" / "_experiences" / "dups"
+        assert (exp / "_topics" / "a.md").read_text() == "second"
+
     def test_import_uses_custom_name(self, workspace: Path, tmp_path: Path):
         zp = self._make_zip(tmp_path)
         rc = import_experience(workspace, str(zp), name="ba_knowledge")
@@ -160,6 +282,15 @@ class TestExport:
             assert "arch" in readme  # topic listed
             assert "fcontext export" in readme
 
+    def test_export_stores_compressed_formats(self, workspace: Path, tmp_path: Path):
+        (workspace / ".fcontext" / "_cache" / "doc.md").write_text("# Doc\n" * 100)
+        (workspace / ".fcontext" / "_cache" / "diagram.PNG").write_bytes(b"\x89PNG" + b"\0" * 100)
+        out_zip = tmp_path / "export.zip"
+        assert export_experience(workspace, str(out_zip)) == 0
+        with zipfile.ZipFile(out_zip) as zf:
+            assert zf.getinfo("_cache/doc.md").compress_type == zipfile.ZIP_DEFLATED
+            assert zf.getinfo("_cache/diagram.PNG").compress_type == zipfile.ZIP_STORED
+
     def test_export_to_directory(self, workspace: Path, tmp_path: Path):
         (workspace / ".fcontext" / "_topics" / "note.md").write_text("note")
 
@@ -403,6 +534,39 @@ class TestExportGit:
         assert "first" in lines[0]
 
 
+class TestIsLocalGitRepo:
+    """Local git repo detection."""
+
+    def test_detects_repo_dir(self, tmp_path: Path):
+        from fcontext.experience import _is_local_git_repo
+        (tmp_path / "repo" / ".git").mkdir(parents=True)
+        assert _is_local_git_repo(str(tmp_path / "repo"))
+
+    def test_rejects_plain_dir_and_file(self, tmp_path: Path):
+        from fcontext.experience import _is_local_git_repo
+        (tmp_path / "plain").mkdir()
+        (tmp_path / "pack.zip").write_bytes(b"")
+        assert not _is_local_git_repo(str(tmp_path / "plain"))
+        assert not _is_local_git_repo(str(tmp_path / "pack.zip"))
+        assert not _is_local_git_repo(str(tmp_path / "missing"))
+
+    def test_git_init_after_miss(self, tmp_path: Path):
+        from fcontext.experience import _is_local_git_repo
+        (tmp_path / "later").mkdir()
+        assert not _is_local_git_repo(str(tmp_path / "later"))
+        (tmp_path / "later" / ".git").mkdir()
+        assert _is_local_git_repo(str(tmp_path / "later"))
+
+    def test_relative_source_keyed_by_cwd(self, tmp_path: Path, monkeypatch):
+        from fcontext.experience import _is_local_git_repo
+        (tmp_path / "a" / "repo" / ".git").mkdir(parents=True)
+        (tmp_path / "b" / "repo").mkdir(parents=True)
+        monkeypatch.chdir(tmp_path / "a")
+        assert _is_local_git_repo("repo")
+        monkeypatch.chdir(tmp_path / "b")
+        assert not _is_local_git_repo("repo")
+
+
 class TestIsGitUrl:
     """Test git URL detection."""
 
@@ -473,6 +637,18 @@ def _make_git_repo_without_fcontext(tmp_path: Path, repo_name: str = "bare_repo"
     return repo
 
 
+def _commit_source_file(repo: Path) -> None:
+    """Helper: commit a non-knowledge file so sparse checkouts can be told apart."""
+    env = {**os.environ,
+           "GIT_AUTHOR_NAME": "test", "GIT_AUTHOR_EMAIL": "t@t",
+           "GIT_COMMITTER_NAME": "test", "GIT_COMMITTER_EMAIL": "t@t"}
+    (repo / "src").mkdir()
+    (repo / "src" / "main.py").write_text("print('hi')")
+    subprocess.run(["git", "add", "."], cwd=repo, capture_output=True, check=True)
+    subprocess.run(["git", "commit", "-m", "code"],
+                    cwd=repo, capture_output=True, check=True, env=env)
+
+
 class TestExperienceImportGit:
     """STORY-008: fcontext experience import from git URL."""
 
@@ -573,6 +749,60 @@ class TestExperienceImportGit:
         assert (exp / "_cache" / "spec.md").exists()
         assert not (exp / "_cache" / "root_doc.md").exists()
 
+    def test_clone_knowledge_is_sparse(self, tmp_path: Path):
+        from fcontext.experience import _clone_knowledge
+        repo = _make_git_repo_without_fcontext(tmp_path)
+        _commit_source_file(repo)
+        clone = tmp_path / "clone"
+        assert _clone_knowledge(str(repo), clone).returncode == 0
+        assert (clone / "_cache" / "doc.md").exists()
+        assert not (clone / "src").exists()
+
+    def test_clone_knowledge_falls_back_to_full_clone(self, tmp_path: Path):
+        from fcontext import experience
+        repo = _make_git_repo_without_fcontext(tmp_path)
+        _commit_source_file(repo)
+        real_git = experience._git
+
+        def no_sparse_checkout(cmd, **kwargs):
+            if "sparse-checkout" in cmd:
+                return MagicMock(returncode=1, stderr=b"git: 'sparse-checkout' is not a git command.")
+            return real_git(cmd, **kwargs)
+
+        clone = tmp_path / "clone"
+        with patch("fcontext.experience._git", side_effect=no_sparse_checkout):
+            assert experience._clone_knowledge(str(repo), clone).returncode == 0
+        assert (clone / "_cache" / "doc.md").exists()
+        assert (clone / "src" / "main.py").exists()
+
+    def test_clone_knowledge_reports_other_failures(self, tmp_path: Path):
+        from fcontext import experience
+        failed = MagicMock(returncode=128, stderr=b"fatal: Authentication failed for 'https://x/r.git/'")
+        with patch("fcontext.experience._git", return_value=failed) as git:
+            assert experience._clone_knowledge("https://x/r.git", tmp_path / "clone") is failed
+        git.assert_called_once()
+
+    def test_import_git_leaves_no_temp_dir(self, workspace: Path, tmp_path: Path):
+        repo = _make_git_repo_with_fcontext(tmp_path)
+        assert import_experience_git(workspace, str(repo), name="clean") == 0
+        leftovers = [p.name for p in (workspace / ".fcontext").iterdir() if p.name.startswith(".import-")]
+        assert leftovers == []
+
+    def test_import_git_copies_across_filesystems(self, workspace: Path, tmp_path: Path):
+        repo = _make_git_repo_with_fcontext(tmp_path)
+        with patch("fcontext.experience.os.rename", side_effect=OSError(errno.EXDEV, "cross-device")):
+            rc = import_experience_git(workspace, str(repo), name="xdev")
+        assert rc == 0
+        exp = workspace / ".fcontext" / "_experiences" / "xdev"
+        assert (exp / "_cache" / "spec.md").exists()
+        assert (exp / "_topics" / "arch.md").exists()
+
+    def test_import_git_rename_error_propagates(self, workspace: Path, tmp_path: Path):
+        repo = _make_git_repo_with_fcontext(tmp_path)
+        with patch("fcontext.experience.os.rename", side_effect=PermissionError(errno.EACCES, "denied")):
+            with pytest.raises(PermissionError):
+                import_experience_git(workspace, str(repo), name="denied")
+
 
 class TestExCsv:
     """Experience registry — ex.csv tracking imports."""
@@ -595,12 +825,12 @@ class TestExCsv:
         rows = _load_ex(workspace)
         assert len(rows) == 1
         row = rows[0]
-        assert row["name"] == "from_zip"
-        assert row["source_type"] == "zip"
-        assert str(zp) in row["source"]
-        assert row["branch"] == ""
-        assert int(row["file_count"]) > 0
-        assert row["imported_at"]  # non-empty timestamp
+        assert row.name == "from_zip"
+        assert row.source_type == "zip"
+        assert str(zp) in row.source
+        assert row.branch == ""
+        assert int(row.file_count) > 0
+        assert row.imported_at  # non-empty timestamp
 
     def test_git_import_records_csv(self, workspace: Path, tmp_path: Path):
         """Importing from local git repo should record source_type=local-git."""
@@ -610,9 +840,9 @@ class TestExCsv:
         rows = _load_ex(workspace)
         assert len(rows) == 1
         row = rows[0]
-        assert row["name"] == "from_git"
-        assert row["source_type"] == "local-git"
-        assert str(repo) in row["source"]
+        assert row.name == "from_git"
+        assert row.source_type == "local-git"
+        assert str(repo) in row.source
 
     def test_git_import_records_branch(self, workspace: Path, tmp_path: Path):
         """Branch info should be recorded when specified."""
@@ -629,7 +859,7 @@ class TestExCsv:
         import_experience_git(workspace, str(repo), name="branched", branch="docs")
 
         rows = _load_ex(workspace)
-        assert rows[0]["branch"] == "docs"
+        assert rows[0].branch == "docs"
 
     def test_multiple_imports_tracked(self, workspace: Path, tmp_path: Path):
         """Multiple imports should accumulate rows in ex.csv."""
@@ -640,7 +870,7 @@ class TestExCsv:
 
         rows = _load_ex(workspace)
         assert len(rows) == 2
-        names = {r["name"] for r in rows}
+        names = {r.name for r in rows}
         assert names == {"alpha", "beta"}
 
     def test_force_overwrite_updates_row(self, workspace: Path, tmp_path: Path):
@@ -651,7 +881,7 @@ class TestExCsv:
 
         rows = _load_ex(workspace)
         assert len(rows) == 1
-        assert rows[0]["name"] == "dup"
+        assert rows[0].name == "dup"
 
     def test_remove_cleans_csv(self, workspace: Path, tmp_path: Path):
         """Removing an experience should remove its row from ex.csv."""
@@ -676,7 +906,18 @@ class TestExCsv:
         remove_experience(workspace, "dropper")
         rows = _load_ex(workspace)
         assert len(rows) == 1
-        assert rows[0]["name"] == "keeper"
+        assert rows[0].name == "keeper"
+
+    def test_load_pads_short_rows_and_skips_blank_lines(self, workspace: Path):
+        csv_path = _ex_csv_path(workspace)
+        csv_path.parent.mkdir(parents=True, exist_ok=True)
+        csv_path.write_text("name,source_type,source,branch,imported_at,file_count\n"
+                            "legacy,zip\n\n", encoding="utf-8")
+        rows = _load_ex(workspace)
+        assert len(rows) == 1
+        assert rows[0].name == "legacy"
+        assert rows[0].source_type == "zip"
+        assert rows[0].file_count == ""
 
     def test_list_shows_source_info(self, workspace: Path, tmp_path: Path, capsys):
         """list_experiences should display source info from ex.csv."""
@@ -771,6 +1012,36 @@ class TestGitignore:
         # local-git → NOT ignored
         assert "_experiences/local_check/" not in content
 
+    def test_git_import_clears_stale_clones(self, workspace: Path, tmp_path: Path):
+        """Leftover .import-* clones from a killed import are removed and ignored."""
+        ctx = workspace / ".fcontext"
+        dead = subprocess.Popen([sys.executable, "-c", ""])
+        dead.wait()
+        stale = ctx / f".import-{dead.pid}-abc"
+        (stale / "repo").mkdir(parents=True)
+        running = ctx / f".import-{os.getppid()}-def"
+        running.mkdir()
+        foreign = ctx / ".import-notes"
+        foreign.mkdir()
+        repo = _make_git_repo_with_fcontext(tmp_path)
+        assert import_experience_git(workspace, str(repo), name="after_crash") == 0
+        assert not stale.exists()
+        assert running.is_dir()
+        assert foreign.is_dir()
+        assert ".import-*/" in _gitignore_path(workspace).read_text(encoding="utf-8").splitlines()
+
+    def test_import_owner_other_user_counts_as_alive(self):
+        from fcontext.experience import _import_owner_gone
+        with patch("fcontext.experience.os.kill", side_effect=PermissionError):
+            assert not _import_owner_gone(".import-1-abc")
+
+    def test_import_owner_not_checked_on_windows(self):
+        from fcontext.experience import _import_owner_gone
+        with patch("fcontext.experience.sys.platform", "win32"), \
+                patch("fcontext.experience.os.kill") as kill:
+            assert not _import_owner_gone(".import-1-abc")
+        kill.assert_not_called()
+
     def test_remove_cleans_gitignore(self, workspace: Path, tmp_path: Path):
         """Removing a git-imported experience should remove its .gitignore entry."""
         from fcontext.experience import _gitignore_add
@@ -836,6 +1107,10 @@ class TestIsDownloadUrl:
     def test_https_zip_with_fragment(self):
         assert _is_download_url("https://example.com/pack.zip#section") is True
 
+    def test_https_zip_with_question_mark_in_fragment(self):
+        assert _is_download_url("https://example.com/pack.zip#a?b") is True
+        assert _is_download_url("https://example.com/page#pack.zip") is False
+
     def test_https_zip_case_insensitive(self):
         assert _is_download_url("https://example.com/Pack.ZIP") is True
 
@@ -874,8 +1149,13 @@ class TestImportUrl:
     def _mock_urlopen(self, data: bytes, status: int = 200):
         """Return a context-manager mock that behaves like urlopen()."""
         resp = MagicMock()
-        resp.read.return_value = data
-        resp.__enter__ = lambda s: s
+
+        def _enter(s):
+            # Fresh body per request so one mock can serve repeated downloads
+            s.read.side_effect = BytesIO(data).read
+            return s
+
+        resp.__enter__ = _enter
         resp.__exit__ = MagicMock(return_value=False)
         return resp
 
@@ -921,8 +1201,8 @@ class TestImportUrl:
             import_experience(workspace, "https://cdn.example.com/knowledge.zip")
         rows = _load_ex(workspace)
         assert len(rows) == 1
-        assert rows[0]["source_type"] == "url"
-        assert rows[0]["source"] == "https://cdn.example.com/knowledge.zip"
+        assert rows[0].source_type == "url"
+        assert rows[0].source == "https://cdn.example.com/knowledge.zip"
 
     def test_import_url_force_overwrite(self, workspace: Path, tmp_path: Path):
         """force=True should overwrite existing experience from URL."""
@@ -968,8 +1248,13 @@ class TestExperienceUpdate:
     @staticmethod
     def _mock_urlopen(data: bytes):
         resp = MagicMock()
-        resp.read.return_value = data
-        resp.__enter__ = lambda s: s
+
+        def _enter(s):
+            # Fresh body per request so one mock can serve repeated downloads
+            s.read.side_effect = BytesIO(data).read
+            return s
+
+        resp.__enter__ = _enter
         resp.__exit__ = MagicMock(return_value=False)
         return resp
 
@@ -1014,6 +1299,70 @@ class TestExperienceUpdate:
         assert rc == 0
         assert "Updated Spec" in t.read_text()
 
+    def test_update_many_git_experiences(self, workspace: Path, tmp_path: Path, capsys):
+        """Concurrent updates must keep every registry row and gitignore line."""
+        names = [f"repo{i}" for i in range(5)]
+        for n in names:
+            repo = _make_git_repo_with_fcontext(tmp_path, n)
+            import_experience_git(workspace, str(repo), name=n)
+        rc = update_experience(workspace)
+        assert rc == 0
+        assert sorted(r.name for r in _load_ex(workspace)) == names
+        out = capsys.readouterr().out
+        for n in names:
+            assert f"updating '{n}'" in out
+            assert (workspace / ".fcontext" / "_experiences" / n / "_cache" / "spec.md").exists()
+
+    def test_update_writes_registry_once(self, workspace: Path, tmp_path: Path):
+        for n in ("one", "two", "three"):
+            import_experience_git(workspace, str(_make_git_repo_with_fcontext(tmp_path, n)), name=n)
+        from fcontext import experience
+        with patch("fcontext.experience._save_ex", wraps=experience._save_ex) as save:
+            assert update_experience(workspace) == 0
+        assert save.call_count == 1
+        assert [r.name for r in _load_ex(workspace)] == ["one", "two", "three"]
+
+    def test_update_output_in_pack_order(self, workspace: Path, tmp_path: Path, capsys):
+        import threading
+        import time
+        for n in ("first", "second"):
+            import_experience_git(workspace, str(_make_git_repo_with_fcontext(tmp_path, n)), name=n)
+        capsys.readouterr()
+        second_done = threading.Event()
+
+        def fake_import(root, url, name, out, err, **kwargs):
+            if name == "first":
+                second_done.wait(5)
+            print(f"  start {name}", file=out)
+            time.sleep(0.01)
+            print(f"  end {name}", file=err)
+            if name == "second":
+                second_done.set()
+            return 0 if name == "first" else 1
+
+        with patch("fcontext.experience.import_experience_git", side_effect=fake_import):
+            assert update_experience(workspace) == 1
+        out, err = capsys.readouterr()
+        assert out.splitlines() == [
+            "  updating 'first' (local-git) ...", "  start first",
+            "  updating 'second' (local-git) ...", "  start second",
+        ]
+        assert err.splitlines() == ["  end first", "  end second", "  ✗ failed to update 'second'"]
+
+    def test_update_leaves_std_streams_alone(self, workspace: Path, tmp_path: Path):
+        import sys
+        import_experience_git(workspace, str(_make_git_repo_with_fcontext(tmp_path, "one")), name="one")
+        streams = (sys.stdout, sys.stderr)
+        seen = []
+
+        def fake_import(root, url, name, **kwargs):
+            seen.append((sys.stdout, sys.stderr))
+            return 0
+
+        with patch("fcontext.experience.import_experience_git", side_effect=fake_import):
+            assert update_experience(workspace) == 0
+        assert seen == [streams]
+
     def test_update_url_experience(self, workspace: Path, tmp_path: Path, capsys):
         """URL-imported experiences should be re-downloaded."""
         data_v1 = self._make_zip_bytes(tmp_path, tag="v1")
@@ -1055,12 +1404,12 @@ class TestExperienceUpdate:
         data = self._make_zip_bytes(tmp_path)
         with patch("fcontext.experience.urlopen", return_value=self._mock_urlopen(data)):
             import_experience(workspace, "https://example.com/pack.zip", name="ts")
-        old_ts = _load_ex(workspace)[0]["imported_at"]
+        old_ts = _load_ex(workspace)[0].imported_at
 
         data_v2 = self._make_zip_bytes(tmp_path, tag="v2")
         with patch("fcontext.experience.urlopen", return_value=self._mock_urlopen(data_v2)):
             update_experience(workspace, name="ts")
-        new_ts = _load_ex(workspace)[0]["imported_at"]
+        new_ts = _load_ex(workspace)[0].imported_at
         # Timestamp should be updated (or at least equal if test is very fast)
         assert new_ts >= old_ts
 
@@ -1075,9 +1424,9 @@ class TestExperienceUpdate:
             update_experience(workspace, name="keep")
 
         rows = _load_ex(workspace)
-        row = next(r for r in rows if r["name"] == "keep")
-        assert row["source_type"] == "url"
-        assert row["source"] == "https://example.com/pack.zip"
+        row = next(r for r in rows if r.name == "keep")
+        assert row.source_type == "url"
+        assert row.source == "https://example.com/pack.zip"
 
 
 # ── Coverage gap tests ──────────────────────────────────────────────────
@@ -1111,6 +1460,35 @@ class TestGitignoreEdgeCases:
             gi.unlink()
         _gitignore_remove(workspace, "nonexistent")  # should not raise
 
+    def test_gitignore_remove_matches_whole_lines_only(self, workspace: Path):
+        gi = _gitignore_path(workspace)
+        gi.write_text("backup_experiences/foo/\n_experiences/foo/\n_experiences/foo-bar/\n",
+                      encoding="utf-8")
+        _gitignore_remove(workspace, "foo")
+        assert gi.read_text(encoding="utf-8") == "backup_experiences/foo/\n_experiences/foo-bar/\n"
+
+    def test_gitignore_add_ignores_substring_matches(self, workspace: Path):
+        gi = _gitignore_path(workspace)
+        gi.write_text("backup_experiences/foo/\n", encoding="utf-8")
+        _gitignore_add(workspace, "foo")
+        assert gi.read_text(encoding="utf-8") == "backup_experiences/foo/\n_experiences/foo/\n"
+
+    def test_gitignore_mutate_batches_adds_and_removes(self, workspace: Path):
+        from fcontext.experience import _gitignore_mutate
+        gi = _gitignore_path(workspace)
+        gi.write_text("*.tmp\n_experiences/old/\n", encoding="utf-8")
+        _gitignore_mutate(workspace, adds=["a", "b", "a"], removes=["old"])
+        assert gi.read_text(encoding="utf-8") == "*.tmp\n_experiences/a/\n_experiences/b/\n"
+        assert not gi.with_name(".gitignore.tmp").exists()
+
+    def test_gitignore_mutate_noop_does_not_rewrite(self, workspace: Path):
+        from fcontext.experience import _gitignore_mutate
+        gi = _gitignore_path(workspace)
+        gi.write_text("_experiences/keep/\n", encoding="utf-8")
+        with patch("fcontext.experience.os.replace") as replace:
+            _gitignore_mutate(workspace, adds=["keep"], removes=["missing"])
+        replace.assert_not_called()
+
 
 class TestListEdgeCases:
     """Cover list_experiences edge cases."""
@@ -1125,6 +1503,11 @@ class TestListEdgeCases:
         out = capsys.readouterr().out
         assert "no experience packs" in out
 
+    def test_list_experiences_path_is_a_file(self, workspace: Path, capsys):
+        (workspace / ".fcontext" / "_experiences").write_text("not a dir")
+        assert list_experiences(workspace) == 0
+        assert "no experience packs" in capsys.readouterr().out
+
     def test_list_shows_branch_info(self, workspace: Path, tmp_path: Path, capsys):
         """L167: list should display branch info when recorded."""
         repo = _make_git_repo_with_fcontext(tmp_path, "branched_list")
@@ -1191,8 +1574,8 @@ class TestImportGitRemoteGitignore:
 
         # Also check ex.csv records source_type as "git" (not "local-git")
         rows = _load_ex(workspace)
-        row = next(r for r in rows if r["name"] == "remote_sim")
-        assert row["source_type"] == "git"
+        row = next(r for r in rows if r.name == "remote_sim")
+        assert row.source_type == "git"
 
 
 class TestZipDirectoryEntries:
@@ -1268,8 +1651,8 @@ class TestExportGitFailures:
         bad_url = "https://invalid.example/no-repo.git"
         with patch("subprocess.run") as mock_run:
             # First call: clone fails; second call: init fails
-            clone_fail = MagicMock(returncode=128, stderr="clone failed")
-            init_fail = MagicMock(returncode=1, stderr="init failed")
+            clone_fail = MagicMock(returncode=128, stderr=b"clone failed")
+            init_fail = MagicMock(returncode=1, stderr=b"init failed")
             mock_run.side_effect = [clone_fail, init_fail]
             rc = _export_to_git(workspace, bad_url)
         assert rc == 1
@@ -1280,9 +1663,9 @@ class TestExportGitFailures:
         (workspace / ".fcontext" / "_topics" / "note.md").write_text("note")
         bad_url = "https://invalid.example/no-repo.git"
         with patch("subprocess.run") as mock_run:
-            clone_fail = MagicMock(returncode=128, stderr="clone failed")
+            clone_fail = MagicMock(returncode=128, stderr=b"clone failed")
             init_ok = MagicMock(returncode=0)
-            remote_fail = MagicMock(returncode=1, stderr="remote add failed")
+            remote_fail = MagicMock(returncode=1, stderr=b"remote add failed")
             mock_run.side_effect = [clone_fail, init_ok, remote_fail]
             rc = _export_to_git(workspace, bad_url)
         assert rc == 1
@@ -1293,18 +1676,27 @@ class TestExportGitFailures:
         (workspace / ".fcontext" / "_topics" / "note.md").write_text("note")
         bad_url = "https://invalid.example/no-repo.git"
         with patch("subprocess.run") as mock_run:
-            clone_fail = MagicMock(returncode=128, stderr="clone failed")
+            clone_fail = MagicMock(returncode=128, stderr=b"clone failed")
             init_ok = MagicMock(returncode=0)
             remote_ok = MagicMock(returncode=0)
             add_ok = MagicMock(returncode=0)  # git add
             diff_has_changes = MagicMock(returncode=1)  # diff --cached shows changes
-            commit_fail = MagicMock(returncode=1, stderr="commit failed")
+            commit_fail = MagicMock(returncode=1, stderr=b"commit failed")
             mock_run.side_effect = [clone_fail, init_ok, remote_ok, add_ok,
                                     diff_has_changes, commit_fail]
             rc = _export_to_git(workspace, bad_url)
         assert rc == 1
         assert "git commit failed" in capsys.readouterr().err
 
+    def test_export_git_undecodable_stderr(self, workspace: Path, capsys):
+        (workspace / ".fcontext" / "_topics" / "note.md").write_text("note")
+        with patch("subprocess.run") as mock_run:
+            mock_run.side_effect = [MagicMock(returncode=128),
+                                    MagicMock(returncode=1, stderr=b"bad \xff byte\n")]
+            rc = _export_to_git(workspace, "https://invalid.example/no-repo.git")
+        assert rc == 1
+        assert "git init failed: bad \ufffd byte" in capsys.readouterr().err
+
 
 class TestHumanSize:
     """Cover _human_size edge cases."""
@@ -1341,3 +1733,20 @@ class TestCollectKnowledgeEdgeCases:
         out_zip = tmp_path / "export.zip"
         rc = export_experience(workspace, str(out_zip))
         assert rc == 0
+
+    def test_iter_files_skips_unreadable_dirs(self, tmp_path: Path):
+        from fcontext.experience import _iter_files
+        (tmp_path / "a").mkdir()
+        (tmp_path / "a" / "x.md").write_text("x")
+        (tmp_path / "b" / "c").mkdir(parents=True)
+        (tmp_path / "b" / "c" / "y.md").write_text("y")
+        real_scandir = os.scandir
+
+        def flaky(path):
+            if path.endswith("c"):
+                raise PermissionError(path)
+            return real_scandir(path)
+
+        with patch("fcontext.experience.os.scandir", side_effect=flaky):
+            names = sorted(e.name for e in _iter_files(tmp_path))
+        assert names == ["x.md"]
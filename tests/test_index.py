@@ -2,16 +2,26 @@
 import json
 import os
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from unittest.mock import patch, MagicMock
+
+import pytest
+
 from fcontext.indexer import (
     run_index, run_index_file, run_index_dir, run_status, run_clean,
     _load_index, _save_index, _convert_file, _copy_text_file, _index_one,
-    _cache_dir, _cache_filename, _scan_convertible, _index_path,
+    _cache_dir, _cache_filename, _cached_mds, _journal_path, _load_dirstate, _scan_convertible, _index_path,
     _is_image_ext, _ocr_image_file, _indexable_exts,
 )
 
 
+@pytest.fixture(autouse=True)
+def _fresh_converter(monkeypatch):
+    """Tests swap sys.modules["markitdown"]; drop any cached converter."""
+    monkeypatch.setattr("fcontext.indexer._converter", None)
+
+
 class TestIndex:
     """TASK-004: 测试 index — 增量转换与mtime跳过"""
 
@@ -26,7 +36,7 @@ class TestIndex:
         self._create_dummy_pdf(workspace)
         from fcontext.indexer import _scan_convertible
         files = _scan_convertible(workspace)
-        assert any(f.name == "test.pdf" for f in files)
+        assert any(os.path.basename(f) == "test.pdf" for f, _ in files)
 
     def test_scan_skips_hidden_dirs(self, workspace: Path):
         hidden = workspace / ".hidden"
@@ -34,13 +44,13 @@ class TestIndex:
         (hidden / "secret.pdf").write_bytes(b"%PDF")
         from fcontext.indexer import _scan_convertible
         files = _scan_convertible(workspace)
-        assert not any("secret.pdf" in str(f) for f in files)
+        assert not any("secret.pdf" in str(f) for f, _ in files)
 
     def test_scan_skips_fcontext(self, workspace: Path):
         (workspace / ".fcontext" / "internal.pdf").write_bytes(b"%PDF")
         from fcontext.indexer import _scan_convertible
         files = _scan_convertible(workspace)
-        assert not any("internal.pdf" in str(f) for f in files)
+        assert not any("internal.pdf" in str(f) for f, _ in files)
 
     def test_cache_filename_deterministic(self):
         from fcontext.indexer import _cache_filename
@@ -55,6 +65,19 @@ class TestIndex:
         b = _cache_filename("docs/other.pdf")
         assert a != b
 
+    def test_cache_filename_sanitizes_stem(self):
+        assert _cache_filename("docs/a b&c.pdf").startswith("a_b_c_")
+        assert _cache_filename("docs/需求—说明.pdf").startswith("需求_说明_")
+        assert _cache_filename("café«x».md").startswith("café_x__")
+
+    def test_reindex_reuses_indexed_cache_name(self, workspace: Path):
+        md = workspace / "notes.md"
+        md.write_text("v1")
+        _save_index(workspace, {"notes.md": {"md": ".fcontext/_cache/legacy.md", "mtime": 0}})
+        run_index_file(workspace, md)
+        assert _load_index(workspace)["notes.md"]["md"] == ".fcontext/_cache/legacy.md"
+        assert "v1" in (workspace / ".fcontext" / "_cache" / "legacy.md").read_text()
+
     def test_index_json_structure(self, workspace: Path):
         """After index, _index.json has correct structure."""
         idx_path = workspace / ".fcontext" / "_index.json"
@@ -91,6 +114,23 @@ class TestStatus:
         out = capsys.readouterr().out
         assert "Pending:" in out
 
+    def test_status_counts_every_category(self, workspace: Path, capsys):
+        for name in ("fresh.md", "stale.md", "new.md"):
+            (workspace / name).write_text(name)
+        _save_index(workspace, {
+            "fresh.md": {"md": "f.md", "mtime": 4102444800},
+            "stale.md": {"md": "s.md", "mtime": 0},
+            "gone.md": {"md": "g.md", "mtime": 0},
+        })
+        run_status(workspace)
+        out = capsys.readouterr().out
+        assert "Convertible: 3 files" in out
+        assert "Indexed:     3 files" in out
+        assert "Pending:     1 files" in out
+        assert "Stale:       1 files" in out
+        assert "Orphaned:    1 entries" in out
+        assert "to index 2 files" in out
+
 
 class TestClean:
     """TASK-005 partial: 测试 clean"""
@@ -224,7 +264,7 @@ class TestIndexText:
 
         from fcontext.indexer import _scan_convertible
         files = _scan_convertible(workspace)
-        names = {f.name for f in files}
+        names = {os.path.basename(f) for f, _ in files}
         assert "doc.pdf" in names
         assert "notes.md" in names
         assert "data.csv" not in names
@@ -256,12 +296,12 @@ class TestIndexText:
         assert rc2 == 0  # up-to-date, not re-copied
 
     def test_text_index_in_index_json(self, workspace: Path):
-        """Text file should appear in _index.json after indexing."""
+        """Text file should appear in the index after indexing."""
         md = workspace / "readme.md"
         md.write_text("# README")
         run_index_file(workspace, md)
 
-        idx = json.loads((workspace / ".fcontext" / "_index.json").read_text())
+        idx = _load_index(workspace)
         assert "readme.md" in idx
         assert idx["readme.md"]["md"].startswith(".fcontext/_cache/")
 
@@ -288,7 +328,7 @@ class TestIndexText:
         (workspace / "app.log").write_text("log line")
 
         files = _scan_convertible(workspace)
-        names = {f.name for f in files}
+        names = {os.path.basename(f) for f, _ in files}
         assert "config.json" not in names
         assert "config.yaml" not in names
         assert "page.html" not in names
@@ -376,7 +416,7 @@ class TestCopyTextFileError:
         source = tmp_path / "bad.md"
         source.write_text("content")
         cache_path = tmp_path / "output.md"
-        with patch("pathlib.Path.read_text", side_effect=PermissionError("denied")):
+        with patch("fcontext.indexer.open", side_effect=PermissionError("denied"), create=True):
             result = _copy_text_file(source, cache_path, "bad.md")
         assert result is False
         assert "bad.md" in capsys.readouterr().err
@@ -499,13 +539,34 @@ class TestRunStatusEdgeCases:
         run_index_file(workspace, md)
         index = _load_index(workspace)
         for key in index:
-            index[key]["mtime"] = 0
+            index[key]["mtime_ns"] = 0
         _save_index(workspace, index)
         capsys.readouterr()
         run_status(workspace)
         out = capsys.readouterr().out
         assert "Stale:" in out
 
+    def test_status_sees_nanosecond_edit(self, workspace: Path, capsys):
+        md = workspace / "doc.md"
+        md.write_text("# Doc")
+        run_index_file(workspace, md)
+        ns = md.stat().st_mtime_ns + 1  # below float st_mtime's resolution
+        os.utime(md, ns=(ns, ns))
+        capsys.readouterr()
+        run_status(workspace)
+        assert "Stale:       1 files" in capsys.readouterr().out
+
+    def test_legacy_float_mtime_entry_is_read(self, workspace: Path, capsys):
+        md = workspace / "doc.md"
+        md.write_text("# Doc")
+        run_index_file(workspace, md)
+        entry = _load_index(workspace)["doc.md"]
+        entry["mtime"] = entry.pop("mtime_ns") / 1e9 + 1
+        _save_index(workspace, {"doc.md": entry})
+        capsys.readouterr()
+        run_index_file(workspace, md)
+        assert "up-to-date" in capsys.readouterr().out
+
     def test_status_shows_orphaned(self, workspace: Path, capsys):
         md = workspace / "doc.md"
         md.write_text("# Doc")
@@ -549,13 +610,77 @@ class TestScanConvertibleSkipsHidden:
         (workspace / ".hidden.md").write_text("secret")
         (workspace / "visible.md").write_text("public")
         files = _scan_convertible(workspace)
-        names = {f.name for f in files}
+        names = {os.path.basename(f) for f, _ in files}
         assert ".hidden.md" not in names
         assert "visible.md" in names
 
 
 # ── Image OCR tests ───────────────────────────────────────────────────────────
 
+class TestScanConvertibleWalk:
+    """The scandir walker behaves like the os.walk scan it replaced."""
+
+    def test_scan_recurses_and_skips_skip_dirs(self, workspace: Path):
+        (workspace / "a" / "b").mkdir(parents=True)
+        (workspace / "a" / "b" / "deep.md").write_text("deep")
+        (workspace / "node_modules").mkdir()
+        (workspace / "node_modules" / "pkg.md").write_text("vendored")
+        names = {os.path.basename(f) for f, _ in _scan_convertible(workspace)}
+        assert "deep.md" in names
+        assert "pkg.md" not in names
+
+    def test_scan_skips_unreadable_dirs(self, workspace: Path):
+        (workspace / "locked").mkdir()
+        (workspace / "locked" / "x.md").write_text("x")
+        (workspace / "open.md").write_text("y")
+        real_scandir = os.scandir
+
+        def flaky(path):
+            if path.endswith("locked"):
+                raise PermissionError(path)
+            return real_scandir(path)
+
+        with patch("fcontext.indexer.os.scandir", side_effect=flaky):
+            names = {os.path.basename(f) for f, _ in _scan_convertible(workspace)}
+        assert names == {"open.md"}
+
+    def test_scan_wide_tree_walks_in_parallel(self, workspace: Path):
+        for i in range(6):
+            (workspace / f"d{i}" / "sub").mkdir(parents=True)
+            (workspace / f"d{i}" / "sub" / f"f{i}.md").write_text("x")
+        (workspace / "d0" / "node_modules").mkdir()
+        (workspace / "d0" / "node_modules" / "pkg.md").write_text("vendored")
+        with patch("fcontext.indexer.ThreadPoolExecutor", wraps=ThreadPoolExecutor) as pool:
+            found = _scan_convertible(workspace)
+        pool.assert_called_once()
+        assert found == sorted(found)
+        names = {os.path.basename(f) for f, _ in found}
+        assert {f"f{i}.md" for i in range(6)} <= names
+        assert "pkg.md" not in names
+
+    def test_scan_matches_extensions_by_last_dot(self, workspace: Path):
+        for name in ["REPORT.PDF", "archive.tar.md", "md", "Makefile", "notes.md.bak"]:
+            (workspace / name).write_text("x")
+        names = {os.path.basename(f) for f, _ in _scan_convertible(workspace)}
+        assert names == {"REPORT.PDF", "archive.tar.md"}
+
+    def test_scan_carries_stat_into_index(self, workspace: Path):
+        md = workspace / "notes.md"
+        md.write_text("hello")
+        files = _scan_convertible(workspace)
+        assert files == [(str(md), files[0][1])]
+        assert files[0][1].st_size == 5
+        run_index(workspace)
+        entry = _load_index(workspace)["notes.md"]
+        assert entry["mtime_ns"] == files[0][1].st_mtime_ns
+        assert entry["size"] == 5
+
+    def test_scan_narrow_tree_stays_serial(self, workspace: Path):
+        with patch("fcontext.indexer.ThreadPoolExecutor") as pool:
+            _scan_convertible(workspace)
+        pool.assert_not_called()
+
+
 class TestImageExt:
     """_is_image_ext utility."""
 
@@ -581,7 +706,7 @@ class TestScanFindsImages:
         (workspace / "photo.jpg").write_bytes(b"dummy jpg")
         with patch("platform.system", return_value="Darwin"):
             files = _scan_convertible(workspace)
-        names = {f.name for f in files}
+        names = {os.path.basename(f) for f, _ in files}
         assert "screenshot.png" in names
         assert "photo.jpg" in names
 
@@ -590,7 +715,7 @@ class TestScanFindsImages:
         (workspace / "data.csv").write_text("a,b")
         with patch("platform.system", return_value="Darwin"):
             files = _scan_convertible(workspace)
-        names = {f.name for f in files}
+        names = {os.path.basename(f) for f, _ in files}
         assert "image.png" in names
         assert "data.csv" not in names
 
@@ -743,7 +868,7 @@ class TestRunIndexFileImage:
         img.write_bytes(b"dummy")
         with patch("fcontext.indexer._ocr_image_file", return_value=True):
             run_index_file(workspace, img)
-        idx = json.loads((workspace / ".fcontext" / "_index.json").read_text())
+        idx = _load_index(workspace)
         assert "img.png" in idx
         assert idx["img.png"]["md"].startswith(".fcontext/_cache/")
 
@@ -899,7 +1024,7 @@ class TestScanSkipsImagesOnNonMacOS:
         (workspace / "doc.pdf").write_bytes(b"%PDF")
         with patch("platform.system", return_value="Linux"):
             files = _scan_convertible(workspace)
-        names = {f.name for f in files}
+        names = {os.path.basename(f) for f, _ in files}
         assert "img.png" not in names
         assert "doc.pdf" in names
 
@@ -908,7 +1033,7 @@ class TestScanSkipsImagesOnNonMacOS:
         (workspace / "doc.pdf").write_bytes(b"%PDF")
         with patch("platform.system", return_value="Darwin"):
             files = _scan_convertible(workspace)
-        names = {f.name for f in files}
+        names = {os.path.basename(f) for f, _ in files}
         assert "img.png" in names
         assert "doc.pdf" in names
 
@@ -1065,3 +1190,410 @@ class TestRunIndexDirPrintSummary:
         assert rc == 0
         out = capsys.readouterr().out
         assert "Found 1 indexable files" in out
+
+
+class TestParallelConversion:
+    """Binary conversions fan out to a process pool."""
+
+    def test_pool_converts_and_reports_failures(self, workspace: Path, capsys):
+        (workspace / "a.pdf").write_bytes(b"%PDF-1.4 alpha")
+        (workspace / "b.pdf").write_bytes(b"%PDF-1.4 beta")
+        # A directory in the way makes b.pdf's cache write fail
+        (_cache_dir(workspace) / _cache_filename("b.pdf")).mkdir(parents=True)
+        capsys.readouterr()
+        with patch("fcontext.indexer.os.cpu_count", return_value=2):
+            rc = run_index(workspace)
+        assert rc == 0
+        captured = capsys.readouterr()
+        assert "→ a.pdf" in captured.out and "→ b.pdf" in captured.out
+        assert "1 indexed, 0 up-to-date, 1 failed" in captured.out
+        assert "b.pdf" in captured.err
+        index = _load_index(workspace)
+        assert list(index) == ["a.pdf"]
+        assert "alpha" in (workspace / index["a.pdf"]["md"]).read_text()
+
+    def test_convert_worker_captures_errors(self, tmp_path: Path, capsys):
+        from fcontext.indexer import _convert_worker
+        ok, err = _convert_worker((str(tmp_path / "missing.pdf"), str(tmp_path / "out.md"), "missing.pdf"))
+        assert ok is False
+        assert "missing.pdf" in err
+        assert capsys.readouterr().err == ""
+
+
+class TestCachedMds:
+    """The freshness check reads the cache directory once."""
+
+    def test_lists_cache_relative_to_root(self, workspace: Path):
+        (_cache_dir(workspace) / "a_1.md").write_text("a")
+        assert _cached_mds(workspace) == {os.path.join(".fcontext", "_cache", "a_1.md")}
+
+    def test_missing_cache_is_empty(self, empty_dir: Path):
+        assert _cached_mds(empty_dir) == set()
+
+    def test_deleted_cache_file_is_reindexed(self, workspace: Path, capsys):
+        (workspace / "notes.md").write_text("hello")
+        run_index(workspace)
+        md = workspace / _load_index(workspace)["notes.md"]["md"]
+        md.unlink()
+        capsys.readouterr()
+        run_index(workspace)
+        assert "1 indexed, 0 up-to-date" in capsys.readouterr().out
+        assert md.exists()
+
+
+class TestIndexJournal:
+    """Single-file indexing appends to _index.jsonl instead of rewriting _index.json."""
+
+    def test_index_file_appends_journal_line(self, workspace: Path):
+        (workspace / "a.md").write_text("a")
+        (workspace / "b.md").write_text("b")
+        run_index_file(workspace, workspace / "a.md")
+        run_index_file(workspace, workspace / "b.md")
+        assert json.loads(_index_path(workspace).read_text()) == {}
+        lines = _journal_path(workspace).read_text().splitlines()
+        assert [json.loads(line)["rel"] for line in lines] == ["a.md", "b.md"]
+        assert set(_load_index(workspace)) == {"a.md", "b.md"}
+
+    def test_later_lines_supersede_and_torn_line_is_ignored(self, workspace: Path):
+        _save_index(workspace, {"a.md": {"md": "old.md", "mtime": 1}})
+        _journal_path(workspace).write_text(
+            '{"rel": "a.md", "md": "new.md", "mtime": 2}\n{"rel": "b.md", "md"'
+        )
+        assert _load_index(workspace) == {"a.md": {"md": "new.md", "mtime": 2}}
+
+    def test_full_run_folds_journal_into_snapshot(self, workspace: Path):
+        (workspace / "a.md").write_text("a")
+        run_index_file(workspace, workspace / "a.md")
+        run_index(workspace)
+        assert not _journal_path(workspace).exists()
+        assert "a.md" in json.loads(_index_path(workspace).read_text())
+
+    def test_large_journal_is_compacted(self, workspace: Path):
+        (workspace / "a.md").write_text("a")
+        with patch("fcontext.indexer._JOURNAL_COMPACT_BYTES", 10):
+            run_index_file(workspace, workspace / "a.md")
+        assert not _journal_path(workspace).exists()
+        assert "a.md" in json.loads(_index_path(workspace).read_text())
+
+
+class TestJsonFallback:
+    """Without orjson installed the index is read and written with stdlib json."""
+
+    def test_stdlib_round_trip(self, workspace: Path):
+        import importlib.util
+        import sys
+        import fcontext.indexer as indexer
+        spec = importlib.util.spec_from_file_location("fcontext._indexer_no_orjson", indexer.__file__)
+        mod = importlib.util.module_from_spec(spec)
+        with patch.dict(sys.modules, {"orjson": None}):
+            spec.loader.exec_module(mod)
+        assert mod.orjson is None
+        mod._save_index(workspace, {"文档.md": {"md": "x.md", "mtime": 1.5}})
+        assert "文档.md" in _index_path(workspace).read_text(encoding="utf-8")
+        mod._append_index(workspace, {"b.md": {"md": "b.md", "mtime": 2}}, "b.md")
+        assert mod._load_index(workspace) == _load_index(workspace) == {
+            "文档.md": {"md": "x.md", "mtime": 1.5},
+            "b.md": {"md": "b.md", "mtime": 2},
+        }
+
+
+class TestGitignoreUpgrade:
+    """New index artifacts are added to a .gitignore from an older init."""
+
+    def test_first_index_adds_entries(self, workspace: Path):
+        from fcontext.indexer import _append_index
+        gi = workspace / ".fcontext" / ".gitignore"
+        gi.write_text("# Regenerable artifacts (fcontext init)\n_workspace.map\n_index.json\n")
+        _append_index(workspace, {"a.md": {"md": "a.md", "mtime": 1}}, "a.md")
+        assert "_index.jsonl" in gi.read_text().splitlines()
+        gi.write_text("_index.jsonl\n")
+        run_index(workspace)
+        assert "_dirstate.json" in gi.read_text().splitlines()
+        before = gi.read_text()
+        run_index(workspace)
+        assert gi.read_text() == before
+
+
+class TestDirState:
+    """run_index re-lists only directories whose mtime changed."""
+
+    OLD = 1_600_000_000
+
+    def _age(self, *dirs: Path):
+        for d in dirs:
+            os.utime(d, (self.OLD, self.OLD))
+
+    def _listed(self, workspace: Path) -> list:
+        from fcontext import indexer
+        with patch("fcontext.indexer._scan_dir", wraps=indexer._scan_dir) as scan:
+            run_index(workspace)
+        return [c.args[0] for c in scan.call_args_list]
+
+    def test_unchanged_dirs_are_not_relisted(self, workspace: Path):
+        docs = workspace / "docs"
+        docs.mkdir()
+        (docs / "a.md").write_text("a")
+        self._age(workspace, docs)
+        assert str(docs) in self._listed(workspace)
+        assert self._listed(workspace) == []
+        assert set(_load_index(workspace)) == {"docs/a.md"}
+
+    def test_edit_in_unchanged_dir_is_reindexed(self, workspace: Path, capsys):
+        docs = workspace / "docs"
+        docs.mkdir()
+        (docs / "a.md").write_text("a")
+        self._age(workspace, docs)
+        run_index(workspace)
+        (docs / "a.md").write_text("edited")
+        future = _load_index(workspace)["docs/a.md"]["mtime_ns"] + 100 * 10**9
+        os.utime(docs / "a.md", ns=(future, future))
+        self._age(docs)
+        capsys.readouterr()
+        run_index(workspace)
+        assert "1 indexed, 0 up-to-date" in capsys.readouterr().out
+
+    def test_added_file_relists_dir(self, workspace: Path):
+        docs = workspace / "docs"
+        docs.mkdir()
+        self._age(workspace, docs)
+        run_index(workspace)
+        (docs / "new.md").write_text("n")
+        assert self._listed(workspace) == [str(docs)]
+        assert "docs/new.md" in _load_index(workspace)
+
+    def test_vanished_entries_are_skipped(self, workspace: Path):
+        docs = workspace / "docs"
+        (docs / "sub").mkdir(parents=True)
+        (docs / "a.md").write_text("a")
+        self._age(workspace, docs, docs / "sub")
+        run_index(workspace)
+        (docs / "a.md").unlink()
+        (docs / "sub").rmdir()
+        self._age(docs)
+        assert _scan_convertible(workspace, _load_dirstate(workspace)) == []
+
+    def test_recent_dirs_are_not_recorded(self, workspace: Path):
+        (workspace / "docs").mkdir()
+        run_index(workspace)
+        assert str(workspace / "docs") not in _load_dirstate(workspace)
+
+    def test_corrupt_dirstate_is_ignored(self, workspace: Path):
+        (workspace / ".fcontext" / "_dirstate.json").write_text("{not json")
+        assert _load_dirstate(workspace) == {}
+
+
+class TestStreamedCacheWrites:
+    """Cache files are written by streaming the header and body."""
+
+    def test_copy_text_preserves_content_and_normalizes_newlines(self, tmp_path: Path):
+        source = tmp_path / "big.md"
+        body = "línea\r\n" * 300_000
+        source.write_bytes(body.encode("utf-8") + b"\xff")
+        cache_path = tmp_path / "out.md"
+        assert _copy_text_file(source, cache_path, "big.md")
+        assert cache_path.read_bytes().decode("utf-8") == (
+            "<!-- source: big.md -->\n\n" + body.replace("\r\n", "\n") + "�"
+        )
+
+
+class TestAtomicSaveIndex:
+    """_save_index replaces the index atomically."""
+
+    def test_failed_replace_keeps_previous_index(self, workspace: Path):
+        _save_index(workspace, {"a.md": {"md": "a.md", "mtime": 1}})
+        with patch("fcontext.indexer.os.replace", side_effect=OSError("disk gone")):
+            with pytest.raises(OSError):
+                _save_index(workspace, {})
+        assert json.loads(_index_path(workspace).read_text()) == {"a.md": {"md": "a.md", "mtime": 1}}
+
+    def test_no_tmp_file_left_behind(self, workspace: Path):
+        _save_index(workspace, {})
+        assert not (workspace / ".fcontext" / "_index.json.tmp").exists()
+
+
+class TestStringPathOps:
+    """Relative paths and cache stems are derived with string slicing."""
+
+    @pytest.mark.parametrize("rel", [
+        "docs/report.pdf", "report.pdf", "a/b.c/noext", "a/archive.tar.gz",
+        "dir.v2/.hidden", "x" * 60 + ".md",
+    ])
+    def test_stem_matches_pathlib(self, rel: str):
+        stem = Path(rel).stem[:40]
+        assert _cache_filename(rel).startswith(stem.replace(".", "_") + "_")
+
+    def test_index_dir_records_root_relative_paths(self, workspace: Path):
+        (workspace / "docs" / "sub").mkdir(parents=True)
+        (workspace / "docs" / "sub" / "a.md").write_text("a")
+        run_index_dir(workspace, workspace / "docs")
+        assert list(_load_index(workspace)) == [os.path.join("docs", "sub", "a.md")]
+
+
+class TestConverterSingleton:
+    """One MarkItDown instance serves every conversion in a process."""
+
+    def test_converter_is_built_once(self, tmp_path: Path):
+        import sys
+        import types
+        fake = types.ModuleType("markitdown")
+        fake.MarkItDown = MagicMock(return_value=MagicMock(**{"convert.return_value.text_content": "ok"}))
+        with patch.dict(sys.modules, {"markitdown": fake}):
+            for name in ("a.pdf", "b.pdf"):
+                (tmp_path / name).write_bytes(b"%PDF")
+                assert _convert_file(tmp_path / name, tmp_path / f"{name}.md", name)
+        fake.MarkItDown.assert_called_once_with()
+
+
+class TestContentDedup:
+    """Identical content is converted once and reused."""
+
+    def _fake_convert(self, calls: list):
+        def convert(source, cache_path, rel_path):
+            calls.append(rel_path)
+            body = Path(source).read_bytes().decode()
+            Path(cache_path).write_text(f"<!-- source: {rel_path} -->\n\nbody of {body}\n")
+            return True
+        return convert
+
+    def test_duplicates_in_one_run_convert_once(self, workspace: Path):
+        (workspace / "a.pdf").write_bytes(b"same")
+        (workspace / "b.pdf").write_bytes(b"same")
+        calls: list = []
+        with patch("fcontext.indexer._convert_file", side_effect=self._fake_convert(calls)):
+            run_index(workspace)
+        assert calls == ["a.pdf"]
+        index = _load_index(workspace)
+        assert index["a.pdf"]["hash"] == index["b.pdf"]["hash"]
+        copy = (workspace / index["b.pdf"]["md"]).read_text()
+        assert copy == "<!-- source: b.pdf -->\n\nbody of same\n"
+
+    def test_new_duplicate_reuses_earlier_conversion(self, workspace: Path):
+        (workspace / "a.pdf").write_bytes(b"same")
+        calls: list = []
+        with patch("fcontext.indexer._convert_file", side_effect=self._fake_convert(calls)):
+            run_index(workspace)
+            (workspace / "b.pdf").write_bytes(b"same")
+            run_index(workspace)
+        assert calls == ["a.pdf"]
+        assert "b.pdf" in _load_index(workspace)
+
+    def test_touched_file_is_not_reconverted(self, workspace: Path, capsys):
+        pdf = workspace / "a.pdf"
+        pdf.write_bytes(b"same")
+        calls: list = []
+        with patch("fcontext.indexer._convert_file", side_effect=self._fake_convert(calls)):
+            run_index(workspace)
+            future = _load_index(workspace)["a.pdf"]["mtime_ns"] + 100 * 10**9
+            os.utime(pdf, ns=(future, future))
+            capsys.readouterr()
+            run_index(workspace)
+        assert calls == ["a.pdf"]
+        assert "0 indexed, 1 up-to-date" in capsys.readouterr().out
+        assert _load_index(workspace)["a.pdf"]["mtime_ns"] == future
+
+    def test_duplicate_of_failed_conversion_fails(self, workspace: Path, capsys):
+        (workspace / "a.pdf").write_bytes(b"same")
+        (workspace / "b.pdf").write_bytes(b"same")
+        with patch("fcontext.indexer._convert_file", return_value=False):
+            run_index(workspace)
+        assert "0 indexed, 0 up-to-date, 2 failed" in capsys.readouterr().out
+
+    def test_copy_converted_missing_source(self, tmp_path: Path, capsys):
+        from fcontext.indexer import _copy_converted
+        assert not _copy_converted(tmp_path / "gone.md", tmp_path / "out.md", "x.pdf")
+        assert "x.pdf" in capsys.readouterr().err
+
+    def test_empty_file_hash(self, tmp_path: Path):
+        import hashlib
+        from fcontext.indexer import _content_hash
+        (tmp_path / "empty.pdf").write_bytes(b"")
+        assert _content_hash(str(tmp_path / "empty.pdf"), 0) == hashlib.blake2b(digest_size=16).hexdigest()
+
+
+class TestProgressBatching:
+    """Per-file progress lines are written to stdout in batches."""
+
+    def test_flushes_by_count_and_at_end(self, capsys):
+        from fcontext.indexer import _Progress
+        with patch("fcontext.indexer._PROGRESS_LINES", 2):
+            progress = _Progress()
+            progress.add("a")
+            assert capsys.readouterr().out == ""
+            progress.add("b")
+            assert capsys.readouterr().out == "a\nb\n"
+            progress.add("c")
+            progress.flush()
+        assert capsys.readouterr().out == "c\n"
+
+    def test_flushes_after_a_second(self, capsys):
+        from fcontext.indexer import _Progress
+        with patch("fcontext.indexer.time.monotonic", side_effect=[0.0, 0.5, 1.5, 1.5]):
+            progress = _Progress()
+            progress.add("a")
+            assert capsys.readouterr().out == ""
+            progress.add("b")
+        assert capsys.readouterr().out == "a\nb\n"
+
+
+    def test_stderr_follows_its_progress_line(self, workspace: Path):
+        import io
+        from fcontext.indexer import _index_files
+        (workspace / "a.md").write_text("a")
+        (workspace / "b.pdf").write_bytes(b"b")
+        files = [(str(workspace / n), os.stat(workspace / n)) for n in ("a.md", "b.pdf")]
+        both = io.StringIO()
+
+        def failing(source, cache_path, rel, err):
+            print(f"  ✗ {rel}", file=err)
+            return False
+
+        def converting(source, cache_path, rel):
+            assert both.getvalue().endswith("  → b.pdf\n")  # shown before the wait
+            return False
+
+        with patch("sys.stdout", both), patch("sys.stderr", both), \
+             patch("fcontext.indexer._index_one", side_effect=failing), \
+             patch("fcontext.indexer._convert_file", side_effect=converting):
+            _index_files(workspace, files, {}, force=True)
+        assert both.getvalue() == "  → a.md\n  ✗ a.md\n  → b.pdf\n"
+
+
+class TestPrefetch:
+    """Sources are prefetched ahead of their conversion."""
+
+    def test_serial_conversion_prefetches_next_source(self, workspace: Path):
+        for name in ("a.pdf", "b.pdf", "c.pdf"):
+            (workspace / name).write_bytes(name.encode())
+        order: list = []
+        with patch("fcontext.indexer._prefetch", side_effect=lambda p: order.append(("prefetch", os.path.basename(p)))), \
+             patch("fcontext.indexer._convert_file", side_effect=lambda s, c, r: order.append(("convert", r)) or True), \
+             patch("fcontext.indexer.os.cpu_count", return_value=1):
+            run_index(workspace)
+        assert order == [
+            ("prefetch", "b.pdf"), ("convert", "a.pdf"),
+            ("prefetch", "c.pdf"), ("convert", "b.pdf"),
+            ("convert", "c.pdf"),
+        ]
+
+    def test_prefetch_is_a_best_effort_hint(self, tmp_path: Path, monkeypatch):
+        from fcontext.indexer import _prefetch
+        f = tmp_path / "doc.pdf"
+        f.write_bytes(b"data")
+        _prefetch(str(f))
+        _prefetch(str(tmp_path / "missing.pdf"))
+        with patch("fcontext.indexer.os.posix_fadvise", side_effect=OSError("unsupported")):
+            _prefetch(str(f))
+        monkeypatch.delattr(os, "posix_fadvise")
+        with patch("fcontext.indexer.os.open") as opener:
+            _prefetch(str(f))
+        opener.assert_not_called()
+
+    def test_pool_primes_a_window_of_sources(self, workspace: Path):
+        names = ["a.pdf", "b.pdf", "c.pdf", "d.pdf", "e.pdf"]
+        for name in names:
+            (workspace / name).write_bytes(b"%PDF-1.4 " + name.encode())
+        seen: list = []
+        with patch("fcontext.indexer._prefetch", side_effect=lambda p: seen.append(os.path.basename(p))), \
+             patch("fcontext.indexer.os.cpu_count", return_value=2):
+            run_index(workspace)
+        assert seen == ["c.pdf", "d.pdf", "e.pdf"]
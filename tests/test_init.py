@@ -1,5 +1,10 @@
 """Tests for fcontext init."""
+import sys
 from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
 from fcontext.init import init_workspace, enable_agent, get_all_agent_paths
 
 
@@ -25,6 +30,40 @@ class TestInit:
         assert "ex.csv" not in content
         assert "Git-imported" in content
 
+    def test_reinit_adds_missing_gitignore_entries(self, empty_dir: Path, capsys):
+        gi = empty_dir / ".fcontext" / ".gitignore"
+        gi.parent.mkdir()
+        gi.write_text(
+            "# Regenerable artifacts (fcontext init)\n_workspace.map\n_index.json\n\n"
+            "# Git-imported experiences (re-cloneable, managed by fcontext)\n"
+            "_experiences/pack/\n"
+        )
+        init_workspace(empty_dir)
+        assert "  update  .fcontext/.gitignore" in capsys.readouterr().out
+        assert gi.read_text().splitlines() == [
+            "# Regenerable artifacts (fcontext init)",
+            "_workspace.map",
+            "_index.json",
+            "_index.jsonl",
+            "_dirstate.json",
+            ".import-*/",
+            "",
+            "# Git-imported experiences (re-cloneable, managed by fcontext)",
+            "_experiences/pack/",
+        ]
+        init_workspace(empty_dir)
+        assert "update  .fcontext/.gitignore" not in capsys.readouterr().out
+
+    def test_ensure_gitignore_appends_without_experiences_section(self, empty_dir: Path):
+        from fcontext.init import _GITIGNORE_ENTRIES, ensure_gitignore
+
+        assert ensure_gitignore(empty_dir) == []
+        gi = empty_dir / ".fcontext" / ".gitignore"
+        gi.parent.mkdir()
+        gi.write_text("custom/\n")
+        assert ensure_gitignore(empty_dir) == list(_GITIGNORE_ENTRIES)
+        assert gi.read_text().splitlines()[0] == "custom/"
+
     def test_creates_readme(self, empty_dir: Path):
         init_workspace(empty_dir)
         readme = empty_dir / ".fcontext" / "_README.md"
@@ -58,6 +97,40 @@ class TestInit:
         assert csv.exists()
         assert "id,type,title" in csv.read_text()
 
+    def test_output_lists_created_files(self, empty_dir: Path, capsys):
+        init_workspace(empty_dir)
+        out = capsys.readouterr().out
+        lines = out.splitlines()
+        assert lines[:3] == [
+            "  create  .fcontext/.gitignore",
+            "  create  .fcontext/_README.md",
+            "  create  .fcontext/_index.json",
+        ]
+        assert "  create .fcontext/_workspace.map" in lines
+        assert out.endswith("Check what needs indexing\n\n")
+
+        init_workspace(empty_dir)
+        out = capsys.readouterr().out
+        assert "  create  .fcontext/.gitignore" not in out
+        assert out.startswith("  scan   workspace structure ...\n")
+
+    def test_reinit_only_creates_missing_dirs(self, empty_dir: Path):
+        init_workspace(empty_dir)
+        ctx = empty_dir / ".fcontext"
+        (ctx / "_topics").rmdir()
+        made = []
+        real_mkdir = Path.mkdir
+
+        def spy(self, *args, **kwargs):
+            made.append(self.relative_to(ctx).as_posix() if self != ctx else ".")
+            return real_mkdir(self, *args, **kwargs)
+
+        with patch.object(Path, "mkdir", spy):
+            init_workspace(empty_dir)
+        assert (ctx / "_topics").is_dir()
+        assert made[:3] == [".", "_topics", "_requirements/docs"]
+        assert "_cache" not in made
+
     def test_idempotent(self, empty_dir: Path):
         init_workspace(empty_dir)
         init_workspace(empty_dir)  # should not crash
@@ -83,3 +156,46 @@ class TestEnableCodex:
 
         assert "AGENTS.md" in paths
         assert ".codex/skills/fcontext/SKILL.md" in paths
+
+    def test_agent_paths_memoized(self):
+        assert get_all_agent_paths("opencode") is get_all_agent_paths("opencode")
+        assert get_all_agent_paths("opencode") == get_all_agent_paths("claude")
+
+    def test_agent_paths_table_covers_all_agents(self):
+        from fcontext.init import AGENT_CONFIGS, _agent_paths
+
+        assert set(_agent_paths()) == set(AGENT_CONFIGS)
+        assert get_all_agent_paths("openclaw")[0] == "skills/fcontext/SKILL.md"
+        assert get_all_agent_paths("unknown") == ()
+
+    def test_agent_configs_read_only(self):
+        from fcontext.init import AGENT_CONFIGS
+
+        with pytest.raises(TypeError):
+            AGENT_CONFIGS["new"] = {"skills_dir": "x"}
+
+
+class TestLazyTemplates:
+    def test_import_does_not_load_templates(self):
+        import importlib
+
+        with patch.dict(sys.modules):
+            sys.modules.pop("fcontext.init", None)
+            sys.modules.pop("fcontext._init_templates", None)
+            mod = importlib.import_module("fcontext.init")
+            assert "fcontext._init_templates" not in sys.modules
+            assert "SKILLS" not in vars(mod)
+            assert "fcontext" in mod.SKILLS
+
+    def test_template_names_resolve(self):
+        import fcontext.init as init_mod
+        from fcontext import _init_templates
+
+        assert init_mod.SKILLS is _init_templates.SKILLS
+        assert init_mod.AGENT_RULES_BODY is _init_templates.AGENT_RULES_BODY
+
+    def test_unknown_attribute_raises(self):
+        import fcontext.init as init_mod
+
+        with pytest.raises(AttributeError):
+            init_mod.NOT_A_TEMPLATE
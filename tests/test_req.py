@@ -1,9 +1,11 @@
 """Tests for fcontext req."""
 import os
 from pathlib import Path
+from unittest.mock import patch
+import pytest
 from fcontext.requirements import (
     req_init, req_add, req_list, req_show, req_set,
-    req_board, req_tree, req_comment, req_backlog_md,
+    req_board, req_tree, req_comment, req_backlog_md, req_board_and_backlog,
     req_link, req_trace,
     _load_items, _find_item, _parse_links, _next_id,
     _csv_path, _docs_dir, _append_changelog,
@@ -258,6 +260,24 @@ class TestBacklogMd:
         assert bl.exists()
         assert "REQ-001" in bl.read_text()
 
+    def test_board_and_backlog(self, workspace: Path, capsys):
+        req_add(workspace, "requirement", "R1")
+        rc = req_board_and_backlog(workspace)
+        assert rc == 0
+        assert "DRAFT" in capsys.readouterr().out
+        bl = workspace / ".fcontext" / "_requirements" / "_backlog.md"
+        assert "REQ-001" in bl.read_text()
+
+    def test_backlog_rows(self, workspace: Path):
+        req_add(workspace, "epic", "E1", author="ann")
+        req_add(workspace, "requirement", "R1", parent="EPIC-001")
+        req_set(workspace, "REQ-001", "status", "active")
+        req_backlog_md(workspace)
+        text = (workspace / ".fcontext" / "_requirements" / "_backlog.md").read_text()
+        assert "| draft | 1 |\n| active | 1 |\n| **Total** | **2** |" in text
+        assert "| EPIC-001 | epic | P2 | draft | E1 |  | ann |  |  |" in text
+        assert "| REQ-001 | requirement | P2 | active | R1 | EPIC-001 |  |  |  |" in text
+
 
 # ── Provenance (author, source) ───────────────────────────────────────────────
 
@@ -518,6 +538,19 @@ class TestNextIdValueError:
         assert next_id == "REQ-001"
 
 
+class TestTxnRollback:
+
+    def test_rollback_forgets_changes(self, workspace: Path):
+        from fcontext.requirements import _items_txn
+        with pytest.raises(RuntimeError):
+            with _items_txn(workspace):
+                req_add(workspace, "requirement", "Dropped")
+                raise RuntimeError("boom")
+        assert _load_items(workspace) == []
+        req_add(workspace, "requirement", "Kept")
+        assert [i["id"] for i in _load_items(workspace)] == ["REQ-001"]
+
+
 class TestReqListFilterParent:
     """L372-373: filter_parent in req_list."""
 
@@ -734,3 +767,264 @@ class TestTraceStaleReference:
         capsys.readouterr()
         rc = req_trace(workspace, "REQ-002")
         assert rc == 0
+
+
+class TestItemsCache:
+    """Parsed CSV is reused until the file changes."""
+
+    def test_reload_reuses_parsed_items(self, workspace: Path):
+        req_add(workspace, "requirement", "R1")
+        first = _load_items(workspace)
+        with patch("fcontext.requirements.csv.reader") as reader:
+            assert _load_items(workspace) == first
+        reader.assert_not_called()
+
+    def test_callers_get_their_own_copy(self, workspace: Path):
+        req_add(workspace, "requirement", "R1")
+        items = _load_items(workspace)
+        items[0]["status"] = "done"
+        items.append(dict(items[0], id="REQ-002"))
+        assert [(i["id"], i["status"]) for i in _load_items(workspace)] == [("REQ-001", "draft")]
+
+    def test_failed_save_leaves_cache_untouched(self, workspace: Path):
+        req_add(workspace, "requirement", "R1")
+        with patch("fcontext.requirements.os.replace", side_effect=OSError("disk full")):
+            with pytest.raises(OSError):
+                req_add(workspace, "requirement", "R2")
+        assert [i["id"] for i in _load_items(workspace)] == ["REQ-001"]
+
+    def test_saved_list_changed_later_leaves_cache_untouched(self, workspace: Path):
+        from fcontext.requirements import _save_items
+        req_add(workspace, "requirement", "R1")
+        items = _load_items(workspace)
+        _save_items(workspace, items)
+        items[0]["title"] = "Unsaved"
+        assert _load_items(workspace)[0]["title"] == "R1"
+
+    def test_save_refreshes_cache(self, workspace: Path):
+        req_add(workspace, "requirement", "R1")
+        req_set(workspace, "REQ-001", "status", "active")
+        with patch("fcontext.requirements.csv.reader") as reader:
+            assert _load_items(workspace)[0]["status"] == "active"
+        reader.assert_not_called()
+
+    def test_external_edit_invalidates(self, workspace: Path):
+        req_add(workspace, "requirement", "R1")
+        _load_items(workspace)
+        csv = _csv_path(workspace)
+        csv.write_text(csv.read_text().replace("R1", "Renamed"), encoding="utf-8")
+        assert _load_items(workspace)[0]["title"] == "Renamed"
+
+
+class TestBuildIndex:
+
+    def test_first_row_wins(self):
+        from fcontext.requirements import _build_index
+        items = [{"id": "REQ-001", "title": "first"}, {"id": "REQ-001", "title": "dup"}]
+        by_id = _build_index(items)
+        assert by_id["REQ-001"]["title"] == "first"
+        assert by_id["REQ-001"] is _find_item(items, "Req-001")
+
+    def test_load_canonicalizes_ids(self, workspace: Path, capsys):
+        _csv_path(workspace).write_text(
+            "id,type,title,status,priority,parent\n"
+            "epic-001,epic,E,draft,P2,\n"
+            "req-001,requirement,R,draft,P2,epic-001\n",
+            encoding="utf-8",
+        )
+        items = _load_items(workspace)
+        assert [(i["id"], i["parent"]) for i in items] == [("EPIC-001", ""), ("REQ-001", "EPIC-001")]
+        req_tree(workspace)
+        req_list(workspace, filter_parent="Epic-001")
+        out = capsys.readouterr().out
+        assert "    └── ○ REQ-001" in out
+        assert "Total: 1 items" in out
+
+    def test_set_parent_stores_canonical_id(self, workspace: Path):
+        req_add(workspace, "epic", "E")
+        req_add(workspace, "requirement", "R")
+        assert req_set(workspace, "req-001", "parent", "epic-001") == 0
+        assert _find_item(_load_items(workspace), "REQ-001")["parent"] == "EPIC-001"
+
+    def test_show_lists_reverse_links_and_children(self, workspace: Path, capsys):
+        req_add(workspace, "epic", "E")
+        req_add(workspace, "requirement", "Child", parent="EPIC-001")
+        req_add(workspace, "epic", "Other", links="relates:epic-001")
+        capsys.readouterr()
+        assert req_show(workspace, "epic-001") == 0
+        out = capsys.readouterr().out
+        assert "EPIC-002 relates → this" in out
+        assert "Children (1):" in out
+
+
+class TestCsvRows:
+
+    def test_short_and_blank_rows(self, workspace: Path):
+        _csv_path(workspace).write_text(
+            "id,type,title,status,priority,parent\n"
+            "\n"
+            "REQ-001,requirement,Old row,draft,P2\n",
+            encoding="utf-8",
+        )
+        items = _load_items(workspace)
+        assert len(items) == 1
+        assert items[0]["parent"] == ""
+        assert "links" not in items[0]
+
+    def test_save_fills_missing_columns(self, workspace: Path):
+        from fcontext.requirements import CSV_COLUMNS, _save_items
+        _save_items(workspace, [{"id": "REQ-001", "title": "T"}])
+        lines = _csv_path(workspace).read_text(encoding="utf-8").splitlines()
+        assert lines[0] == ",".join(CSV_COLUMNS)
+        assert lines[1] == "REQ-001,,T" + "," * (len(CSV_COLUMNS) - 3)
+
+    def test_empty_file(self, workspace: Path):
+        _csv_path(workspace).write_text("", encoding="utf-8")
+        assert _load_items(workspace) == []
+
+
+class TestAtomicSave:
+
+    def test_replaces_without_leaving_tmp(self, workspace: Path):
+        from fcontext.requirements import _save_items
+        _save_items(workspace, [{"id": "REQ-001", "title": "T"}])
+        csv = _csv_path(workspace)
+        assert not csv.with_suffix(".csv.tmp").exists()
+        assert "REQ-001" in csv.read_text(encoding="utf-8")
+
+    def test_failed_write_keeps_old_file(self, workspace: Path):
+        from fcontext.requirements import _save_items
+        req_add(workspace, "epic", "Keep me")
+        before = _csv_path(workspace).read_text(encoding="utf-8")
+        with patch("fcontext.requirements.csv.writer", side_effect=RuntimeError("disk")):
+            with pytest.raises(RuntimeError):
+                _save_items(workspace, [])
+        assert _csv_path(workspace).read_text(encoding="utf-8") == before
+
+    def test_fsync_only_when_requested(self, workspace: Path, monkeypatch):
+        from fcontext.requirements import _save_items
+        with patch("fcontext.requirements.os.fsync") as fsync:
+            _save_items(workspace, [])
+            fsync.assert_not_called()
+            monkeypatch.setenv("FCONTEXT_FSYNC", "1")
+            _save_items(workspace, [])
+            fsync.assert_called_once()
+
+
+class TestItemsTxn:
+
+    def test_single_save_for_many_commands(self, workspace: Path):
+        from fcontext.requirements import _items_txn
+        with patch("fcontext.requirements.csv.writer", wraps=__import__("csv").writer) as writer:
+            with _items_txn(workspace) as items:
+                req_add(workspace, "epic", "E")
+                req_add(workspace, "story", "S", parent="EPIC-001")
+                req_set(workspace, "STORY-001", "status", "active")
+                assert len(items) == 2
+        writer.assert_called_once()
+        assert [i["id"] for i in _load_items(workspace)] == ["EPIC-001", "STORY-001"]
+
+    def test_nested_and_clean_txn(self, workspace: Path):
+        from fcontext.requirements import _items_txn
+        req_add(workspace, "requirement", "R1")
+        with patch("fcontext.requirements.csv.writer") as writer:
+            with _items_txn(workspace) as outer:
+                with _items_txn(workspace) as inner:
+                    assert inner is outer
+                req_show(workspace, "REQ-001")
+        writer.assert_not_called()
+
+    def test_exception_discards_changes(self, workspace: Path):
+        from fcontext.requirements import _items_txn
+        try:
+            with _items_txn(workspace):
+                req_add(workspace, "requirement", "R1")
+                raise RuntimeError("boom")
+        except RuntimeError:
+            pass
+        assert "REQ-001" not in _csv_path(workspace).read_text(encoding="utf-8")
+
+    def test_doc_appends_held_until_exit(self, workspace: Path):
+        from fcontext.requirements import _items_txn
+        req_add(workspace, "requirement", "R1")
+        doc = _docs_dir(workspace) / "REQ-001.md"
+        before = doc.read_text(encoding="utf-8")
+        with _items_txn(workspace):
+            req_comment(workspace, "REQ-001", "first")
+            req_set(workspace, "REQ-001", "status", "active")
+            assert doc.read_text(encoding="utf-8") == before
+        text = doc.read_text(encoding="utf-8")
+        assert text.index("first") < text.index("`draft` → `active`")
+
+    def test_large_appends_flush_early(self, workspace: Path):
+        from fcontext.requirements import _items_txn, _PENDING_APPENDS
+        req_add(workspace, "requirement", "R1")
+        doc = _docs_dir(workspace) / "REQ-001.md"
+        with _items_txn(workspace):
+            req_comment(workspace, "REQ-001", "x" * 70000)
+            assert "x" * 70000 in doc.read_text(encoding="utf-8")
+            assert not _PENDING_APPENDS
+
+    def test_exception_discards_doc_appends(self, workspace: Path):
+        from fcontext.requirements import _items_txn, _PENDING_APPENDS
+        req_add(workspace, "requirement", "R1")
+        with pytest.raises(RuntimeError):
+            with _items_txn(workspace):
+                req_comment(workspace, "REQ-001", "lost")
+                raise RuntimeError("boom")
+        assert not _PENDING_APPENDS
+        assert "lost" not in (_docs_dir(workspace) / "REQ-001.md").read_text(encoding="utf-8")
+
+
+class TestReqBatch:
+
+    def test_batch_runs_ops(self, workspace: Path, capsys):
+        from fcontext.requirements import req_batch
+        rc = req_batch(workspace, [
+            {"action": "add", "item_type": "requirement", "title": "R1"},
+            {"action": "add", "item_type": "requirement", "title": "R2"},
+            {"action": "link", "item_id": "REQ-002", "link_type": "evolves", "target_id": "REQ-001"},
+            {"action": "set", "item_id": "REQ-001", "field": "status", "value": "done"},
+            {"action": "comment", "item_id": "REQ-002", "comment_text": "note"},
+        ])
+        assert rc == 0
+        assert "batch: 5/5 operations applied" in capsys.readouterr().out
+        items = {i["id"]: i for i in _load_items(workspace)}
+        assert items["REQ-001"]["status"] == "done"
+        assert items["REQ-002"]["links"] == "evolves:REQ-001"
+
+    def test_batch_stops_at_failure_keeping_earlier(self, workspace: Path, capsys):
+        from fcontext.requirements import req_batch
+        rc = req_batch(workspace, [
+            {"action": "add", "item_type": "requirement", "title": "R1"},
+            {"action": "set", "item_id": "REQ-404", "field": "status", "value": "done"},
+            {"action": "add", "item_type": "requirement", "title": "never"},
+        ])
+        assert rc == 1
+        assert "batch: 1/3 operations applied" in capsys.readouterr().out
+        assert [i["title"] for i in _load_items(workspace)] == ["R1"]
+
+    def test_batch_validates_before_running(self, workspace: Path, capsys):
+        from fcontext.requirements import req_batch
+        for ops, msg in [
+            (["add"], "is not an object"),
+            ([{"action": "show", "item_id": "X"}], "unknown action 'show'"),
+            ([{"action": "add", "title": "no type"}], "operation 2 (add)"),
+            ([{"action": "set", "item_id": 1, "field": "title", "value": "x"}],
+             "operation 2 (set): 'item_id' must be a string"),
+            ([{"action": "add", "item_type": "task", "title": "T", "parent": 5}],
+             "'parent' must be a string"),
+        ]:
+            assert req_batch(workspace, [{"action": "add", "item_type": "task", "title": "T"}] + ops) == 1
+            assert msg in capsys.readouterr().err
+        assert _load_items(workspace) == []
+        assert not (_docs_dir(workspace) / "TASK-001.md").exists()
+
+    def test_batch_file_errors(self, workspace: Path, capsys):
+        from fcontext.requirements import req_batch_file
+        assert req_batch_file(workspace, str(workspace / "missing.json")) == 1
+        assert "cannot read batch file" in capsys.readouterr().err
+        bad = workspace / "obj.json"
+        bad.write_text('{"action": "add"}')
+        assert req_batch_file(workspace, str(bad)) == 1
+        assert "JSON array" in capsys.readouterr().err